@@ -0,0 +1,77 @@
+"""
+Benchmark del Board: motor de conteos (`array('b')`) vs. la versión histórica de listas de strings.
+
+La referencia es la clase Board original (copia textual en benchmarks/board_listas.py),
+no una reimplementación. Las dos versiones se alternan dentro de cada repetición y se
+toma el mínimo, para que la carga de la máquina afecte a ambas por igual.
+
+Uso:
+    python -m benchmarks.bench_board [--repeticiones N]
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import sys
+import timeit
+from typing import Callable, Dict, List
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from benchmarks.board_listas import Board as TableroListas  # noqa: E402
+from core.board import Board  # noqa: E402
+
+
+def _ida_y_vuelta(tablero) -> None:
+    """Par de movimientos que deja el tablero como estaba (sin capturas)."""
+    tablero.mover_ficha(0, 3)
+    tablero.mover_ficha(3, 0)
+
+
+def _casos(tablero) -> Dict[str, Callable[[], object]]:
+    return {
+        "clone": tablero.clone,
+        "mover (x2)": lambda: _ida_y_vuelta(tablero),
+        "points_snapshot": tablero.points_snapshot,
+        "total_checkers": tablero.total_checkers,
+    }
+
+
+def medir(repeticiones: int, repetir: int = 15) -> Dict[str, Dict[str, float]]:
+    """
+    Operaciones/segundo por caso para cada implementación: en cada una de las `repetir`
+    rondas se mide una vez cada versión, alternadas, y se queda el mejor tiempo.
+    """
+    tableros = {"listas": TableroListas(), "conteos": Board()}
+    casos = {nombre: _casos(tablero) for nombre, tablero in tableros.items()}
+    mejores: Dict[str, Dict[str, float]] = {nombre: {} for nombre in tableros}
+    for caso in casos["listas"]:
+        for _ in range(repetir):
+            for nombre in tableros:
+                segundos = timeit.timeit(casos[nombre][caso], number=repeticiones)
+                previo = mejores[nombre].get(caso, segundos)
+                mejores[nombre][caso] = min(previo, segundos)
+    return {
+        nombre: {caso: repeticiones / s for caso, s in tiempos.items()}
+        for nombre, tiempos in mejores.items()
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Board: conteos vs listas")
+    parser.add_argument("--repeticiones", type=int, default=20_000)
+    parser.add_argument("--repetir", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    res = medir(args.repeticiones, args.repetir)
+    print(f"{'caso':<18}{'listas op/s':>16}{'conteos op/s':>16}{'mejora':>10}")
+    for caso in res["listas"]:
+        viejo, nuevo = res["listas"][caso], res["conteos"][caso]
+        print(f"{caso:<18}{viejo:>16,.0f}{nuevo:>16,.0f}{nuevo / viejo:>9.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+"""
+Benchmark de EstadoJuego en la fase de bearoff: resumen de casa cacheado vs. recorrido.
+
+Mide lo que hace la UI en cada clic (`puede_mover` para todos los puntos y dados) y la
+generación de jugadas completas (`cli.jugadas.generar_jugadas`, sin la caché de
+jugadas), sobre una posición de bearoff con todas las fichas en los puntos bajos: cada
+consulta de casa recorre los 18 puntos de afuera y el punto más lejano está a 4 de 6.
+Las dos versiones se alternan dentro de cada repetición; la mejora es la mediana por ronda.
+
+Uso:
+    python -m benchmarks.bench_estado [--repeticiones N] [--repetir R]
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import statistics
+import sys
+import timeit
+from typing import Callable, Dict, List, Optional
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from cli.jugadas import generar_jugadas  # noqa: E402
+from cli.state import EstadoJuego, Turno  # noqa: E402
+
+
+class EstadoRecorrido(EstadoJuego):
+    """EstadoJuego con las consultas de casa anteriores (recorren 18 y 6 puntos) como referencia."""
+
+    def __todos_en_casa__(self, jugador: Turno) -> bool:
+        puntos_fuera = (range(7, 25) if jugador == "BLANCAS" else range(1, 19))
+        arreglo = self.__blancas__ if jugador == "BLANCAS" else self.__negras__
+        for p in puntos_fuera:
+            if arreglo[p] > 0:
+                return False
+        return True
+
+    def __punto_mas_lejano_en_casa__(self, jugador: Turno) -> Optional[int]:
+        puntos = (range(6, 0, -1) if jugador == "BLANCAS" else range(19, 25))
+        arreglo = self.__blancas__ if jugador == "BLANCAS" else self.__negras__
+        for p in puntos:
+            if arreglo[p] > 0:
+                return p
+        return None
+
+
+def posicion_bearoff(cls=EstadoJuego) -> EstadoJuego:
+    """
+    Ambos jugadores con 12 fichas en los puntos 1..3 de su casa y 3 ya borneadas; tiran
+    6-5, así todo borneo pasa por el punto más lejano en casa.
+    """
+    estado = cls()
+    for punto, n in ((1, 4), (2, 4), (3, 4)):
+        estado.__blancas__[punto] = n
+        estado.__negras__[25 - punto] = n
+    estado.__fuera_blancas__ = estado.__fuera_negras__ = 3
+    estado.recalcular_derivados()
+    estado.set_dados(6, 5)
+    return estado
+
+
+def _todos_los_clics(estado: EstadoJuego) -> None:
+    """Lo que consulta la UI al resaltar destinos: cada punto con cada dado pendiente."""
+    for desde in range(1, 25):
+        for pasos in (6, 5):
+            estado.puede_mover(desde, pasos)
+
+
+def _casos(estado: EstadoJuego) -> Dict[str, Callable[[], object]]:
+    return {
+        "puede_mover x48": lambda: _todos_los_clics(estado),
+        # Directo al generador: jugadas_legales pasa por la caché de jugadas y sólo
+        # mediría aciertos sobre la misma posición
+        "generar_jugadas": lambda: generar_jugadas(estado),
+    }
+
+
+def medir(repeticiones: int, repetir: int = 15) -> Dict[str, Dict[str, float]]:
+    """
+    Por caso: mejor op/s de cada implementación y mediana de la mejora por ronda. En cada
+    una de las `repetir` rondas se mide una vez cada versión, una detrás de la otra, así
+    la mejora compara tiempos tomados con la misma carga de la máquina.
+    """
+    clases = {"recorrido": EstadoRecorrido, "cacheado": EstadoJuego}
+    casos = {nombre: _casos(posicion_bearoff(cls)) for nombre, cls in clases.items()}
+    resultados: Dict[str, Dict[str, float]] = {nombre: {} for nombre in clases}
+    resultados["mejora"] = {}
+    for caso in casos["recorrido"]:
+        tiempos: Dict[str, List[float]] = {nombre: [] for nombre in clases}
+        for _ in range(repetir):
+            for nombre in clases:
+                tiempos[nombre].append(timeit.timeit(casos[nombre][caso], number=repeticiones))
+        for nombre in clases:
+            resultados[nombre][caso] = repeticiones / min(tiempos[nombre])
+        resultados["mejora"][caso] = statistics.median(
+            viejo / nuevo for viejo, nuevo in zip(tiempos["recorrido"], tiempos["cacheado"])
+        )
+    return resultados
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark EstadoJuego en bearoff: cacheado vs recorrido"
+    )
+    parser.add_argument("--repeticiones", type=int, default=2_000)
+    parser.add_argument("--repetir", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    res = medir(args.repeticiones, args.repetir)
+    print(f"{'caso':<18}{'recorrido op/s':>16}{'cacheado op/s':>16}{'mejora':>10}")
+    for caso in res["recorrido"]:
+        viejo, nuevo = res["recorrido"][caso], res["cacheado"][caso]
+        print(f"{caso:<18}{viejo:>16,.0f}{nuevo:>16,.0f}{res['mejora'][caso]:>9.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
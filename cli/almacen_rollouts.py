@@ -0,0 +1,379 @@
+"""
+Almacén en disco de resultados de rollouts, indexado por Position ID (10 bytes).
+
+Cada posición guarda pruebas, muestras, equidad media, suma de cuadrados (varianza),
+conteos por resultado, tiempo y los parámetros del rollout (estrategia, semilla,
+antitéticos, estratificación). Al volver a hacer el rollout de una posición
+guardada se continúa con las muestras siguientes y se une con `cli.rollout.combinar`.
+El Position ID es el de quien tiene el turno, así que una posición y su espejo con
+el otro color en turno comparten la entrada.
+
+Archivo (little-endian): cabecera b"BGRO1\\0\\0\\0", uint32 capacidad (potencia de 2),
+uint32 0, uint64 ocupadas; luego 'capacidad' registros de tamaño fijo. Es una tabla
+hash de direccionamiento abierto (sondeo lineal sobre blake2b de la clave) mapeada
+en memoria: buscar y guardar son O(1). Al superar la mitad de ocupación el escritor
+la reconstruye con el doble de capacidad en un archivo nuevo y lo reemplaza.
+
+Un escritor y muchos lectores: el escritor toma un flock exclusivo (sin fcntl, por
+ejemplo en Windows, no se verifica) y cada registro lleva un contador de secuencia
+impar mientras se escribe; los lectores reintentan (cediendo el procesador) si lo
+ven impar o cambiado y reabren el archivo si el escritor lo reemplazó. Si la
+secuencia sigue impar tras REINTENTOS_LECTURA (un escritor murió a mitad de
+escritura) el registro se trata como ilegible: los lectores lo saltean y el
+escritor, que tiene el lock, lo marca como descartado (el sondeo sigue de largo).
+
+Uso:
+    python -m cli.rollout --almacen rollouts.bin --pruebas 1296
+"""
+
+from __future__ import annotations
+import hashlib
+import mmap
+import os
+import struct
+import time
+from typing import Any, Iterator, Optional, Tuple
+
+try:  # flock sólo existe en Unix
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+from cli.rollout import ResultadoRollout, combinar, compatibles, rollout
+from cli.state import EstadoJuego
+from core import position_id
+
+MAGIA = b"BGRO1\0\0\0"
+_CABECERA = struct.Struct("<8sIIQ")
+# secuencia, ocupado, clave, antitetica, estratificada, seed, pruebas, muestras,
+# media, m2, segundos, conteos -3..3, estrategia
+_REGISTRO = struct.Struct("<IB10s??qQQddd7Q32s")
+_SECUENCIA = struct.Struct("<I")
+# Valores del byte 'ocupado'
+LIBRE, OCUPADO, DESCARTADO = 0, 1, 2
+REINTENTOS_LECTURA = 1000
+CAPACIDAD_INICIAL = 1024
+RUTA_POR_DEFECTO = os.environ.get("BACKGAMMON_ROLLOUTS_DB", "rollouts.bin")
+
+
+def clave_de(origen: Any) -> bytes:
+    """
+    Position ID binario (vista de quien tiene el turno) de un EstadoJuego, un Game,
+    un Position ID en texto o la clave de 10 bytes.
+    Parámetros: origen (EstadoJuego|Game|str|bytes)
+    Retorna: bytes
+    """
+    if isinstance(origen, (bytes, bytearray)):
+        if len(origen) != position_id.LARGO_BYTES:
+            raise ValueError(f"La clave debe tener {position_id.LARGO_BYTES} bytes.")
+        return bytes(origen)
+    if isinstance(origen, str):
+        return position_id.desde_texto(origen)
+    if hasattr(origen, "jugador_actual") and hasattr(origen, "board"):
+        # pylint: disable=import-outside-toplevel
+        from cli.busqueda import estado_desde_game
+
+        origen = estado_desde_game(origen)
+    return origen.clave_posicion()
+
+
+def _hash(clave: bytes) -> int:
+    """Hash estable entre procesos (hash() de Python cambia por proceso)."""
+    return int.from_bytes(hashlib.blake2b(clave, digest_size=8).digest(), "little")
+
+
+def _a_registro(secuencia: int, clave: bytes, res: ResultadoRollout) -> bytes:
+    config = res.configuracion
+    estrategia = str(config.get("estrategia", "")).encode("utf-8")
+    if len(estrategia) > 32:
+        raise ValueError("El nombre de la estrategia no entra en 32 bytes.")
+    return _REGISTRO.pack(
+        secuencia,
+        OCUPADO,
+        clave,
+        bool(config.get("antitetica", True)),
+        bool(config.get("estratificada", True)),
+        int(config.get("seed", 0)),
+        res.pruebas,
+        res.muestras,
+        res.equidad,
+        res.varianza * max(res.muestras - 1, 0),
+        res.segundos,
+        *(res.conteos.get(p, 0) for p in range(-3, 4)),
+        estrategia,
+    )
+
+
+def _desde_registro(campos: tuple) -> Tuple[bytes, ResultadoRollout]:
+    (_, _, clave, antitetica, estratificada, seed, pruebas, muestras, media, m2,
+     segundos, *resto) = campos
+    *conteos, estrategia = resto
+    por_puntos = {p: n for p, n in zip(range(-3, 4), conteos) if n}
+    n = max(pruebas, 1)
+
+    def tasa(*valores: int) -> float:
+        return sum(por_puntos.get(v, 0) for v in valores) / n
+
+    return clave, ResultadoRollout(
+        pruebas=pruebas,
+        muestras=muestras,
+        equidad=media,
+        varianza=m2 / (muestras - 1) if muestras > 1 else 0.0,
+        ganadas=tasa(1, 2, 3),
+        gammons=tasa(2, 3),
+        backgammons=tasa(3),
+        gammons_contra=tasa(-2, -3),
+        backgammons_contra=tasa(-3),
+        segundos=segundos,
+        configuracion={
+            "estrategia": estrategia.rstrip(b"\0").decode("utf-8"),
+            "seed": seed,
+            "antitetica": antitetica,
+            "estratificada": estratificada,
+        },
+        conteos=por_puntos,
+    )
+
+
+def _crear(ruta: str, capacidad: int) -> None:
+    """Escribe un almacén vacío (vía archivo temporal + os.replace)."""
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(_CABECERA.pack(MAGIA, capacidad, 0, 0))
+        archivo.truncate(_CABECERA.size + capacidad * _REGISTRO.size)
+    os.replace(temporal, ruta)
+
+
+class AlmacenRollouts:
+    """
+    Tabla hash en disco Position ID -> ResultadoRollout.
+
+    Atributos (todos dunder):
+      __ruta__ (str), __escritura__ (bool)
+      __archivo__, __mapa__ (mmap.mmap): archivo abierto y su mapeo.
+      __capacidad__ (int): registros de la tabla (potencia de 2).
+      __inodo__ (int): para detectar que el escritor reemplazó el archivo.
+    """
+
+    def __init__(self, ruta: Optional[str] = None, escritura: bool = False) -> None:
+        """
+        Abre el almacén (por defecto BACKGAMMON_ROLLOUTS_DB o rollouts.bin). En modo
+        escritura lo crea si no existe y toma el lock de escritor único.
+        Parámetros: ruta (str|None), escritura (bool)
+        """
+        self.__ruta__ = ruta or RUTA_POR_DEFECTO
+        self.__escritura__ = escritura
+        if escritura and not os.path.exists(self.__ruta__):
+            _crear(self.__ruta__, CAPACIDAD_INICIAL)
+        self.__abrir__()
+
+    def __abrir__(self) -> None:
+        modo = "r+b" if self.__escritura__ else "rb"
+        self.__archivo__ = open(self.__ruta__, modo)  # pylint: disable=consider-using-with
+        try:
+            if self.__escritura__ and fcntl is not None:
+                try:
+                    fcntl.flock(self.__archivo__, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError as exc:
+                    raise RuntimeError(f"{self.__ruta__} ya tiene un escritor.") from exc
+            acceso = mmap.ACCESS_WRITE if self.__escritura__ else mmap.ACCESS_READ
+            self.__mapa__ = mmap.mmap(self.__archivo__.fileno(), 0, access=acceso)
+            if len(self.__mapa__) < _CABECERA.size:
+                raise ValueError(f"{self.__ruta__} no es un almacén de rollouts válido.")
+            magia, capacidad, _, _ = _CABECERA.unpack_from(self.__mapa__, 0)
+            if magia != MAGIA or not capacidad or capacidad & (capacidad - 1):
+                raise ValueError(f"{self.__ruta__} no es un almacén de rollouts válido.")
+            if len(self.__mapa__) != _CABECERA.size + capacidad * _REGISTRO.size:
+                raise ValueError(f"{self.__ruta__} está truncado.")
+        except Exception:
+            self.__archivo__.close()
+            raise
+        self.__capacidad__ = capacidad
+        self.__inodo__ = os.fstat(self.__archivo__.fileno()).st_ino
+
+    def __enter__(self) -> "AlmacenRollouts":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    def cerrar(self) -> None:
+        """Libera el mapeo, el archivo y (si es escritor) el lock."""
+        self.__mapa__.close()
+        self.__archivo__.close()
+
+    def __len__(self) -> int:
+        return _CABECERA.unpack_from(self.__mapa__, 0)[3]
+
+    @property
+    def capacidad(self) -> int:
+        return self.__capacidad__
+
+    def __offset__(self, indice: int) -> int:
+        return _CABECERA.size + indice * _REGISTRO.size
+
+    def __leer__(self, indice: int) -> Optional[tuple]:
+        """
+        Registro consistente (reintenta mientras el escritor lo está modificando), o
+        None si sigue a medio escribir tras REINTENTOS_LECTURA intentos.
+        """
+        offset = self.__offset__(indice)
+        for _ in range(REINTENTOS_LECTURA):
+            antes = _SECUENCIA.unpack_from(self.__mapa__, offset)[0]
+            campos = _REGISTRO.unpack_from(self.__mapa__, offset)
+            if not antes & 1 and _SECUENCIA.unpack_from(self.__mapa__, offset)[0] == antes:
+                return campos
+            time.sleep(0)
+        return None
+
+    def __descartar__(self, indice: int) -> None:
+        """Escritor: marca como descartado un registro que quedó a medio escribir."""
+        offset = self.__offset__(indice)
+        secuencia = _SECUENCIA.unpack_from(self.__mapa__, offset)[0]
+        self.__mapa__[offset + _SECUENCIA.size] = DESCARTADO
+        _SECUENCIA.pack_into(self.__mapa__, offset, secuencia + 1 if secuencia & 1 else secuencia)
+
+    def __ubicar__(self, clave: bytes) -> Tuple[int, Optional[tuple]]:
+        """Índice del registro de 'clave' (o del primer libre) y sus campos si existe."""
+        mascara = self.__capacidad__ - 1
+        indice = _hash(clave) & mascara
+        while True:
+            campos = self.__leer__(indice)
+            if campos is None:
+                if self.__escritura__:
+                    self.__descartar__(indice)
+            elif campos[1] == LIBRE:
+                return indice, None
+            elif campos[1] == OCUPADO and campos[2] == clave:
+                return indice, campos
+            indice = (indice + 1) & mascara
+
+    def buscar(self, origen: Any) -> Optional[ResultadoRollout]:
+        """
+        Resultado guardado de una posición, o None.
+        Parámetros: origen (EstadoJuego|Game|str|bytes), ver clave_de()
+        Retorna: Optional[ResultadoRollout]
+        """
+        clave = clave_de(origen)
+        _, campos = self.__ubicar__(clave)
+        if campos is None and not self.__escritura__ and self.__reemplazado__():
+            self.cerrar()
+            self.__abrir__()
+            _, campos = self.__ubicar__(clave)
+        return None if campos is None else _desde_registro(campos)[1]
+
+    def __reemplazado__(self) -> bool:
+        try:
+            return os.stat(self.__ruta__).st_ino != self.__inodo__
+        except FileNotFoundError:
+            return False
+
+    def items(self) -> Iterator[Tuple[bytes, ResultadoRollout]]:
+        """Recorre (clave, resultado) de todas las posiciones guardadas."""
+        for indice in range(self.__capacidad__):
+            campos = self.__leer__(indice)
+            if campos is not None and campos[1] == OCUPADO:
+                yield _desde_registro(campos)
+
+    def guardar(self, origen: Any, resultado: ResultadoRollout) -> ResultadoRollout:
+        """
+        Suma 'resultado' (muestras nuevas) a lo guardado para la posición con
+        combinar(). Si lo guardado usó otros parámetros (ver COMPATIBLES) se queda el
+        resultado con más pruebas.
+        Parámetros: origen (EstadoJuego|Game|str|bytes), resultado (ResultadoRollout)
+        Retorna: ResultadoRollout guardado (igual al que devuelve buscar())
+        """
+        if not self.__escritura__:
+            raise RuntimeError("El almacén está abierto sólo para lectura.")
+        clave = clave_de(origen)
+        indice, campos = self.__ubicar__(clave)
+        if campos is None:
+            total = resultado
+        else:
+            guardado = _desde_registro(campos)[1]
+            if compatibles(guardado.configuracion, resultado.configuracion):
+                total = combinar(guardado, resultado)
+            else:
+                total = resultado if resultado.pruebas > guardado.pruebas else guardado
+        self.__escribir__(indice, clave, total, nuevo=campos is None)
+        if campos is None and 2 * len(self) > self.__capacidad__:
+            self.__crecer__()
+        return self.buscar(clave)
+
+    def __escribir__(self, indice: int, clave: bytes, res: ResultadoRollout, nuevo: bool) -> None:
+        """Escribe un registro con el protocolo de secuencia (impar mientras escribe)."""
+        offset = self.__offset__(indice)
+        secuencia = _SECUENCIA.unpack_from(self.__mapa__, offset)[0]
+        datos = _a_registro(secuencia + 2, clave, res)
+        _SECUENCIA.pack_into(self.__mapa__, offset, secuencia + 1)
+        self.__mapa__[offset + _SECUENCIA.size:offset + _REGISTRO.size] = datos[_SECUENCIA.size:]
+        _SECUENCIA.pack_into(self.__mapa__, offset, secuencia + 2)
+        if nuevo:
+            magia, capacidad, reservado, ocupadas = _CABECERA.unpack_from(self.__mapa__, 0)
+            _CABECERA.pack_into(self.__mapa__, 0, magia, capacidad, reservado, ocupadas + 1)
+
+    def __crecer__(self) -> None:
+        """Reconstruye la tabla con el doble de capacidad y reemplaza el archivo."""
+        entradas = list(self.items())
+        _crear(self.__ruta__ + ".nuevo", 2 * self.__capacidad__)
+        nuevo = AlmacenRollouts.__new__(AlmacenRollouts)
+        nuevo.__ruta__, nuevo.__escritura__ = self.__ruta__ + ".nuevo", True
+        nuevo.__abrir__()
+        for clave, res in entradas:
+            indice, _ = nuevo.__ubicar__(clave)
+            nuevo.__escribir__(indice, clave, res, nuevo=True)
+        nuevo.__mapa__.flush()
+        # El lock pasa al archivo nuevo antes de soltar el viejo
+        os.replace(nuevo.__ruta__, self.__ruta__)
+        self.cerrar()
+        self.__archivo__, self.__mapa__ = nuevo.__archivo__, nuevo.__mapa__
+        self.__capacidad__, self.__inodo__ = nuevo.__capacidad__, nuevo.__inodo__
+
+    def flush(self) -> None:
+        """Baja a disco las escrituras pendientes del mapeo."""
+        self.__mapa__.flush()
+
+
+def rollout_almacenado(
+    origen: Any, almacen: AlmacenRollouts, pruebas: int = 1296, **opciones: Any
+) -> ResultadoRollout:
+    """
+    Rollout de un EstadoJuego o Game pasando por el almacén: si lo guardado ya tiene
+    'pruebas' partidas (o alcanza el 'ancho' pedido) se devuelve sin jugar; si no, se
+    juegan sólo las que faltan a continuación de lo guardado y se suman.
+    Parámetros:
+      origen (EstadoJuego|Game), almacen (AlmacenRollouts) abierto para escritura
+      pruebas (int): total deseado para la posición.
+      opciones: las de cli.rollout.rollout (estrategia, seed, workers, ancho, ...).
+    Retorna: ResultadoRollout con el total acumulado
+    """
+    if hasattr(origen, "jugador_actual") and hasattr(origen, "board"):
+        # pylint: disable=import-outside-toplevel
+        from cli.busqueda import estado_desde_game
+
+        origen = estado_desde_game(origen)
+    if not isinstance(origen, EstadoJuego):
+        raise ValueError("Se espera un EstadoJuego o un Game.")
+    previo = almacen.buscar(origen)
+    config = {
+        "estrategia": opciones.get("estrategia", "golosa"),
+        "seed": opciones.get("seed", 0),
+        "antitetica": opciones.get("antitetica", True),
+        "estratificada": opciones.get("estratificada", True),
+    }
+    if previo is not None and not compatibles(previo.configuracion, config):
+        previo = None
+    if previo is not None:
+        ancho = opciones.get("ancho")
+        if previo.pruebas >= pruebas:
+            return previo
+        if ancho is not None and previo.muestras > 1:
+            bajo, alto = previo.intervalo(opciones.get("confianza", 0.95))
+            if alto - bajo <= ancho:
+                return previo
+        pruebas -= previo.pruebas
+    nuevo = rollout(origen, pruebas=pruebas, previo=previo, **opciones)
+    return almacen.guardar(origen, nuevo)
+
+
+__all__ = ["AlmacenRollouts", "clave_de", "rollout_almacenado"]
@@ -0,0 +1,289 @@
+"""
+Motor de selección de jugadas por expectiminimax sobre las 21 tiradas distintas.
+
+Cada nivel (ply) es una jugada de un bando: el valor de una posición para el
+jugador en turno es el promedio, sobre las 21 tiradas (dobles 1/36, el resto 2/36),
+de la mejor jugada que puede hacer, vista como el negativo del valor para el rival.
+Con profundidad 1 se evalúa estáticamente la posición tras la jugada; con 2 se
+promedian además las respuestas del rival, etc. La poda hacia adelante conserva en
+cada nivel sólo las `top_k` jugadas mejor ordenadas por la evaluación estática.
+
+Valores desde la perspectiva del jugador en turno: ±1, ±2, ±3 en posiciones
+terminales (simple, gammon, backgammon) y la heurística (o el evaluador
+inyectado) en las hojas. Usa `core.transposicion.TablaTransposicion` para no
+reevaluar posiciones repetidas entre ramas (con la clave canónica de core.canonico,
+así una posición y su espejo con el otro color en turno comparten entrada) y `cli.cache_jugadas` para no regenerar
+las jugadas de una misma (posición, tirada).
+"""
+
+from __future__ import annotations
+import math
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from core.board import BARRA as BARRA_BOARD, BLANCO, FUERA, Movimiento, NEGRO
+from core.transposicion import TablaTransposicion
+from cli.cache_jugadas import jugadas_cacheadas
+from cli.simulate import puntos_victoria
+from cli.state import BARRA, EstadoJuego, Jugada
+
+Evaluador = Callable[[EstadoJuego], float]
+
+# (d1, d2, probabilidad) de las 21 tiradas distintas
+TIRADAS: Tuple[Tuple[int, int, float], ...] = tuple(
+    (a, b, (1 if a == b else 2) / 36) for a in range(1, 7) for b in range(a, 7)
+)
+
+
+def pips(estado: EstadoJuego, jugador: str) -> int:
+    """
+    Pip count de 'jugador' (barra = 25), mantenido incrementalmente por el estado.
+    Parámetros: estado (EstadoJuego), jugador (str)
+    Retorna: int
+    """
+    return estado.pips(jugador)
+
+
+def evaluar_heuristica(estado: EstadoJuego) -> float:
+    """
+    Evaluación estática en (-1, 1) para el jugador en turno: carrera de pips,
+    puntos hechos en casa, blots y fichas en la barra.
+    Parámetros: estado (EstadoJuego)
+    Retorna: float
+    """
+    yo, rival = estado.__turno__, estado.__oponente__()
+    if yo == "BLANCAS":
+        mias, suyas = estado.__blancas__, estado.__negras__
+        casa_mia, casa_suya = range(1, 7), range(19, 25)
+        barra_mia, barra_suya = estado.__bar_blancas__, estado.__bar_negras__
+    else:
+        mias, suyas = estado.__negras__, estado.__blancas__
+        casa_mia, casa_suya = range(19, 25), range(1, 7)
+        barra_mia, barra_suya = estado.__bar_negras__, estado.__bar_blancas__
+    carrera = (pips(estado, rival) - pips(estado, yo) + 8) / 40  # +8: ventaja de tener el turno
+    casa = sum(mias[p] >= 2 for p in casa_mia) - sum(suyas[p] >= 2 for p in casa_suya)
+    blots = sum(mias[p] == 1 for p in range(1, 25)) - sum(suyas[p] == 1 for p in range(1, 25))
+    x = carrera + 0.08 * casa - 0.05 * blots + 0.15 * (barra_suya - barra_mia)
+    return math.tanh(x)
+
+
+def _resultado(estado: EstadoJuego) -> Optional[float]:
+    """Valor terminal para el jugador en turno (siempre perdió quien no mueve), o None."""
+    rival = estado.__oponente__()
+    fuera = estado.__fuera_blancas__ if rival == "BLANCAS" else estado.__fuera_negras__
+    if fuera == 15:
+        return -float(puntos_victoria(estado, rival))
+    return None
+
+
+class MotorExpectiminimax:
+    """
+    Elige jugadas para EstadoJuego (y Game vía `elegir_para_game`).
+
+    Atributos (todos dunder):
+      __profundidad__ (int): plies a buscar (1 = evaluación tras la jugada propia).
+      __top_k__ (int|None): jugadas que sobreviven la poda en cada nivel (None = todas).
+      __evaluador__ (Evaluador): valor estático para el jugador en turno.
+      __tabla__ (TablaTransposicion): caché de valores por (clave, profundidad).
+      __nodos__ (int), __evaluaciones__ (int): contadores de la última búsqueda.
+    """
+
+    def __init__(
+        self,
+        profundidad: int = 2,
+        top_k: Optional[int] = 6,
+        evaluador: Optional[Evaluador] = None,
+        tabla: Optional[TablaTransposicion] = None,
+    ) -> None:
+        if profundidad < 1:
+            raise ValueError("La profundidad debe ser al menos 1.")
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k debe ser positivo (o None para no podar).")
+        self.__profundidad__ = profundidad
+        self.__top_k__ = top_k
+        self.__evaluador__ = evaluador or evaluar_heuristica
+        self.__tabla__ = tabla if tabla is not None else TablaTransposicion(capacidad=1 << 16)
+        self.__nodos__ = 0
+        self.__evaluaciones__ = 0
+
+    # ---------------- API pública ----------------
+
+    def evaluar_jugadas(
+        self, estado: EstadoJuego, dados: Optional[Sequence[int]] = None
+    ) -> List[Tuple[Jugada, float]]:
+        """
+        Jugadas candidatas (tras la poda) con su valor, de mejor a peor.
+        'estado' no se modifica (se busca sobre una copia de trabajo).
+        Parámetros: estado (EstadoJuego), dados (Sequence[int]|None): por defecto los pendientes.
+        Retorna: List[Tuple[Jugada, float]]
+        """
+        self.__nodos__ = self.__evaluaciones__ = 0
+        self.__tabla__.nueva_generacion()
+        trabajo = EstadoJuego(__turno__=estado.__turno__)
+        trabajo.cargar_slots(estado.conteos_slots())
+        if dados is None:
+            dados = estado.__movimientos_pendientes__
+        jugadas = jugadas_cacheadas(trabajo, dados, sitio="busqueda_raiz")
+        candidatas = self.__podar__(trabajo, jugadas, self.__profundidad__ - 1)
+        valores = [
+            (jugada, self.__valor_jugada__(trabajo, jugada, self.__profundidad__ - 1))
+            for jugada in candidatas
+        ]
+        valores.sort(key=lambda par: par[1], reverse=True)
+        return valores
+
+    def elegir(self, estado: EstadoJuego, dados: Optional[Sequence[int]] = None) -> Optional[Jugada]:
+        """
+        Mejor jugada para el jugador en turno, o None si no puede mover.
+        Parámetros: estado (EstadoJuego), dados (Sequence[int]|None)
+        Retorna: Optional[Jugada]
+        """
+        valores = self.evaluar_jugadas(estado, dados)
+        return valores[0][0] if valores else None
+
+    def elegir_para_game(self, game) -> List[Movimiento]:
+        """
+        Mejor jugada para `core.game.Game` (jugador_actual y movimientos disponibles),
+        traducida a movimientos de `Board.apply` (origen BARRA, destino FUERA).
+        Parámetros: game (core.game.Game)
+        Retorna: List[Movimiento] (vacía si no puede mover)
+        """
+        estado = estado_desde_game(game)
+        jugada = self.elegir(estado, game.movimientos_disponibles())
+        if jugada is None:
+            return []
+        return jugada_a_movimientos(jugada, game.jugador_actual)
+
+    def estadisticas(self) -> dict:
+        """Nodos y evaluaciones de la última búsqueda más los contadores de la tabla."""
+        return {
+            "nodos": self.__nodos__,
+            "evaluaciones": self.__evaluaciones__,
+            **self.__tabla__.estadisticas(),
+        }
+
+    # ---------------- Búsqueda ----------------
+
+    def __valor_jugada__(self, estado: EstadoJuego, jugada: Jugada, profundidad: int) -> float:
+        """Valor de la jugada para quien la hace (negamax sobre el valor del rival)."""
+        tokens = [estado.aplicar_paso(desde, pasos) for desde, pasos in jugada]
+        estado.cambiar_turno()
+        valor = -self.__valor__(estado, profundidad)
+        estado.cambiar_turno()
+        for token in reversed(tokens):
+            estado.deshacer_paso(token)
+        return valor
+
+    def __valor__(self, estado: EstadoJuego, profundidad: int) -> float:
+        """Valor esperado para el jugador en turno antes de tirar."""
+        terminal = _resultado(estado)
+        if terminal is not None:
+            return terminal
+        if profundidad == 0:
+            self.__evaluaciones__ += 1
+            return self.__evaluador__(estado)
+        guardado = self.__tabla__.buscar(estado.clave_canonica(), None, profundidad)
+        if guardado is not None:
+            return guardado
+        self.__nodos__ += 1
+        total = 0.0
+        for d1, d2, prob in TIRADAS:
+            total += prob * self.__mejor__(estado, (d1, d2), profundidad)
+        self.__tabla__.guardar(estado.clave_canonica(), None, total, profundidad)
+        return total
+
+    def __mejor__(self, estado: EstadoJuego, dados: Tuple[int, int], profundidad: int) -> float:
+        """Valor de la mejor jugada con 'dados' (si no puede mover, pasa el turno)."""
+        jugadas = jugadas_cacheadas(
+            estado, dados if dados[0] != dados[1] else dados * 2, sitio="busqueda"
+        )
+        if not jugadas:
+            estado.cambiar_turno()
+            valor = -self.__valor__(estado, profundidad - 1)
+            estado.cambiar_turno()
+            return valor
+        candidatas = self.__podar__(estado, jugadas, profundidad - 1)
+        return max(self.__valor_jugada__(estado, j, profundidad - 1) for j in candidatas)
+
+    def __podar__(self, estado: EstadoJuego, jugadas: List[Jugada], resto: int) -> List[Jugada]:
+        """Conserva las top_k jugadas por evaluación estática si todavía queda búsqueda."""
+        if resto == 0 or self.__top_k__ is None or len(jugadas) <= self.__top_k__:
+            return jugadas
+        puntuadas = sorted(
+            jugadas, key=lambda j: self.__valor_jugada__(estado, j, 0), reverse=True
+        )
+        return puntuadas[: self.__top_k__]
+
+
+# ---------------- Puente con core.game.Game / core.board.Board ----------------
+
+def estado_desde_game(game) -> EstadoJuego:
+    """
+    EstadoJuego equivalente al Board de un Game (mismos 28 slots), con el turno
+    de game.jugador_actual y sus movimientos disponibles como pendientes.
+    Parámetros: game (core.game.Game)
+    Retorna: EstadoJuego
+    """
+    board = getattr(game.board, "_b", game.board)
+    turno = "BLANCAS" if game.jugador_actual == BLANCO else "NEGRAS"
+    estado = EstadoJuego(__turno__=turno)
+    estado.cargar_slots(list(board.__conteos__))
+    estado.__movimientos_pendientes__ = list(game.movimientos_disponibles())
+    return estado
+
+
+def jugada_a_movimientos(jugada: Jugada, color: str) -> List[Movimiento]:
+    """
+    Traduce pasos de EstadoJuego (punto p -> índice 24 - p) a movimientos de Board.
+    Parámetros: jugada (Jugada), color (BLANCO|NEGRO)
+    Retorna: List[Movimiento]
+    """
+    blancas = color == BLANCO
+    if color not in (BLANCO, NEGRO):
+        raise ValueError(f"Color inválido: {color}")
+    movimientos: List[Movimiento] = []
+    for desde, pasos in jugada:
+        if desde == BARRA:
+            hasta = 25 - pasos if blancas else pasos
+            origen = BARRA_BOARD
+        else:
+            hasta = desde - pasos if blancas else desde + pasos
+            origen = 24 - desde
+        destino = FUERA if not 1 <= hasta <= 24 else 24 - hasta
+        movimientos.append((origen, destino, color))
+    return movimientos
+
+
+def _clave_tras(estado: EstadoJuego, jugada: Jugada) -> int:
+    """Clave Zobrist de la posición a la que lleva 'jugada' (el estado queda igual)."""
+    tokens = [estado.aplicar_paso(desde, pasos) for desde, pasos in jugada]
+    clave = estado.clave_zobrist()
+    for token in reversed(tokens):
+        estado.deshacer_paso(token)
+    return clave
+
+
+def estrategia_expectiminimax(estado: EstadoJuego, jugadas: List[Jugada], _rng) -> Jugada:
+    """
+    Estrategia para cli.simulate: 2 plies con top-6 (las jugadas ya vienen generadas).
+    Con negras en turno la caché de jugadas puede devolver otro orden de pasos para la
+    misma posición final, así que se devuelve la de 'jugadas' que lleva a esa posición.
+    """
+    elegida = _MOTOR_SIMULACION.elegir(estado)
+    if elegida is None or elegida in jugadas:
+        return elegida or jugadas[0]
+    destino = _clave_tras(estado, elegida)
+    return next((j for j in jugadas if _clave_tras(estado, j) == destino), jugadas[0])
+
+
+_MOTOR_SIMULACION = MotorExpectiminimax(profundidad=2, top_k=6)
+
+
+__all__ = [
+    "MotorExpectiminimax",
+    "TIRADAS",
+    "evaluar_heuristica",
+    "pips",
+    "estado_desde_game",
+    "jugada_a_movimientos",
+    "estrategia_expectiminimax",
+]
@@ -0,0 +1,158 @@
+"""
+Caché acotada de jugadas legales delante de `cli.jugadas.generar_jugadas`.
+
+Clave: (clave canónica de la posición, dados restantes ordenados). La clave canónica
+(core.canonico) es la misma para `EstadoJuego` y `core.board.Board` y para una posición
+y su espejo con el otro color en turno, así que todos comparten las entradas: se
+guardan las jugadas de EstadoJuego vistas por blancas y se espejan al leer si tiran
+las negras (y, para el Board, se traducen a movimientos de `Board.apply`).
+Con negras en turno, el representante de cada posición final y el orden de la lista
+pueden diferir de los de generar_jugadas; el conjunto de posiciones es el mismo.
+
+La memoria se acota por cantidad de entradas (LRU). Cada llamada indica un `sitio`
+(p. ej. "busqueda", "estado", "board") y se cuentan aciertos y fallos por sitio.
+Se desactiva con BACKGAMMON_CACHE_JUGADAS=0 o `activar(False)` para comparar tiempos.
+"""
+
+from __future__ import annotations
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from cli.jugadas import generar_jugadas
+from cli.state import EstadoJuego, Jugada
+from core.board import BLANCO, NEGRO, Movimiento
+from core.canonico import espejar_jugada
+
+ACTIVA: bool = os.environ.get("BACKGAMMON_CACHE_JUGADAS", "1") != "0"
+
+Clave = Tuple[int, Tuple[int, ...]]
+
+
+def activar(activo: bool = True) -> None:
+    """Activa/desactiva la caché (desactivada, todas las llamadas generan de cero)."""
+    global ACTIVA  # pylint: disable=global-statement
+    ACTIVA = activo
+
+
+def _canonicas(jugadas: List[Jugada], espejada: bool) -> Tuple[Jugada, ...]:
+    """Jugadas vistas por blancas (espejadas si las generó el jugador negro)."""
+    return tuple(espejar_jugada(j) for j in jugadas) if espejada else tuple(jugadas)
+
+
+class CacheJugadas:
+    """
+    LRU de jugadas legales por (posición, dados).
+
+    Atributos (todos dunder):
+      __entradas__ (OrderedDict[Clave, Tuple[Jugada, ...]]): de menos a más reciente.
+      __max_entradas__ (int): cota de entradas.
+      __contadores__ (Dict[str, List[int]]): [aciertos, fallos] por sitio de llamada.
+    """
+
+    def __init__(self, max_entradas: int = 20_000) -> None:
+        if max_entradas < 1:
+            raise ValueError("max_entradas debe ser positivo.")
+        self.__entradas__: "OrderedDict[Clave, Tuple[Jugada, ...]]" = OrderedDict()
+        self.__max_entradas__ = max_entradas
+        self.__contadores__: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__entradas__)
+
+    def jugadas(
+        self, estado: EstadoJuego, dados: Optional[Sequence[int]] = None, sitio: str = "general"
+    ) -> List[Jugada]:
+        """
+        Igual que generar_jugadas(estado, dados), pasando antes por la caché.
+        Parámetros: estado (EstadoJuego), dados (Sequence[int]|None), sitio (str)
+        Retorna: List[Jugada]
+        """
+        if not ACTIVA:
+            return generar_jugadas(estado, dados)
+        restantes = tuple(sorted(dados if dados is not None else estado.__movimientos_pendientes__))
+        espejada = estado.__turno__ == "NEGRAS"
+        clave = (estado.clave_canonica(), restantes)
+        guardadas = self.__leer__(clave, sitio)
+        if guardadas is None:
+            generadas = generar_jugadas(estado, restantes)
+            self.__guardar__(clave, _canonicas(generadas, espejada))
+            return generadas
+        return [espejar_jugada(j) for j in guardadas] if espejada else list(guardadas)
+
+    def jugadas_board(
+        self, board, color: str, dados: Sequence[int], sitio: str = "board"
+    ) -> List[List[Movimiento]]:
+        """
+        Jugadas legales de 'color' en un `core.board.Board` como listas de movimientos
+        de `Board.apply` (origen BARRA, destino FUERA). Sólo proyecta a EstadoJuego si falla.
+        Parámetros: board (Board), color (BLANCO|NEGRO), dados (Sequence[int]), sitio (str)
+        Retorna: List[List[Movimiento]]
+        """
+        # pylint: disable=import-outside-toplevel
+        from cli.busqueda import jugada_a_movimientos
+
+        if color not in (BLANCO, NEGRO):
+            raise ValueError(f"Color inválido: {color}")
+        restantes = tuple(sorted(dados))
+        espejada = color == NEGRO
+        clave = (board.clave_canonica(color), restantes)
+        guardadas = self.__leer__(clave, sitio) if ACTIVA else None
+        if guardadas is None:
+            estado = EstadoJuego(__turno__="NEGRAS" if espejada else "BLANCAS")
+            estado.cargar_slots(list(board.__conteos__))
+            jugadas = generar_jugadas(estado, restantes)
+            if ACTIVA:
+                self.__guardar__(clave, _canonicas(jugadas, espejada))
+        else:
+            jugadas = [espejar_jugada(j) for j in guardadas] if espejada else guardadas
+        return [jugada_a_movimientos(j, color) for j in jugadas]
+
+    def estadisticas(self) -> Dict[str, Dict[str, float]]:
+        """
+        Aciertos, fallos y tasa de aciertos por sitio de llamada.
+        Retorna: Dict[str, Dict[str, float]]
+        """
+        salida = {}
+        for sitio, (aciertos, fallos) in self.__contadores__.items():
+            total = aciertos + fallos
+            salida[sitio] = {
+                "aciertos": aciertos,
+                "fallos": fallos,
+                "tasa_aciertos": aciertos / total if total else 0.0,
+            }
+        return salida
+
+    def limpiar(self) -> None:
+        """Vacía las entradas y los contadores."""
+        self.__entradas__.clear()
+        self.__contadores__.clear()
+
+    def __leer__(self, clave: Clave, sitio: str) -> Optional[Tuple[Jugada, ...]]:
+        contador = self.__contadores__.setdefault(sitio, [0, 0])
+        guardadas = self.__entradas__.get(clave)
+        if guardadas is None:
+            contador[1] += 1
+            return None
+        contador[0] += 1
+        self.__entradas__.move_to_end(clave)
+        return guardadas
+
+    def __guardar__(self, clave: Clave, jugadas: Tuple[Jugada, ...]) -> None:
+        self.__entradas__[clave] = jugadas
+        if len(self.__entradas__) > self.__max_entradas__:
+            self.__entradas__.popitem(last=False)
+
+
+# Caché por proceso compartida por EstadoJuego.jugadas_legales y el motor de búsqueda
+CACHE = CacheJugadas(int(os.environ.get("BACKGAMMON_CACHE_JUGADAS_MAX", "20000")))
+
+
+def jugadas_cacheadas(
+    estado: EstadoJuego, dados: Optional[Sequence[int]] = None, sitio: str = "general"
+) -> List[Jugada]:
+    """Atajo a CACHE.jugadas()."""
+    return CACHE.jugadas(estado, dados, sitio)
+
+
+__all__ = ["ACTIVA", "CACHE", "CacheJugadas", "activar", "jugadas_cacheadas"]
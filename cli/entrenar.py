@@ -0,0 +1,367 @@
+"""
+Entrenamiento TD(λ) por autojuego de `core.red.RedEvaluadora`.
+
+Uso:
+    python -m cli.entrenar --partidas N --workers K --checkpoint pesos.npz [--cada M]
+
+Los workers (pool de procesos) juegan partidas completas con las reglas de
+`EstadoJuego`, eligiendo la jugada de mayor equidad según una copia de los pesos
+(con exploración épsilon), y devuelven la trayectoria codificada. Un único
+aprendiz aplica TD(λ) sobre cada trayectoria a medida que llegan y reparte los
+pesos actualizados en los envíos siguientes.
+
+Las salidas de la red son para el jugador en turno, que alterna en cada paso:
+el objetivo del paso t es la salida del paso t+1 vista desde el otro lado
+(`invertir`), y las trazas de elegibilidad se convierten igual al avanzar.
+El checkpoint (.npz) guarda los pesos (cargable con `RedEvaluadora.desde_npz`)
+y los contadores; al reiniciar con el mismo archivo se continúa desde ahí.
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from core.dice import FlujoDados, tirar_par  # noqa: E402
+from core.red import RedEvaluadora, SALIDAS, codificar_slots  # noqa: E402
+from cli.jugadas import aplicar_jugada, generar_jugadas  # noqa: E402
+from cli.simulate import MAX_TURNOS, puntos_victoria  # noqa: E402
+from cli.state import EstadoJuego  # noqa: E402
+
+# Salida k del jugador en turno = salida _PERMUTACION[k] del rival (la 0 invertida: 1 - p)
+_PERMUTACION = np.array([0, 3, 4, 1, 2])
+_SIGNO = np.array([-1.0, 1.0, 1.0, 1.0, 1.0], dtype=np.float32)
+
+Trayectoria = Tuple[np.ndarray, np.ndarray]  # (posiciones (T, 198), resultado final (5,))
+
+
+def invertir(probabilidades: np.ndarray) -> np.ndarray:
+    """
+    Salidas del rival expresadas para el otro jugador: (1 - gana, pierde gammon,
+    pierde bg, gana gammon, gana bg).
+    Parámetros: probabilidades (..., 5)
+    Retorna: np.ndarray
+    """
+    p = np.asarray(probabilidades)[..., _PERMUTACION].copy()
+    p[..., 0] = 1 - p[..., 0]
+    return p
+
+
+# ---------------- Autojuego (lado worker) ----------------
+
+def jugar_autojuego(red: RedEvaluadora, semilla: int, epsilon: float = 0.0) -> Trayectoria:
+    """
+    Partida completa red vs. red. Registra la posición tras cada turno (con el
+    rival en turno) y el resultado desde el lado en turno de la última posición.
+    Parámetros: red (RedEvaluadora), semilla (int), epsilon (float)
+    Retorna: Trayectoria
+    """
+    rng = random.Random(semilla)
+    dados = FlujoDados(semilla, tam_buffer=512)
+    estado = EstadoJuego()
+    estado.restablecer_inicio()
+    d1 = d2 = 0
+    while d1 == d2:
+        d1, d2 = tirar_par(dados)
+    if d2 > d1:
+        estado.cambiar_turno()
+    estado.set_dados(d1, d2)
+
+    filas: List[List[int]] = []
+    negras: List[bool] = []
+    for _ in range(MAX_TURNOS):
+        jugadas = generar_jugadas(estado)
+        if jugadas:
+            if epsilon and rng.random() < epsilon:
+                jugada = rng.choice(jugadas)
+            else:
+                jugada = jugadas[int(np.argmax(red.evaluar_jugadas(estado, jugadas)))]
+            aplicar_jugada(estado, jugada)
+        if estado.hay_movimientos():
+            estado.cambiar_turno()
+        filas.append(estado.conteos_slots())
+        negras.append(estado.__turno__ == "NEGRAS")
+        ganador = "BLANCAS" if estado.__fuera_blancas__ == 15 else "NEGRAS" if estado.__fuera_negras__ == 15 else None
+        if ganador is not None:
+            puntos = puntos_victoria(estado, ganador)
+            # Quien está en turno en la última posición es el perdedor
+            final = np.array([0, 0, 0, puntos >= 2, puntos == 3], dtype=np.float32)
+            return codificar_slots(np.array(filas), np.array(negras)), final
+        estado.set_dados(*tirar_par(dados))
+    # Partida cortada: sin objetivo terminal (el aprendiz sólo usa los pasos intermedios)
+    return codificar_slots(np.array(filas), np.array(negras)), np.full(SALIDAS, np.nan, dtype=np.float32)
+
+
+def _tarea_autojuego(args) -> List[Trayectoria]:
+    """Tarea del pool: juega varias partidas con los pesos recibidos."""
+    pesos, semillas, epsilon = args
+    red = RedEvaluadora(pesos=pesos)
+    return [jugar_autojuego(red, s, epsilon) for s in semillas]
+
+
+# ---------------- Aprendiz ----------------
+
+class EntrenadorTD:
+    """
+    Aprendiz TD(λ) con checkpoints.
+
+    Atributos (todos dunder):
+      __red__ (RedEvaluadora): red que se entrena (se modifica en el lugar).
+      __alfa__ (float), __lambda__ (float), __epsilon__ (float): hiperparámetros.
+      __semilla__ (int): semilla base; la partida i usa una semilla derivada de (semilla, i).
+      __ruta__ (str|None): archivo de checkpoint.
+      __partidas__ (int), __actualizaciones__ (int): contadores acumulados (persisten).
+    """
+
+    def __init__(
+        self,
+        red: Optional[RedEvaluadora] = None,
+        alfa: float = 0.1,
+        lambda_: float = 0.7,
+        epsilon: float = 0.0,
+        semilla: int = 0,
+        ruta_checkpoint: Optional[str] = None,
+    ) -> None:
+        """
+        Si 'ruta_checkpoint' existe, reanuda desde ahí (pesos y contadores).
+        """
+        if not 0 <= lambda_ <= 1:
+            raise ValueError("lambda debe estar entre 0 y 1.")
+        if alfa <= 0:
+            raise ValueError("alfa debe ser positivo.")
+        self.__red__ = red if red is not None else RedEvaluadora(semilla=semilla)
+        self.__alfa__ = alfa
+        self.__lambda__ = lambda_
+        self.__epsilon__ = epsilon
+        self.__semilla__ = semilla
+        self.__ruta__ = ruta_checkpoint
+        self.__partidas__ = 0
+        self.__actualizaciones__ = 0
+        if ruta_checkpoint and os.path.exists(ruta_checkpoint):
+            self.cargar_checkpoint(ruta_checkpoint)
+
+    @property
+    def red(self) -> RedEvaluadora:
+        return self.__red__
+
+    @property
+    def partidas(self) -> int:
+        return self.__partidas__
+
+    @property
+    def actualizaciones(self) -> int:
+        return self.__actualizaciones__
+
+    # ---------------- Checkpoints ----------------
+
+    def guardar_checkpoint(self, ruta: Optional[str] = None) -> None:
+        """
+        Guarda pesos y contadores de forma atómica (archivo temporal + reemplazo).
+        Parámetros: ruta (str|None): por defecto la del constructor
+        Retorna: None
+        """
+        ruta = ruta or self.__ruta__
+        if not ruta:
+            raise ValueError("No hay ruta de checkpoint.")
+        temporal = ruta + ".tmp"
+        with open(temporal, "wb") as archivo:
+            np.savez(
+                archivo,
+                partidas=np.int64(self.__partidas__),
+                actualizaciones=np.int64(self.__actualizaciones__),
+                **self.__red__.pesos(),
+            )
+        os.replace(temporal, ruta)
+
+    def cargar_checkpoint(self, ruta: str) -> None:
+        """
+        Carga pesos y contadores de un checkpoint.
+        Parámetros: ruta (str)
+        Retorna: None
+        """
+        with np.load(ruta) as datos:
+            self.__red__.cargar_pesos({k: datos[k] for k in ("w1", "b1", "w2", "b2")})
+            self.__partidas__ = int(datos["partidas"]) if "partidas" in datos.files else 0
+            self.__actualizaciones__ = int(datos["actualizaciones"]) if "actualizaciones" in datos.files else 0
+
+    # ---------------- TD(λ) ----------------
+
+    def aprender(self, trayectoria: Trayectoria) -> int:
+        """
+        Aplica TD(λ) en línea sobre una trayectoria (semigradiente, trazas por salida).
+        Parámetros: trayectoria (Trayectoria)
+        Retorna: int (actualizaciones aplicadas)
+        """
+        x, final = trayectoria
+        red = self.__red__
+        w1, b1, w2, b2 = red.__w1__, red.__b1__, red.__w2__, red.__b2__
+        ocultas = w1.shape[1]
+        # Trazas por salida k: e_w1[k] (198, H), e_b1[k] (H,), e_w2[:, k] (H,), e_b2[k]
+        e_w1 = np.zeros((SALIDAS,) + w1.shape, dtype=np.float32)
+        e_b1 = np.zeros((SALIDAS, ocultas), dtype=np.float32)
+        e_w2 = np.zeros_like(w2)
+        e_b2 = np.zeros_like(b2)
+        pasos = len(x)
+        terminal = not np.isnan(final).any()
+        h, v = red.propagar(x[:1])
+        for t in range(pasos):
+            if t + 1 < pasos:
+                objetivo = invertir(red.propagar(x[t + 1: t + 2])[1][0])
+            elif terminal:
+                objetivo = final
+            else:
+                break
+            # Gradientes de cada salida respecto de los pesos (sigmoides)
+            d_sal = v[0] * (1 - v[0])  # (5,)
+            d_oc = h[0] * (1 - h[0])  # (H,)
+            g_b1 = d_sal[:, None] * w2.T * d_oc[None, :]  # (5, H)
+            e_w1 *= self.__lambda__
+            e_w1 += x[t][None, :, None] * g_b1[:, None, :]
+            e_b1 = self.__lambda__ * e_b1 + g_b1
+            e_w2 = self.__lambda__ * e_w2 + h[0][:, None] * d_sal[None, :]
+            e_b2 = self.__lambda__ * e_b2 + d_sal
+
+            delta = (objetivo - v[0]).astype(np.float32) * self.__alfa__
+            w1 += np.tensordot(delta, e_w1, axes=1)
+            b1 += delta @ e_b1
+            w2 += e_w2 * delta[None, :]
+            b2 += e_b2 * delta
+            self.__actualizaciones__ += 1
+
+            if t + 1 < pasos:
+                # El siguiente paso es del otro jugador: trazas a su perspectiva
+                e_w1 = e_w1[_PERMUTACION] * _SIGNO[:, None, None]
+                e_b1 = e_b1[_PERMUTACION] * _SIGNO[:, None]
+                e_w2 = e_w2[:, _PERMUTACION] * _SIGNO[None, :]
+                e_b2 = e_b2[_PERMUTACION] * _SIGNO
+                h, v = red.propagar(x[t + 1: t + 2])
+        self.__partidas__ += 1
+        return pasos
+
+    # ---------------- Bucle principal ----------------
+
+    def entrenar(
+        self,
+        partidas: int,
+        workers: int = 1,
+        por_tarea: int = 4,
+        cada: int = 100,
+        informar=None,
+    ) -> Dict[str, float]:
+        """
+        Juega 'partidas' de autojuego repartidas en el pool y aprende de cada trayectoria
+        al llegar. Guarda checkpoint cada 'cada' partidas y al terminar.
+        Parámetros: partidas (int), workers (int), por_tarea (int), cada (int),
+          informar (callable(dict)|None): recibe el resumen parcial en cada checkpoint
+        Retorna: Dict[str, float] con partidas/seg y actualizaciones/seg
+        """
+        if partidas <= 0 or workers <= 0 or por_tarea <= 0:
+            raise ValueError("partidas, workers y por_tarea deben ser positivos.")
+        inicio_partidas = self.__partidas__
+        inicio_act = self.__actualizaciones__
+        proxima = self.__partidas__  # índice de la próxima semilla a repartir
+        objetivo = self.__partidas__ + partidas
+        ultimo_checkpoint = self.__partidas__
+        t0 = time.perf_counter()
+
+        def tarea():
+            nonlocal proxima
+            cantidad = min(por_tarea, objetivo - proxima)
+            semillas = [_semilla(self.__semilla__, i) for i in range(proxima, proxima + cantidad)]
+            proxima += cantidad
+            return (self.__red__.pesos(), semillas, self.__epsilon__)
+
+        def resumen() -> Dict[str, float]:
+            segundos = max(time.perf_counter() - t0, 1e-9)
+            return {
+                "partidas": self.__partidas__,
+                "segundos": segundos,
+                "partidas_por_seg": (self.__partidas__ - inicio_partidas) / segundos,
+                "actualizaciones_por_seg": (self.__actualizaciones__ - inicio_act) / segundos,
+            }
+
+        def recibir(trayectorias: List[Trayectoria]) -> None:
+            nonlocal ultimo_checkpoint
+            for trayectoria in trayectorias:
+                self.aprender(trayectoria)
+            if self.__ruta__ and self.__partidas__ - ultimo_checkpoint >= cada:
+                self.guardar_checkpoint()
+                ultimo_checkpoint = self.__partidas__
+                if informar:
+                    informar(resumen())
+
+        if workers == 1:
+            while proxima < objetivo:
+                recibir(_tarea_autojuego(tarea()))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pendientes = {pool.submit(_tarea_autojuego, tarea()) for _ in range(2 * workers) if proxima < objetivo}
+                while pendientes:
+                    listos, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                    for futuro in listos:
+                        recibir(futuro.result())
+                        if proxima < objetivo:
+                            pendientes.add(pool.submit(_tarea_autojuego, tarea()))
+        if self.__ruta__:
+            self.guardar_checkpoint()
+        return resumen()
+
+
+def _semilla(semilla: int, indice: int) -> int:
+    """Semilla de la partida 'indice' (independiente de workers y reanudaciones)."""
+    return random.Random(semilla * 1_000_003 + indice).getrandbits(63)
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    Parser de argumentos y bucle de entrenamiento con reporte por checkpoint.
+    """
+    parser = argparse.ArgumentParser(description="Backgammon - entrenamiento TD(lambda) por autojuego")
+    parser.add_argument("--partidas", type=int, default=1000, help="Partidas a jugar en esta corrida")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos de autojuego")
+    parser.add_argument("--checkpoint", default="pesos_td.npz", help="Archivo .npz de checkpoint")
+    parser.add_argument("--cada", type=int, default=100, help="Partidas entre checkpoints")
+    parser.add_argument("--alfa", type=float, default=0.1)
+    parser.add_argument("--lambda", dest="lambda_", type=float, default=0.7)
+    parser.add_argument("--epsilon", type=float, default=0.0, help="Probabilidad de jugada al azar")
+    parser.add_argument("--ocultas", type=int, default=40, help="Unidades ocultas (red nueva)")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        entrenador = EntrenadorTD(
+            RedEvaluadora(ocultas=args.ocultas, semilla=args.semilla),
+            alfa=args.alfa,
+            lambda_=args.lambda_,
+            epsilon=args.epsilon,
+            semilla=args.semilla,
+            ruta_checkpoint=args.checkpoint,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    if entrenador.partidas:
+        print(f"Reanudando desde {args.checkpoint}: {entrenador.partidas} partidas previas")
+
+    def informar(res: Dict[str, float]) -> None:
+        print(
+            f"{res['partidas']:>8.0f} partidas  {res['partidas_por_seg']:8.2f} partidas/s  "
+            f"{res['actualizaciones_por_seg']:10,.0f} act/s"
+        )
+
+    res = entrenador.entrenar(args.partidas, workers=args.workers, cada=args.cada, informar=informar)
+    informar(res)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,100 @@
+"""
+Generador de jugadas completas (todo el turno) para EstadoJuego.
+
+Recorre el árbol de pasos aplicando y deshaciendo sobre el mismo estado
+(sin copias), poda subárboles ya visitados por (clave Zobrist, dados restantes)
+y deduplica las jugadas que llegan a la misma posición.
+Reglas aplicadas: ambos órdenes de dados, dobles = 4 pasos, usar la mayor
+cantidad de dados posible y, si sólo se puede usar uno, el mayor.
+"""
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from cli.state import BARRA, EstadoJuego, Jugada
+
+
+def origenes_legales(estado: EstadoJuego, pasos: int) -> List[int]:
+    """
+    Orígenes desde los que el jugador en turno puede mover 'pasos'.
+    Con fichas en la barra sólo se admite reingresar (BARRA).
+    Parámetros: estado (EstadoJuego), pasos (int)
+    Retorna: List[int]
+    """
+    if estado.__turno__ == "BLANCAS":
+        en_barra, propias = estado.__bar_blancas__, estado.__blancas__
+    else:
+        en_barra, propias = estado.__bar_negras__, estado.__negras__
+    if en_barra > 0:
+        return [BARRA] if estado.paso_legal(BARRA, pasos) else []
+    return [p for p in range(1, 25) if propias[p] > 0 and estado.paso_legal(p, pasos)]
+
+
+def generar_jugadas(estado: EstadoJuego, dados: Optional[Sequence[int]] = None) -> List[Jugada]:
+    """
+    Lista todas las jugadas legales del turno, una por posición resultante.
+    Parámetros:
+      estado (EstadoJuego): se modifica durante la búsqueda y se deja intacto al terminar.
+      dados (Sequence[int]|None): valores a usar; por defecto los movimientos pendientes.
+    Retorna: List[Jugada] (vacía si no hay dados o no se puede mover)
+    """
+    restantes = tuple(sorted(dados if dados is not None else estado.__movimientos_pendientes__))
+    if not restantes:
+        return []
+
+    finales: Dict[int, Jugada] = {}  # clave de posición -> primera jugada que llega
+    largos: Dict[int, int] = {}
+    visitados: Set[Tuple[int, Tuple[int, ...]]] = set()
+    camino: List[Tuple[int, int]] = []
+
+    def explorar(quedan: Tuple[int, ...]) -> None:
+        nodo = (estado.__zobrist__, quedan)
+        if nodo in visitados:
+            return
+        visitados.add(nodo)
+        expandio = False
+        for i, pasos in enumerate(quedan):
+            if i and quedan[i - 1] == pasos:
+                continue  # mismo valor ya probado en este nivel
+            siguiente = quedan[:i] + quedan[i + 1:]
+            for desde in origenes_legales(estado, pasos):
+                expandio = True
+                token = estado.aplicar_paso(desde, pasos)
+                camino.append((desde, pasos))
+                explorar(siguiente)
+                camino.pop()
+                estado.deshacer_paso(token)
+        if not expandio and camino:
+            clave = estado.__zobrist__
+            if clave not in finales or largos[clave] < len(camino):
+                finales[clave] = tuple(camino)
+                largos[clave] = len(camino)
+
+    explorar(restantes)
+    if not finales:
+        return []
+
+    maximo = max(largos.values())
+    jugadas = [j for j in finales.values() if len(j) == maximo]
+    # Si sólo se puede usar un dado de dos distintos, es obligatorio el mayor si se puede
+    if maximo == 1 and len(set(restantes)) > 1:
+        mayor = max(restantes)
+        con_mayor = [j for j in jugadas if j[0][1] == mayor]
+        if con_mayor:
+            jugadas = con_mayor
+    return jugadas
+
+
+def aplicar_jugada(estado: EstadoJuego, jugada: Jugada) -> None:
+    """
+    Ejecuta una jugada completa con mover()/reingresar() (consume dados y pasa el turno).
+    Parámetros: estado (EstadoJuego), jugada (Jugada)
+    Retorna: None
+    """
+    for desde, pasos in jugada:
+        if desde == BARRA:
+            estado.reingresar(pasos)
+        else:
+            estado.mover(desde, pasos)
+
+
+__all__ = ["origenes_legales", "generar_jugadas", "aplicar_jugada"]
@@ -0,0 +1,287 @@
+"""
+Lote de N partidas en paralelo con NumPy (mismas reglas de paso que EstadoJuego).
+
+Representación:
+  __fichas__ (N, 2, 26) int8: [partida, jugador, índice] con jugador 0 = BLANCAS y
+  1 = NEGRAS. El índice va desde la perspectiva de cada jugador: 1..24 son sus
+  puntos (distancia a la salida), 25 la barra y 0 las borneadas. Ambos jugadores
+  avanzan restando pasos; el punto q propio es el 25 - q del oponente.
+  __turno__ (N,) int8: jugador en turno.
+  __pendientes__ (N, 4) int8: dados por usar (0 = usado; dobles ocupan las 4 columnas).
+
+Todo se vectoriza sobre las N partidas: tiradas, máscaras de legalidad
+(N, 6, 26) para cada dado y origen, aplicación de pasos y detección de fin.
+Con fichas en la barra sólo es legal reingresar, igual que en `cli.jugadas`.
+"""
+
+from __future__ import annotations
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from cli.state import EstadoJuego
+
+JUGADORES = ("BLANCAS", "NEGRAS")
+BARRA_LOTE = 25
+FUERA_LOTE = 0
+MAX_FICHAS = 15
+
+# Posición inicial vista por cualquiera de los dos jugadores: 24:2, 13:5, 8:3, 6:5
+_INICIO = np.zeros(26, dtype=np.int8)
+_INICIO[[24, 13, 8, 6]] = [2, 5, 3, 5]
+
+_ORIGENES = np.arange(26)
+_DADOS = np.arange(1, 7)
+# _DESTINOS[d - 1, o] = o - d (<= 0 significa bornear)
+_DESTINOS = _ORIGENES[None, :] - _DADOS[:, None]
+
+
+class LoteEstados:
+    """
+    N partidas de backgammon avanzando a la vez sobre arreglos NumPy.
+
+    Atributos (todos dunder):
+      __fichas__ (np.ndarray): (N, 2, 26) int8, ver docstring del módulo.
+      __turno__ (np.ndarray): (N,) int8, 0 = BLANCAS, 1 = NEGRAS.
+      __pendientes__ (np.ndarray): (N, 4) int8, dados sin usar (0 = vacío).
+    """
+
+    def __init__(self, n: int, rng: Optional[np.random.Generator] = None) -> None:
+        """
+        Crea N partidas en la posición inicial, turno de BLANCAS y sin dados.
+        Parámetros: n (int), rng (np.random.Generator|None)
+        """
+        if n <= 0:
+            raise ValueError("El lote debe tener al menos una partida.")
+        self.__rng__ = rng if rng is not None else np.random.default_rng()
+        self.__fichas__ = np.zeros((n, 2, 26), dtype=np.int8)
+        self.__turno__ = np.zeros(n, dtype=np.int8)
+        self.__pendientes__ = np.zeros((n, 4), dtype=np.int8)
+        self.restablecer_inicio()
+
+    def __len__(self) -> int:
+        return self.__fichas__.shape[0]
+
+    def restablecer_inicio(self) -> None:
+        """
+        Coloca todas las partidas en la posición inicial (turno BLANCAS, sin dados).
+        Retorna: None
+        """
+        self.__fichas__[:] = _INICIO
+        self.__turno__[:] = 0
+        self.__pendientes__[:] = 0
+
+    # ---------------- Conversión desde/hacia EstadoJuego ----------------
+
+    @classmethod
+    def desde_estados(
+        cls, estados: Iterable[EstadoJuego], rng: Optional[np.random.Generator] = None
+    ) -> "LoteEstados":
+        """
+        Construye un lote copiando fichas, turno y movimientos pendientes de cada estado.
+        Parámetros: estados (Iterable[EstadoJuego]), rng (np.random.Generator|None)
+        Retorna: LoteEstados
+        """
+        estados = list(estados)
+        lote = cls(len(estados), rng)
+        lote.__fichas__[:] = 0
+        for i, estado in enumerate(estados):
+            blancas, negras = lote.__fichas__[i, 0], lote.__fichas__[i, 1]
+            blancas[1:25] = estado.__blancas__[1:25]
+            negras[1:25] = estado.__negras__[24:0:-1]
+            blancas[BARRA_LOTE], negras[BARRA_LOTE] = estado.__bar_blancas__, estado.__bar_negras__
+            blancas[FUERA_LOTE], negras[FUERA_LOTE] = estado.__fuera_blancas__, estado.__fuera_negras__
+            lote.__turno__[i] = JUGADORES.index(estado.__turno__)
+            pendientes = estado.__movimientos_pendientes__[:4]
+            lote.__pendientes__[i, :len(pendientes)] = pendientes
+        return lote
+
+    def a_estado(self, i: int) -> EstadoJuego:
+        """
+        Estado individual de la partida i (los dados se copian como pendientes).
+        Parámetros: i (int)
+        Retorna: EstadoJuego
+        """
+        blancas, negras = self.__fichas__[i, 0], self.__fichas__[i, 1]
+        pendientes = [int(d) for d in self.__pendientes__[i] if d]
+        estado = EstadoJuego(
+            __blancas__=[0] + [int(v) for v in blancas[1:25]],
+            __negras__=[0] + [int(v) for v in negras[24:0:-1]],
+            __bar_blancas__=int(blancas[BARRA_LOTE]),
+            __bar_negras__=int(negras[BARRA_LOTE]),
+            __fuera_blancas__=int(blancas[FUERA_LOTE]),
+            __fuera_negras__=int(negras[FUERA_LOTE]),
+            __turno__=JUGADORES[int(self.__turno__[i])],
+            __movimientos_pendientes__=pendientes,
+        )
+        if pendientes:
+            estado.__dados__ = (pendientes[0], pendientes[1] if len(pendientes) > 1 else pendientes[0])
+        return estado
+
+    def a_estados(self) -> List[EstadoJuego]:
+        """
+        Lista de EstadoJuego, uno por partida.
+        Retorna: List[EstadoJuego]
+        """
+        return [self.a_estado(i) for i in range(len(self))]
+
+    # ---------------- Dados ----------------
+
+    def tirar_dados(self, activas: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Tira dos dados en cada partida activa y carga los pendientes (dobles => 4).
+        Parámetros: activas (np.ndarray[bool]|None): por defecto todas las no terminadas.
+        Retorna: np.ndarray (N, 2) con la tirada (0 en las partidas no activas)
+        """
+        if activas is None:
+            activas = ~self.terminadas()
+        tirada = self.__rng__.integers(1, 7, size=(len(self), 2), dtype=np.int8)
+        tirada[~activas] = 0
+        dobles = tirada[:, 0] == tirada[:, 1]
+        self.__pendientes__[activas, :2] = tirada[activas]
+        self.__pendientes__[activas, 2:] = np.where(dobles[activas, None], tirada[activas, :1], 0)
+        return tirada
+
+    # ---------------- Legalidad ----------------
+
+    def _propias_y_rivales(self):
+        """Fichas del jugador en turno y del rival vistas desde el jugador en turno."""
+        filas = np.arange(len(self))
+        propias = self.__fichas__[filas, self.__turno__]
+        rivales = self.__fichas__[filas, 1 - self.__turno__]
+        # Punto q propio = punto 25 - q del rival (índices 0 y 25 no son puntos)
+        rivales_aqui = np.zeros_like(rivales)
+        rivales_aqui[:, 1:25] = rivales[:, 24:0:-1]
+        return propias, rivales_aqui
+
+    def mascaras_legales(self) -> np.ndarray:
+        """
+        Máscara (N, 6, 26) bool: [partida, dado - 1, origen] legal para el jugador en turno.
+        El origen 25 es reingresar desde la barra; 0 nunca es legal.
+        Retorna: np.ndarray
+        """
+        propias, rivales = self._propias_y_rivales()
+        bloqueado = rivales >= 2
+        bloqueado[:, 0] = False
+
+        tiene = propias > 0
+        tiene[:, FUERA_LOTE] = False
+        en_barra = propias[:, BARRA_LOTE] > 0
+        # Con fichas en la barra sólo se puede reingresar
+        tiene[en_barra, :BARRA_LOTE] = False
+
+        destinos = np.clip(_DESTINOS, 0, 25)
+        libre = ~bloqueado[:, destinos]  # (N, 6, 26)
+        en_tablero = (_DESTINOS >= 1)[None, :, :]
+
+        # Borneo: todas en casa (1..6) y paso exacto, o el más lejano con sobrante
+        en_casa = (propias[:, 7:26].sum(axis=1) == 0)
+        ocupados = propias[:, 1:7] > 0
+        lejano = np.where(ocupados.any(axis=1), 6 - np.argmax(ocupados[:, ::-1], axis=1), 0)
+        exacto = (_DESTINOS == 0)[None, :, :]
+        sobrante = (_DESTINOS < 0)[None, :, :] & (_ORIGENES[None, None, :] == lejano[:, None, None])
+        borneo = en_casa[:, None, None] & (exacto | sobrante)
+
+        return tiene[:, None, :] & np.where(en_tablero, libre, borneo)
+
+    def mascaras_pendientes(self) -> np.ndarray:
+        """
+        Máscara (N, 6, 26) restringida a los dados pendientes de cada partida.
+        Retorna: np.ndarray
+        """
+        disponibles = (self.__pendientes__[:, :, None] == _DADOS[None, None, :]).any(axis=1)
+        return self.mascaras_legales() & disponibles[:, :, None]
+
+    # ---------------- Aplicación de pasos ----------------
+
+    def aplicar_pasos(self, partidas: np.ndarray, origenes: np.ndarray, pasos: np.ndarray) -> np.ndarray:
+        """
+        Aplica un paso ya validado en cada partida indicada (cada partida a lo sumo una vez),
+        con captura a la barra y borneo. Consume el dado de los pendientes; no cambia el turno.
+        Parámetros:
+          partidas (np.ndarray[int]): índices de partida sin repetir.
+          origenes (np.ndarray[int]): índice propio 1..25 (25 = barra).
+          pasos (np.ndarray[int]): valor del dado 1..6.
+        Retorna: np.ndarray[bool] con las partidas que capturaron
+        """
+        partidas = np.asarray(partidas, dtype=np.intp)
+        origenes = np.asarray(origenes, dtype=np.intp)
+        pasos = np.asarray(pasos, dtype=np.intp)
+        jugador = self.__turno__[partidas].astype(np.intp)
+        rival = 1 - jugador
+        fichas = self.__fichas__
+
+        fichas[partidas, jugador, origenes] -= 1
+        destinos = origenes - pasos
+        en_tablero = destinos >= 1
+        punto_rival = np.where(en_tablero, 25 - destinos, FUERA_LOTE)
+        capturo = en_tablero & (fichas[partidas, rival, punto_rival] == 1)
+        c = partidas[capturo]
+        fichas[c, rival[capturo], punto_rival[capturo]] = 0
+        fichas[c, rival[capturo], BARRA_LOTE] += 1
+        fichas[partidas, jugador, np.maximum(destinos, FUERA_LOTE)] += 1
+
+        # Consumir la primera columna pendiente con ese valor
+        columna = np.argmax(self.__pendientes__[partidas] == pasos[:, None], axis=1)
+        self.__pendientes__[partidas, columna] = 0
+        return capturo
+
+    def cambiar_turno(self, partidas: Optional[np.ndarray] = None) -> None:
+        """
+        Pasa el turno (y limpia dados) en las partidas indicadas o en todas.
+        Parámetros: partidas (np.ndarray|None): índices o máscara bool
+        Retorna: None
+        """
+        if partidas is None:
+            partidas = slice(None)
+        self.__turno__[partidas] ^= 1
+        self.__pendientes__[partidas] = 0
+
+    def avanzar_aleatorio(self) -> np.ndarray:
+        """
+        Un paso de política aleatoria en todas las partidas en curso: si no hay dados se tira,
+        se elige al azar un (dado, origen) legal y, si no quedan pasos posibles, pasa el turno.
+        No aplica la regla de máximo de dados de `cli.jugadas` (es una política por pasos).
+        Retorna: np.ndarray[bool] con las partidas que movieron
+        """
+        en_curso = ~self.terminadas()
+        sin_dados = en_curso & ~self.__pendientes__.any(axis=1)
+        if sin_dados.any():
+            self.tirar_dados(sin_dados)
+
+        legales = self.mascaras_pendientes().reshape(len(self), -1)
+        legales[~en_curso] = False
+        puede = legales.any(axis=1)
+        # Elección uniforme entre las opciones legales: máximo de ruido enmascarado
+        ruido = np.where(legales, self.__rng__.random(legales.shape, dtype=np.float32), -1.0)
+        eleccion = ruido.argmax(axis=1)
+        partidas = np.flatnonzero(puede)
+        if partidas.size:
+            dados, origenes = np.divmod(eleccion[partidas], 26)
+            self.aplicar_pasos(partidas, origenes, dados + 1)
+
+        # Pasa el turno quien no puede mover o agotó los dados
+        fin_turno = en_curso & (~puede | ~self.__pendientes__.any(axis=1)) & ~self.terminadas()
+        if fin_turno.any():
+            self.cambiar_turno(fin_turno)
+        return puede
+
+    # ---------------- Fin de partida ----------------
+
+    def terminadas(self) -> np.ndarray:
+        """
+        Partidas en las que algún jugador borneó sus 15 fichas.
+        Retorna: np.ndarray[bool] (N,)
+        """
+        return (self.__fichas__[:, :, FUERA_LOTE] >= MAX_FICHAS).any(axis=1)
+
+    def ganadores(self) -> np.ndarray:
+        """
+        Ganador por partida: 0 = BLANCAS, 1 = NEGRAS, -1 = en curso.
+        Retorna: np.ndarray[int8] (N,)
+        """
+        fuera = self.__fichas__[:, :, FUERA_LOTE] >= MAX_FICHAS
+        return np.where(fuera[:, 0], 0, np.where(fuera[:, 1], 1, -1)).astype(np.int8)
+
+
+__all__ = ["LoteEstados", "JUGADORES", "BARRA_LOTE", "FUERA_LOTE"]
@@ -0,0 +1,398 @@
+"""
+Rollouts Monte Carlo: juega una posición hasta el final muchas veces con una política
+de jugadas (las estrategias de cli.simulate) y promedia el resultado.
+
+Reducción de varianza:
+  - Primera tirada estratificada: la prueba (o el par antitético) k usa la tirada
+    ordenada k mod 36, así cada bloque de 36 cubre exactamente las 36 tiradas.
+  - Dados antitéticos: las pruebas 2k y 2k+1 comparten el flujo de dados, la segunda
+    con cada dado reflejado (d -> 7 - d). El par cuenta como una sola muestra.
+Las muestras (pruebas sueltas o pares) se tratan como independientes para el error
+estándar, lo que es conservador con la estratificación.
+
+Se reparte en bloques de 36 muestras sobre un pool de procesos; los bloques se
+acumulan en orden de índice y, si se pide un ancho de intervalo, se corta en cuanto
+el intervalo de confianza es más angosto (el resultado no depende de los workers).
+
+Uso:
+    python -m cli.rollout [--id POSITION_ID --turno NEGRAS] --pruebas N --workers K
+                          [--estrategia golosa] [--ancho 0.05] [--sin-antiteticos]
+                          [--almacen rollouts.bin]
+"""
+
+from __future__ import annotations
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from core.dice import FlujoDados  # noqa: E402
+from cli.simulate import jugar_desde, resolver_estrategia, semilla_partida  # noqa: E402
+from cli.state import EstadoJuego  # noqa: E402
+
+# Las 36 tiradas ordenadas (equiprobables) para estratificar la primera
+PRIMERAS: Tuple[Tuple[int, int], ...] = tuple((a, b) for a in range(1, 7) for b in range(1, 7))
+ESTRATO = len(PRIMERAS)
+
+
+class DadosRollout:
+    """
+    Fuente de dados de una prueba: primera tirada fija (opcional) y luego un FlujoDados,
+    reflejado si la prueba es la antitética del par.
+
+    Atributos (todos dunder):
+      __flujo__ (FlujoDados), __primera__ (Tuple[int,int]|None), __reflejar__ (bool)
+    """
+
+    def __init__(
+        self, flujo: FlujoDados, primera: Optional[Tuple[int, int]] = None, reflejar: bool = False
+    ) -> None:
+        self.__flujo__ = flujo
+        self.__primera__ = primera
+        self.__reflejar__ = reflejar
+
+    def tirada(self) -> Tuple[int, int]:
+        """Próximo par de dados (compatible con core.dice.tirar_par)."""
+        if self.__primera__ is not None:
+            par, self.__primera__ = self.__primera__, None
+            return par
+        a, b = self.__flujo__.tirada()
+        return (7 - a, 7 - b) if self.__reflejar__ else (a, b)
+
+
+@dataclass
+class ResultadoRollout:
+    """
+    Resultado de un rollout, desde la perspectiva de quien tiene el turno en la raíz.
+      pruebas (int): partidas jugadas.  muestras (int): muestras independientes
+        (pares si hubo antitéticos).
+      equidad (float): puntos promedio (±1 simple, ±2 gammon, ±3 backgammon).
+      varianza (float): varianza muestral de las muestras.
+      ganadas, gammons, backgammons (float): tasas a favor de la raíz.
+      gammons_contra, backgammons_contra (float): tasas en contra.
+      detenido (bool): True si cortó por alcanzar el ancho pedido.
+      segundos (float): tiempo total.
+      configuracion (dict): parámetros usados.
+      conteos (dict): partidas por resultado con signo (-3..3, 0 = sin terminar).
+    """
+
+    pruebas: int
+    muestras: int
+    equidad: float
+    varianza: float
+    ganadas: float
+    gammons: float
+    backgammons: float
+    gammons_contra: float
+    backgammons_contra: float
+    detenido: bool = False
+    segundos: float = 0.0
+    configuracion: Dict[str, object] = field(default_factory=dict)
+    conteos: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def error_estandar(self) -> float:
+        """Error estándar de la equidad (infinito con menos de dos muestras)."""
+        return math.sqrt(self.varianza / self.muestras) if self.muestras > 1 else float("inf")
+
+    def intervalo(self, confianza: float = 0.95) -> Tuple[float, float]:
+        """Intervalo de confianza normal para la equidad."""
+        z = NormalDist().inv_cdf(0.5 + confianza / 2)
+        margen = z * self.error_estandar
+        return self.equidad - margen, self.equidad + margen
+
+    def a_dict(self) -> Dict[str, object]:
+        """Campos como diccionario (para serializar)."""
+        return asdict(self)
+
+
+def _bloque_rollout(args) -> List[int]:
+    """
+    Tarea del pool: juega las muestras [inicio, fin).
+    Retorna los puntos con signo de cada prueba, en orden (los pares antitéticos juntos).
+    """
+    slots, turno, inicio, fin, seed, nombre_estrategia, antitetica, estratificada = args
+    estrategia = resolver_estrategia(nombre_estrategia)
+    salida: List[int] = []
+    for k in range(inicio, fin):
+        primera = PRIMERAS[k % ESTRATO] if estratificada else None
+        for reflejo in ((False, True) if antitetica else (False,)):
+            estado = EstadoJuego(__turno__=turno)
+            estado.cargar_slots(slots)
+            if primera is not None and reflejo:
+                primera_prueba: Optional[Tuple[int, int]] = (7 - primera[0], 7 - primera[1])
+            else:
+                primera_prueba = primera
+            dados = DadosRollout(FlujoDados(seed, flujo=k, tam_buffer=256), primera_prueba, reflejo)
+            estado.set_dados(*dados.tirada())
+            rng = random.Random(semilla_partida(seed, 2 * k + reflejo))
+            res = jugar_desde(estado, estrategia, estrategia, rng, dados)
+            if res.ganador is None:
+                salida.append(0)
+            else:
+                salida.append(res.puntos if res.ganador == turno else -res.puntos)
+    return salida
+
+
+# Parámetros que deben coincidir para sumar dos rollouts de la misma posición
+COMPATIBLES = ("estrategia", "seed", "antitetica", "estratificada")
+
+
+def compatibles(a: Dict[str, object], b: Dict[str, object]) -> bool:
+    """True si dos configuraciones de rollout pueden sumarse (ver COMPATIBLES)."""
+    return all(a.get(clave) == b.get(clave) for clave in COMPATIBLES)
+
+
+class _Acumulador:
+    """Suma de muestras (Welford) y conteos de resultados por tipo."""
+
+    def __init__(self, previo: Optional[ResultadoRollout] = None) -> None:
+        self.muestras = 0
+        self.pruebas = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.por_puntos: Dict[int, int] = {}
+        if previo is not None:
+            self.muestras, self.pruebas = previo.muestras, previo.pruebas
+            self.media = previo.equidad
+            self.m2 = previo.varianza * max(previo.muestras - 1, 0)
+            self.por_puntos = dict(previo.conteos)
+
+    def agregar_muestra(self, puntos: List[int]) -> None:
+        for p in puntos:
+            self.por_puntos[p] = self.por_puntos.get(p, 0) + 1
+        self.pruebas += len(puntos)
+        valor = sum(puntos) / len(puntos)
+        self.muestras += 1
+        delta = valor - self.media
+        self.media += delta / self.muestras
+        self.m2 += delta * (valor - self.media)
+
+    def combinar(self, otro: "_Acumulador") -> None:
+        """Suma otro acumulador (fórmula de Chan para media y varianza)."""
+        if otro.muestras == 0:
+            return
+        total = self.muestras + otro.muestras
+        delta = otro.media - self.media
+        self.m2 += otro.m2 + delta * delta * self.muestras * otro.muestras / total
+        self.media += delta * otro.muestras / total
+        self.muestras, self.pruebas = total, self.pruebas + otro.pruebas
+        for puntos, n in otro.por_puntos.items():
+            self.por_puntos[puntos] = self.por_puntos.get(puntos, 0) + n
+
+    def resultado(self, detenido: bool, segundos: float, configuracion: dict) -> ResultadoRollout:
+        n = max(self.pruebas, 1)
+
+        def tasa(*valores: int) -> float:
+            return sum(self.por_puntos.get(v, 0) for v in valores) / n
+
+        return ResultadoRollout(
+            pruebas=self.pruebas,
+            muestras=self.muestras,
+            equidad=self.media,
+            varianza=self.m2 / (self.muestras - 1) if self.muestras > 1 else 0.0,
+            ganadas=tasa(1, 2, 3),
+            gammons=tasa(2, 3),
+            backgammons=tasa(3),
+            gammons_contra=tasa(-2, -3),
+            backgammons_contra=tasa(-3),
+            detenido=detenido,
+            segundos=segundos,
+            configuracion=configuracion,
+            conteos=dict(self.por_puntos),
+        )
+
+
+def combinar(a: ResultadoRollout, b: ResultadoRollout) -> ResultadoRollout:
+    """
+    Une dos rollouts parciales de la misma posición (muestras disjuntas) como si fuera
+    uno solo: media y varianza por la fórmula de Chan, conteos y tiempos sumados.
+    Parámetros: a, b (ResultadoRollout) con los mismos parámetros de COMPATIBLES
+    Retorna: ResultadoRollout
+    """
+    if not compatibles(a.configuracion, b.configuracion):
+        raise ValueError("Rollouts incompatibles: distintos parámetros.")
+    acumulador = _Acumulador(a)
+    acumulador.combinar(_Acumulador(b))
+    configuracion = dict(a.configuracion)
+    configuracion.update(b.configuracion)
+    return acumulador.resultado(b.detenido, a.segundos + b.segundos, configuracion)
+
+
+def rollout(
+    estado: EstadoJuego,
+    pruebas: int = 1296,
+    estrategia: str = "golosa",
+    seed: int = 0,
+    workers: int = 1,
+    antitetica: bool = True,
+    estratificada: bool = True,
+    ancho: Optional[float] = None,
+    confianza: float = 0.95,
+    previo: Optional[ResultadoRollout] = None,
+) -> ResultadoRollout:
+    """
+    Rollout de 'estado' con el jugador en turno a punto de tirar.
+    Parámetros:
+      estado (EstadoJuego): no se modifica (se ignoran sus dados).
+      pruebas (int): máximo de partidas (se redondea hacia arriba a bloques completos).
+      estrategia (str): nombre en cli.simulate.ESTRATEGIAS o "modulo:funcion".
+      seed (int), workers (int)
+      antitetica, estratificada (bool): técnicas de reducción de varianza.
+      ancho (float|None): cortar cuando el intervalo de confianza sea más angosto.
+      confianza (float): nivel del intervalo para 'ancho'.
+      previo (ResultadoRollout|None): rollout ya hecho de la misma posición con los
+        mismos parámetros. Se continúa con las muestras siguientes y el corte por
+        ancho mira el total, pero se devuelven sólo las nuevas (unir con combinar()).
+    Retorna: ResultadoRollout
+    """
+    if pruebas <= 0:
+        raise ValueError("La cantidad de pruebas debe ser positiva.")
+    if workers <= 0:
+        raise ValueError("La cantidad de workers debe ser positiva.")
+    if ancho is not None and ancho <= 0:
+        raise ValueError("El ancho del intervalo debe ser positivo.")
+    if not 0 < confianza < 1:
+        raise ValueError("La confianza debe estar entre 0 y 1.")
+    resolver_estrategia(estrategia)
+    inicio = previo.muestras if previo is not None else 0
+    if inicio % ESTRATO:
+        raise ValueError(f"El rollout previo debe tener un múltiplo de {ESTRATO} muestras.")
+
+    por_muestra = 2 if antitetica else 1
+    muestras = -(-pruebas // por_muestra)
+    muestras = -(-muestras // ESTRATO) * ESTRATO
+    slots, turno = estado.conteos_slots(), estado.__turno__
+    bloques = [
+        (slots, turno, i, i + ESTRATO, seed, estrategia, antitetica, estratificada)
+        for i in range(inicio, inicio + muestras, ESTRATO)
+    ]
+    configuracion = {
+        "estrategia": estrategia,
+        "seed": seed,
+        "antitetica": antitetica,
+        "estratificada": estratificada,
+        "confianza": confianza,
+        "ancho": ancho,
+    }
+    if previo is not None and not compatibles(previo.configuracion, configuracion):
+        raise ValueError("El rollout previo usa otros parámetros.")
+    acumulador = _Acumulador()
+    t0 = time.perf_counter()
+
+    def consumir(lote: List[int]) -> bool:
+        """Agrega un bloque; True si ya alcanza el ancho pedido."""
+        for i in range(0, len(lote), por_muestra):
+            acumulador.agregar_muestra(lote[i:i + por_muestra])
+        if ancho is None:
+            return False
+        total = _Acumulador(previo)
+        total.combinar(acumulador)
+        if total.muestras < 2 * ESTRATO:
+            return False
+        bajo, alto = total.resultado(False, 0.0, configuracion).intervalo(confianza)
+        return alto - bajo <= ancho
+
+    detenido = False
+    if workers == 1:
+        for bloque in bloques:
+            if consumir(_bloque_rollout(bloque)):
+                detenido = True
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Ventana acotada de bloques en vuelo; se consumen en orden de índice
+            en_vuelo = [pool.submit(_bloque_rollout, b) for b in bloques[: 2 * workers]]
+            siguiente = len(en_vuelo)
+            while en_vuelo:
+                lote = en_vuelo.pop(0).result()
+                if consumir(lote):
+                    detenido = True
+                    for futuro in en_vuelo:
+                        futuro.cancel()
+                    break
+                if siguiente < len(bloques):
+                    en_vuelo.append(pool.submit(_bloque_rollout, bloques[siguiente]))
+                    siguiente += 1
+    return acumulador.resultado(detenido, time.perf_counter() - t0, configuracion)
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    Parser de argumentos e impresión del resultado.
+    """
+    parser = argparse.ArgumentParser(description="Backgammon - rollout Monte Carlo")
+    parser.add_argument("--id", help="Position ID (por defecto, la posición inicial)")
+    parser.add_argument("--turno", default="BLANCAS", choices=["BLANCAS", "NEGRAS"])
+    parser.add_argument("--pruebas", type=int, default=1296, help="Máximo de partidas")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos en paralelo")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla base")
+    parser.add_argument("--estrategia", default="golosa", help="Política de jugadas")
+    parser.add_argument("--ancho", type=float, default=None, help="Ancho de IC para cortar antes")
+    parser.add_argument("--sin-antiteticos", action="store_true", help="Sin dados antitéticos")
+    parser.add_argument("--sin-estratificar", action="store_true", help="Primera tirada al azar")
+    parser.add_argument("--almacen", help="Almacén en disco: reutiliza y amplía rollouts previos")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.id:
+            estado = EstadoJuego.desde_id_posicion(args.id, args.turno)
+        else:
+            estado = EstadoJuego()
+            estado.restablecer_inicio()
+            if args.turno == "NEGRAS":
+                estado.cambiar_turno()
+        opciones = {
+            "estrategia": args.estrategia,
+            "seed": args.seed,
+            "workers": args.workers,
+            "antitetica": not args.sin_antiteticos,
+            "estratificada": not args.sin_estratificar,
+            "ancho": args.ancho,
+        }
+        if args.almacen:
+            # pylint: disable=import-outside-toplevel
+            from cli.almacen_rollouts import AlmacenRollouts, rollout_almacenado
+
+            with AlmacenRollouts(args.almacen, escritura=True) as almacen:
+                res = rollout_almacenado(estado, almacen, pruebas=args.pruebas, **opciones)
+        else:
+            res = rollout(estado, pruebas=args.pruebas, **opciones)
+    except (ValueError, RuntimeError, ImportError, AttributeError) as exc:
+        parser.error(str(exc))
+    bajo, alto = res.intervalo()
+    print(f"Pruebas:      {res.pruebas} ({res.muestras} muestras) en {res.segundos:.2f} s")
+    print(f"Equidad:      {res.equidad:+.4f}  IC95% [{bajo:+.4f}, {alto:+.4f}]")
+    print(
+        f"Ganadas:      {res.ganadas:.1%}  "
+        f"(gammons {res.gammons:.1%}, backgammons {res.backgammons:.1%})"
+    )
+    print(f"Perdidas por: gammon {res.gammons_contra:.1%}, backgammon {res.backgammons_contra:.1%}")
+    if res.detenido:
+        print("Cortado al alcanzar el ancho pedido.")
+    return 0
+
+
+__all__ = [
+    "COMPATIBLES",
+    "DadosRollout",
+    "PRIMERAS",
+    "ResultadoRollout",
+    "combinar",
+    "compatibles",
+    "rollout",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
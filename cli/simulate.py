@@ -0,0 +1,315 @@
+"""
+Simulación headless bot vs. bot (sin pygame).
+
+Uso:
+    python -m cli.simulate --games N --seed S --workers K [--blancas E] [--negras E]
+
+Las estrategias se eligen por nombre (ver ESTRATEGIAS) o como "paquete.modulo:funcion".
+Una estrategia recibe (estado, jugadas, rng) y devuelve una de las jugadas.
+Cada partida usa su propia semilla derivada de (seed, índice), así el resultado no
+depende de la cantidad de workers.
+"""
+
+from __future__ import annotations
+import argparse
+import importlib
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from core.dice import FlujoDados, tirar_par  # noqa: E402
+from cli.jugadas import aplicar_jugada, generar_jugadas  # noqa: E402
+from cli.state import EstadoJuego, Jugada  # noqa: E402
+
+Estrategia = Callable[[EstadoJuego, List[Jugada], random.Random], Jugada]
+
+# Tope de turnos por partida para no colgar la simulación con una estrategia defectuosa
+MAX_TURNOS = 5000
+
+
+def estrategia_aleatoria(_estado: EstadoJuego, jugadas: List[Jugada], rng: random.Random) -> Jugada:
+    """Elige una jugada legal al azar."""
+    return rng.choice(jugadas)
+
+
+def estrategia_primera(_estado: EstadoJuego, jugadas: List[Jugada], _rng: random.Random) -> Jugada:
+    """Siempre la primera jugada generada (determinista)."""
+    return jugadas[0]
+
+
+def _puntaje_golosa(estado: EstadoJuego) -> int:
+    """Borneadas y capturas suman; blots propios restan (visto por quien acaba de mover)."""
+    if estado.__turno__ == "BLANCAS":
+        propias, fuera, barra_rival = estado.__blancas__, estado.__fuera_blancas__, estado.__bar_negras__
+    else:
+        propias, fuera, barra_rival = estado.__negras__, estado.__fuera_negras__, estado.__bar_blancas__
+    blots = sum(1 for p in range(1, 25) if propias[p] == 1)
+    return 4 * fuera + 3 * barra_rival - blots
+
+
+def estrategia_golosa(estado: EstadoJuego, jugadas: List[Jugada], rng: random.Random) -> Jugada:
+    """Maximiza borneadas + capturas - blots de la posición resultante (desempata al azar)."""
+    mejor: List[Jugada] = []
+    mejor_puntaje: Optional[int] = None
+    for jugada in jugadas:
+        tokens = [estado.aplicar_paso(desde, pasos) for desde, pasos in jugada]
+        puntaje = _puntaje_golosa(estado)
+        for token in reversed(tokens):
+            estado.deshacer_paso(token)
+        if mejor_puntaje is None or puntaje > mejor_puntaje:
+            mejor, mejor_puntaje = [jugada], puntaje
+        elif puntaje == mejor_puntaje:
+            mejor.append(jugada)
+    return rng.choice(mejor)
+
+
+def estrategia_expectiminimax(estado: EstadoJuego, jugadas: List[Jugada], rng: random.Random) -> Jugada:
+    """Expectiminimax de 2 plies con poda top-6 (ver cli.busqueda)."""
+    from cli.busqueda import estrategia_expectiminimax as elegir  # pylint: disable=import-outside-toplevel
+    return elegir(estado, jugadas, rng)
+
+
+ESTRATEGIAS: Dict[str, Estrategia] = {
+    "aleatoria": estrategia_aleatoria,
+    "primera": estrategia_primera,
+    "golosa": estrategia_golosa,
+    "expectiminimax": estrategia_expectiminimax,
+}
+
+
+def resolver_estrategia(nombre: str) -> Estrategia:
+    """
+    Estrategia por nombre registrado o por ruta "paquete.modulo:funcion".
+    Parámetros: nombre (str)
+    Retorna: Estrategia
+    """
+    if nombre in ESTRATEGIAS:
+        return ESTRATEGIAS[nombre]
+    modulo, sep, funcion = nombre.partition(":")
+    if not sep:
+        raise ValueError(f"Estrategia desconocida: {nombre!r}")
+    return getattr(importlib.import_module(modulo), funcion)
+
+
+@dataclass
+class ResultadoPartida:
+    """
+    Resultado de una partida.
+      ganador (str|None): "BLANCAS", "NEGRAS" o None si se alcanzó MAX_TURNOS.
+      puntos (int): 1 simple, 2 gammon, 3 backgammon (0 sin ganador).
+      turnos (int): turnos jugados (incluye los pasados sin mover).
+      pasos (int): movimientos de ficha aplicados.
+    """
+
+    ganador: Optional[str]
+    puntos: int
+    turnos: int
+    pasos: int
+
+
+def puntos_victoria(estado: EstadoJuego, ganador: str) -> int:
+    """
+    1 simple, 2 gammon (el perdedor no borneó), 3 backgammon (además tiene fichas
+    en la barra o en la casa del ganador).
+    Parámetros: estado (EstadoJuego), ganador (str)
+    Retorna: int
+    """
+    if ganador == "BLANCAS":
+        fuera, barra, casa_ganador = estado.__fuera_negras__, estado.__bar_negras__, estado.__negras__[1:7]
+    else:
+        fuera, barra, casa_ganador = estado.__fuera_blancas__, estado.__bar_blancas__, estado.__blancas__[19:25]
+    if fuera > 0:
+        return 1
+    if barra > 0 or any(casa_ganador):
+        return 3
+    return 2
+
+
+def _ganador(estado: EstadoJuego) -> Optional[str]:
+    if estado.__fuera_blancas__ == 15:
+        return "BLANCAS"
+    if estado.__fuera_negras__ == 15:
+        return "NEGRAS"
+    return None
+
+
+def jugar_partida(
+    blancas: Estrategia,
+    negras: Estrategia,
+    rng: random.Random,
+    dados: Optional[FlujoDados] = None,
+) -> ResultadoPartida:
+    """
+    Juega una partida completa. La apertura se decide con un dado por jugador
+    (se repite si empatan) y quien gana mueve con esos dos valores.
+    Parámetros:
+      blancas, negras (Estrategia)
+      rng (random.Random): azar de las estrategias (y de los dados si no se pasa 'dados').
+      dados (FlujoDados|None): fuente de dados con buffer pregenerado.
+    Retorna: ResultadoPartida
+    """
+    fuente = dados if dados is not None else rng
+    estado = EstadoJuego()
+    estado.restablecer_inicio()
+    d1 = d2 = 0
+    while d1 == d2:
+        d1, d2 = tirar_par(fuente)
+    if d2 > d1:
+        estado.cambiar_turno()
+    estado.set_dados(d1, d2)
+    return jugar_desde(estado, blancas, negras, rng, fuente)
+
+
+def jugar_desde(
+    estado: EstadoJuego,
+    blancas: Estrategia,
+    negras: Estrategia,
+    rng: random.Random,
+    fuente,
+) -> ResultadoPartida:
+    """
+    Continúa una partida hasta el final desde 'estado' (con los dados del turno ya puestos).
+    Parámetros:
+      estado (EstadoJuego): se modifica.
+      blancas, negras (Estrategia), rng (random.Random)
+      fuente: dados para los turnos siguientes (FlujoDados, random.Random o cualquier
+        objeto con tirada()).
+    Retorna: ResultadoPartida
+    """
+    turnos = pasos = 0
+    while turnos < MAX_TURNOS:
+        turnos += 1
+        jugadas = generar_jugadas(estado)
+        if jugadas:
+            estrategia = blancas if estado.__turno__ == "BLANCAS" else negras
+            jugada = estrategia(estado, jugadas, rng)
+            aplicar_jugada(estado, jugada)
+            pasos += len(jugada)
+            ganador = _ganador(estado)
+            if ganador is not None:
+                return ResultadoPartida(ganador, puntos_victoria(estado, ganador), turnos, pasos)
+        if estado.hay_movimientos():
+            estado.cambiar_turno()  # no se pudieron usar todos los dados
+        estado.set_dados(*tirar_par(fuente))
+    return ResultadoPartida(None, 0, turnos, pasos)
+
+
+def semilla_partida(seed: int, indice: int) -> int:
+    """Semilla independiente para la partida 'indice' (estable ante cambios de workers)."""
+    return random.Random(seed * 1_000_003 + indice).getrandbits(64)
+
+
+def _jugar_bloque(args) -> List[ResultadoPartida]:
+    """Tarea del pool: juega las partidas [inicio, fin) con las estrategias por nombre."""
+    inicio, fin, seed, nombre_blancas, nombre_negras = args
+    blancas = resolver_estrategia(nombre_blancas)
+    negras = resolver_estrategia(nombre_negras)
+    return [
+        jugar_partida(
+            blancas,
+            negras,
+            random.Random(semilla_partida(seed, i)),
+            FlujoDados(seed, flujo=i, tam_buffer=512),
+        )
+        for i in range(inicio, fin)
+    ]
+
+
+def simular(
+    partidas: int,
+    seed: int = 0,
+    workers: int = 1,
+    blancas: str = "aleatoria",
+    negras: str = "aleatoria",
+) -> Dict[str, float]:
+    """
+    Juega 'partidas' repartidas en 'workers' procesos y devuelve el resumen.
+    Parámetros: partidas (int), seed (int), workers (int), blancas (str), negras (str)
+    Retorna: Dict[str, float]
+    """
+    if partidas <= 0:
+        raise ValueError("La cantidad de partidas debe ser positiva.")
+    if workers <= 0:
+        raise ValueError("La cantidad de workers debe ser positiva.")
+    resolver_estrategia(blancas)
+    resolver_estrategia(negras)
+
+    # Bloques chicos para repartir la carga aunque las partidas duren distinto
+    tam = max(1, min(50, partidas // (workers * 4) or 1))
+    bloques = [
+        (i, min(i + tam, partidas), seed, blancas, negras) for i in range(0, partidas, tam)
+    ]
+    t0 = time.perf_counter()
+    if workers == 1:
+        resultados = [r for b in bloques for r in _jugar_bloque(b)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            resultados = [r for lote in pool.map(_jugar_bloque, bloques) for r in lote]
+    segundos = time.perf_counter() - t0
+    return resumir(resultados, segundos)
+
+
+def resumir(resultados: Sequence[ResultadoPartida], segundos: float) -> Dict[str, float]:
+    """
+    Tasas y promedios a partir de los resultados individuales.
+    Parámetros: resultados (Sequence[ResultadoPartida]), segundos (float)
+    Retorna: Dict[str, float]
+    """
+    n = len(resultados)
+    segundos = max(segundos, 1e-9)
+    pasos = sum(r.pasos for r in resultados)
+    return {
+        "partidas": n,
+        "segundos": segundos,
+        "partidas_por_seg": n / segundos,
+        "pasos_por_seg": pasos / segundos,
+        "victorias_blancas": sum(r.ganador == "BLANCAS" for r in resultados) / n,
+        "victorias_negras": sum(r.ganador == "NEGRAS" for r in resultados) / n,
+        "gammons": sum(r.puntos == 2 for r in resultados) / n,
+        "backgammons": sum(r.puntos == 3 for r in resultados) / n,
+        "sin_terminar": sum(r.ganador is None for r in resultados) / n,
+        "turnos_promedio": sum(r.turnos for r in resultados) / n,
+        "pasos_promedio": pasos / n,
+    }
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    Parser de argumentos e impresión del resumen.
+    """
+    parser = argparse.ArgumentParser(description="Backgammon - simulación bot vs bot")
+    parser.add_argument("--games", type=int, default=100, help="Cantidad de partidas")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla base")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos en paralelo")
+    parser.add_argument("--blancas", default="aleatoria", help="Estrategia de BLANCAS")
+    parser.add_argument("--negras", default="aleatoria", help="Estrategia de NEGRAS")
+    args = parser.parse_args(argv)
+
+    try:
+        res = simular(args.games, args.seed, args.workers, args.blancas, args.negras)
+    except (ValueError, ImportError, AttributeError) as exc:
+        parser.error(str(exc))
+    print(f"Partidas:            {res['partidas']:.0f} en {res['segundos']:.2f} s")
+    print(f"Partidas/seg:        {res['partidas_por_seg']:,.1f}")
+    print(f"Movimientos/seg:     {res['pasos_por_seg']:,.0f}")
+    print(f"Victorias BLANCAS:   {res['victorias_blancas']:.1%}")
+    print(f"Victorias NEGRAS:    {res['victorias_negras']:.1%}")
+    print(f"Gammons:             {res['gammons']:.1%}")
+    print(f"Backgammons:         {res['backgammons']:.1%}")
+    if res["sin_terminar"]:
+        print(f"Sin terminar:        {res['sin_terminar']:.1%}")
+    print(f"Turnos por partida:  {res['turnos_promedio']:.1f}")
+    print(f"Movimientos/partida: {res['pasos_promedio']:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,8 +5,20 @@ Estado y operaciones básicas del Backgammon (independiente de UI).
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Literal
 
+from core import position_id, zobrist
+
 
 Turno = Literal["BLANCAS", "NEGRAS"]
+# Token de aplicar_paso(): (desde, hasta, capturo)
+Paso = Tuple[int, int, bool]
+# Jugada completa: secuencia de (desde, pasos); desde == BARRA para reingresar
+Jugada = Tuple[Tuple[int, int], ...]
+
+BARRA = -1
+
+_Z = zobrist.TABLA
+_ZE = zobrist.TABLA_ESPEJO
+_ZO = zobrist.MAX_FICHAS  # desplazamiento del conteo 0 en cada fila de _Z
 
 
 @dataclass
@@ -21,6 +33,22 @@ class EstadoJuego:
       __turno__ (Turno): "BLANCAS" o "NEGRAS".
       __dados__ (Tuple[int,int]): Última tirada.
       __movimientos_pendientes__ (List[int]): Movimientos disponibles (expande dobles).
+      __zobrist__ (int): Clave Zobrist incremental (compartida con core.board, incluye turno).
+      __zobrist_espejo__ (int): Clave (sin turno) de la posición con colores intercambiados.
+      __pips__ (List[int]): Pip count [blancas, negras] (barra = 25), incremental.
+      __atras__ (List[int]): Ficha más atrasada [blancas, negras] medida en pips desde la
+        salida de cada jugador (25 = barra, 0 = sin fichas en juego), incremental.
+      __fuera_casa__ (List[int]): Fichas [blancas, negras] en puntos fuera de la casa propia
+        (sin contar la barra), incremental.
+      __lejano_casa__ (List[int]): Distancia 1..6 del punto de casa ocupado más lejano a la
+        salida [blancas, negras] (0 = casa vacía), incremental.
+
+    IMPORTANTE: las claves Zobrist, pips, fichas más atrasadas y el resumen de casa
+    (__fuera_casa__, __lejano_casa__, de los que dependen el borneo y paso_legal) sólo se
+    mantienen al mover con los métodos de la clase (aplicar_paso, mover, reingresar,
+    cargar_slots...). Si se editan __blancas__, __negras__, la barra o las borneadas a
+    mano, hay que llamar a recalcular_derivados() antes de volver a usar el estado; si no,
+    las reglas de borneo y las claves quedan desactualizadas sin ningún error.
     """
 
     __blancas__: List[int] = field(default_factory=lambda: [0] * 25)
@@ -32,6 +60,27 @@ class EstadoJuego:
     __turno__: Turno = "BLANCAS"
     __dados__: Tuple[int, int] = (0, 0)
     __movimientos_pendientes__: List[int] = field(default_factory=list)
+    __zobrist__: int = field(default=0, init=False, repr=False, compare=False)
+    __zobrist_espejo__: int = field(default=0, init=False, repr=False, compare=False)
+    __pips__: List[int] = field(
+        default_factory=lambda: [0, 0], init=False, repr=False, compare=False
+    )
+    __atras__: List[int] = field(
+        default_factory=lambda: [0, 0], init=False, repr=False, compare=False
+    )
+    __fuera_casa__: List[int] = field(
+        default_factory=lambda: [0, 0], init=False, repr=False, compare=False
+    )
+    __lejano_casa__: List[int] = field(
+        default_factory=lambda: [0, 0], init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """
+        Calcula la clave Zobrist inicial a partir de los campos recibidos.
+        Retorna: None
+        """
+        self.recalcular_derivados()
 
     def restablecer_inicio(self) -> None:
         """
@@ -57,6 +106,196 @@ class EstadoJuego:
         self.__turno__ = "BLANCAS"
         self.__dados__ = (0, 0)
         self.__movimientos_pendientes__.clear()
+        self.recalcular_derivados()
+
+    def conteos_slots(self) -> List[int]:
+        """
+        Proyección a los 28 slots de core.board (punto p -> slot 24 - p, + blancas, - negras).
+        Retorna: List[int]
+        """
+        slots = [self.__blancas__[24 - i] - self.__negras__[24 - i] for i in range(24)]
+        slots += [self.__bar_blancas__, self.__bar_negras__, self.__fuera_blancas__, self.__fuera_negras__]
+        return slots
+
+    def cargar_slots(self, slots: List[int]) -> None:
+        """
+        Carga fichas desde los 28 slots de core.board (inversa de conteos_slots()).
+        No modifica turno ni dados.
+        Parámetros: slots (List[int])
+        Retorna: None
+        """
+        self.__blancas__ = [0] * 25
+        self.__negras__ = [0] * 25
+        for i in range(24):
+            if slots[i] > 0:
+                self.__blancas__[24 - i] = slots[i]
+            elif slots[i] < 0:
+                self.__negras__[24 - i] = -slots[i]
+        self.__bar_blancas__, self.__bar_negras__ = slots[24], slots[25]
+        self.__fuera_blancas__, self.__fuera_negras__ = slots[26], slots[27]
+        self.recalcular_derivados()
+
+    def clave_posicion(self) -> bytes:
+        """
+        Position ID binario de 10 bytes desde la perspectiva del jugador en turno.
+        Retorna: bytes
+        """
+        return position_id.codificar_slots(self.conteos_slots(), self.__turno__ == "NEGRAS")
+
+    def id_posicion(self) -> str:
+        """
+        Position ID en texto (base64, 14 caracteres).
+        Retorna: str
+        """
+        return position_id.a_texto(self.clave_posicion())
+
+    @classmethod
+    def desde_id_posicion(cls, clave, turno: Turno = "BLANCAS") -> "EstadoJuego":
+        """
+        Crea un estado desde un Position ID (texto o bytes) con el turno indicado.
+        Parámetros: clave (str|bytes), turno (Turno)
+        Retorna: EstadoJuego
+        """
+        if turno not in ("BLANCAS", "NEGRAS"):
+            raise ValueError(f"Turno inválido: {turno}")
+        if isinstance(clave, str):
+            clave = position_id.desde_texto(clave)
+        estado = cls(__turno__=turno)
+        estado.cargar_slots(position_id.decodificar_slots(clave, turno == "NEGRAS"))
+        return estado
+
+    def clave_zobrist(self) -> int:
+        """
+        Clave Zobrist de 64 bits de la posición y el turno (mantenida incrementalmente).
+        Retorna: int
+        """
+        return self.__zobrist__
+
+    def clave_canonica(self) -> int:
+        """
+        Clave de la posición vista por quien tira, como si jugara con blancas: coincide
+        para una posición y su espejo con el turno del otro color (ver core.canonico).
+        Retorna: int
+        """
+        if self.__turno__ == "BLANCAS":
+            return self.__zobrist__
+        return self.__zobrist_espejo__
+
+    def recalcular_derivados(self) -> int:
+        """
+        Reconstruye desde cero todo el estado derivado: claves Zobrist, pips, fichas más
+        atrasadas y resumen de casa. Obligatorio tras editar los campos a mano.
+        Retorna: int (la clave Zobrist)
+        """
+        slots = self.conteos_slots()
+        self.__zobrist__ = zobrist.clave_slots(slots, self.__turno__ == "NEGRAS")
+        self.__zobrist_espejo__ = zobrist.clave_espejo_slots(slots)
+        self.__recalcular_carrera__()
+        return self.__zobrist__
+
+    def recalcular_zobrist(self) -> int:
+        """Alias de recalcular_derivados() (reconstruye también pips y resumen de casa)."""
+        return self.recalcular_derivados()
+
+    def pips(self, jugador: Turno) -> int:
+        """
+        Pip count de jugador (barra = 25), mantenido incrementalmente.
+        Parámetros: jugador (Turno)
+        Retorna: int
+        """
+        return self.__pips__[0 if jugador == "BLANCAS" else 1]
+
+    def punto_mas_atrasado(self, jugador: Turno) -> int:
+        """
+        Distancia en pips de la ficha más atrasada de jugador (25 = barra, 0 = ninguna).
+        Parámetros: jugador (Turno)
+        Retorna: int
+        """
+        return self.__atras__[0 if jugador == "BLANCAS" else 1]
+
+    def es_carrera(self) -> bool:
+        """
+        True si ya no hay contacto: todas las fichas de cada lado pasaron a las del rival.
+        Retorna: bool
+        """
+        return self.__atras__[0] + self.__atras__[1] < 25
+
+    is_race = es_carrera
+
+    def __recalcular_carrera__(self) -> None:
+        """
+        Reconstruye el estado derivado (pips, fichas más atrasadas, resumen de casa)
+        recorriendo el tablero.
+        Retorna: None
+        """
+        self.__pips__ = [
+            sum(p * n for p, n in enumerate(self.__blancas__)) + 25 * self.__bar_blancas__,
+            sum((25 - p) * n for p, n in enumerate(self.__negras__)) + 25 * self.__bar_negras__,
+        ]
+        self.__atras__ = [self.__buscar_atras__("BLANCAS", 25), self.__buscar_atras__("NEGRAS", 25)]
+        self.__fuera_casa__ = [sum(self.__blancas__[7:25]), sum(self.__negras__[1:19])]
+        self.__lejano_casa__ = [
+            self.__buscar_atras__("BLANCAS", 6),
+            self.__buscar_atras__("NEGRAS", 6),
+        ]
+
+    def __buscar_atras__(self, jugador: Turno, desde: int) -> int:
+        """
+        Primera distancia <= 'desde' con fichas de jugador (25 = barra), o 0.
+        Parámetros: jugador (Turno), desde (int)
+        Retorna: int
+        """
+        if desde >= 25:
+            if self.__bar_blancas__ if jugador == "BLANCAS" else self.__bar_negras__:
+                return 25
+            desde = 24
+        if jugador == "BLANCAS":
+            arreglo = self.__blancas__
+            for p in range(desde, 0, -1):
+                if arreglo[p] > 0:
+                    return p
+            return 0
+        arreglo = self.__negras__
+        for d in range(desde, 0, -1):
+            if arreglo[25 - d] > 0:
+                return d
+        return 0
+
+    def __sumar_carrera__(self, jugador: Turno, distancia: int, delta: int) -> None:
+        """
+        Ajusta el estado derivado tras sumar 'delta' fichas a 'distancia' pips de la
+        salida (1..6 = casa, 25 = barra). Sólo recorre el tablero si se vacía la
+        posición más atrasada o el punto de casa más lejano.
+        Parámetros: jugador (Turno), distancia (int), delta (int)
+        Retorna: None
+        """
+        if not delta:
+            return
+        lado = 0 if jugador == "BLANCAS" else 1
+        self.__pips__[lado] += delta * distancia
+        atras = self.__atras__
+        if delta > 0:
+            if distancia > atras[lado]:
+                atras[lado] = distancia
+        elif distancia == atras[lado]:
+            atras[lado] = self.__buscar_atras__(jugador, distancia)
+        if distancia > 6:
+            if distancia < 25:
+                self.__fuera_casa__[lado] += delta
+        elif delta > 0:
+            if distancia > self.__lejano_casa__[lado]:
+                self.__lejano_casa__[lado] = distancia
+        elif distancia == self.__lejano_casa__[lado]:
+            self.__lejano_casa__[lado] = self.__buscar_atras__(jugador, distancia)
+
+    def __verificar_zobrist__(self) -> None:
+        """
+        Modo depuración: compara la clave incremental con el recálculo completo.
+        Retorna: None
+        """
+        slots = self.conteos_slots()
+        zobrist.comprobar(self.__zobrist__, zobrist.clave_slots(slots, self.__turno__ == "NEGRAS"))
+        zobrist.comprobar(self.__zobrist_espejo__, zobrist.clave_espejo_slots(slots))
 
     def set_dados(self, d1: int, d2: int) -> None:
         """
@@ -99,6 +338,7 @@ class EstadoJuego:
         Retorna: None
         """
         self.__turno__ = "NEGRAS" if self.__turno__ == "BLANCAS" else "BLANCAS"
+        self.__zobrist__ ^= zobrist.TURNO_NEGRAS
         self.__dados__ = (0, 0)
         self.__movimientos_pendientes__.clear()
 
@@ -142,35 +382,78 @@ class EstadoJuego:
         if not (1 <= punto <= 24):
             raise ValueError("Punto fuera de rango.")
         if jugador == "BLANCAS":
+            previo = self.__blancas__[punto]
+            antes = previo - self.__negras__[punto]
+            despues = antes + valor - previo
             self.__blancas__[punto] = valor
+            distancia = punto
         else:
+            previo = self.__negras__[punto]
+            antes = self.__blancas__[punto] - previo
+            despues = antes - valor + previo
             self.__negras__[punto] = valor
+            distancia = 25 - punto
+        # Claves inline (camino caliente de aplicar_paso/deshacer_paso)
+        fila, espejo = _Z[24 - punto], _ZE[24 - punto]
+        self.__zobrist__ ^= fila[antes + _ZO] ^ fila[despues + _ZO]
+        self.__zobrist_espejo__ ^= espejo[antes + _ZO] ^ espejo[despues + _ZO]
+        if valor != previo:
+            self.__sumar_carrera__(jugador, distancia, valor - previo)
+
+    def __sumar_barra__(self, jugador: Turno, cantidad: int) -> None:
+        """
+        Suma 'cantidad' a la barra de jugador actualizando la clave.
+        Parámetros: jugador (Turno), cantidad (int)
+        Retorna: None
+        """
+        if jugador == "BLANCAS":
+            antes = self.__bar_blancas__
+            self.__bar_blancas__ = antes + cantidad
+            self.__zobrist__ ^= zobrist.delta(24, antes, antes + cantidad)
+            self.__zobrist_espejo__ ^= zobrist.delta_espejo(24, antes, antes + cantidad)
+        else:
+            antes = self.__bar_negras__
+            self.__bar_negras__ = antes + cantidad
+            self.__zobrist__ ^= zobrist.delta(25, antes, antes + cantidad)
+            self.__zobrist_espejo__ ^= zobrist.delta_espejo(25, antes, antes + cantidad)
+        self.__sumar_carrera__(jugador, 25, cantidad)
+
+    def __sumar_fuera__(self, jugador: Turno, cantidad: int) -> None:
+        """
+        Suma 'cantidad' a las fichas borneadas de jugador actualizando la clave.
+        Parámetros: jugador (Turno), cantidad (int)
+        Retorna: None
+        """
+        if jugador == "BLANCAS":
+            antes = self.__fuera_blancas__
+            self.__fuera_blancas__ = antes + cantidad
+            self.__zobrist__ ^= zobrist.delta(26, antes, antes + cantidad)
+            self.__zobrist_espejo__ ^= zobrist.delta_espejo(26, antes, antes + cantidad)
+        else:
+            antes = self.__fuera_negras__
+            self.__fuera_negras__ = antes + cantidad
+            self.__zobrist__ ^= zobrist.delta(27, antes, antes + cantidad)
+            self.__zobrist_espejo__ ^= zobrist.delta_espejo(27, antes, antes + cantidad)
 
     def __todos_en_casa__(self, jugador: Turno) -> bool:
         """
         Verifica si todas las fichas de jugador están en su casa (o fuera/barra).
+        O(1): usa el conteo de fichas fuera de casa mantenido incrementalmente.
         Parámetros: jugador (Turno)
         Retorna: bool
         """
-        puntos_fuera = (range(7, 25) if jugador == "BLANCAS" else range(1, 19))
-        arreglo = self.__blancas__ if jugador == "BLANCAS" else self.__negras__
-        for p in puntos_fuera:
-            if arreglo[p] > 0:
-                return False
-        return True
+        return not self.__fuera_casa__[0 if jugador == "BLANCAS" else 1]
 
     def __punto_mas_lejano_en_casa__(self, jugador: Turno) -> Optional[int]:
         """
-        Punto propio en casa más lejano a la salida (para overshoot).
+        Punto propio en casa más lejano a la salida (para overshoot), sin recorrer la casa.
         Parámetros: jugador (Turno)
         Retorna: Optional[int]
         """
-        puntos = (range(6, 0, -1) if jugador == "BLANCAS" else range(19, 25))
-        arreglo = self.__blancas__ if jugador == "BLANCAS" else self.__negras__
-        for p in puntos:
-            if arreglo[p] > 0:
-                return p
-        return None
+        if jugador == "BLANCAS":
+            return self.__lejano_casa__[0] or None
+        distancia = self.__lejano_casa__[1]
+        return 25 - distancia if distancia else None
 
     def puede_mover(self, desde: int, pasos: int) -> bool:
         """
@@ -182,20 +465,37 @@ class EstadoJuego:
             return False
         if not (1 <= desde <= 24):
             return False
+        return self.paso_legal(desde, pasos)
+
+    def paso_legal(self, desde: int, pasos: int) -> bool:
+        """
+        Valida un paso del jugador en turno sin mirar los dados pendientes.
+        'desde' puede ser BARRA (-1) para reingresar.
+        Parámetros: desde (int), pasos (int)
+        Retorna: bool
+        """
         jugador = self.__turno__
-        oponente = self.__oponente__()
-        if self.__conteo__(jugador, desde) <= 0:
+        blancas = jugador == "BLANCAS"
+        propias, rivales = self.__blancas__, self.__negras__
+        if not blancas:
+            propias, rivales = rivales, propias
+        if desde == BARRA:
+            en_barra = self.__bar_blancas__ if blancas else self.__bar_negras__
+            if en_barra <= 0 or not (1 <= pasos <= 6):
+                return False
+            destino = (25 - pasos) if blancas else pasos
+            # Bloqueado si hay 2+ del oponente
+            return rivales[destino] < 2
+
+        if not (1 <= desde <= 24) or propias[desde] <= 0:
             return False
 
-        direccion = self.__dir__()
-        hasta = desde + direccion * pasos
+        hasta = desde - pasos if blancas else desde + pasos
 
         # Movimiento dentro del tablero
         if 1 <= hasta <= 24:
             # Bloqueado si hay 2+ fichas del oponente
-            if self.__conteo__(oponente, hasta) >= 2:
-                return False
-            return True
+            return rivales[hasta] < 2
 
         # Intento de borne-off
         if not self.__todos_en_casa__(jugador):
@@ -216,45 +516,75 @@ class EstadoJuego:
                 return (dist == pasos) or (desde == punto_lejano and dist < pasos)
         return False
 
-    def mover(self, desde: int, pasos: int) -> None:
+    def aplicar_paso(self, desde: int, pasos: int) -> Paso:
         """
-        Ejecuta el movimiento (captura y borne-off incluidos).
+        Ejecuta un paso ya validado del jugador en turno, sin consumir dados ni cambiar turno.
+        'desde' puede ser BARRA (-1). Devuelve el token para deshacer_paso().
         Parámetros: desde (int), pasos (int)
-        Retorna: None
+        Retorna: Paso (desde, hasta, capturo)
         """
-        if not self.puede_mover(desde, pasos):
-            raise ValueError("Movimiento inválido.")
-
         jugador = self.__turno__
-        oponente = self.__oponente__()
-        direccion = self.__dir__()
-        hasta = desde + direccion * pasos
-
-        # Salida del punto origen
-        self.__set_conteo__(jugador, desde, self.__conteo__(jugador, desde) - 1)
+        blancas = jugador == "BLANCAS"
+        oponente = "NEGRAS" if blancas else "BLANCAS"
+        propias, rivales = self.__blancas__, self.__negras__
+        if not blancas:
+            propias, rivales = rivales, propias
+
+        # Salida del punto origen (o de la barra)
+        if desde == BARRA:
+            self.__sumar_barra__(jugador, -1)
+            hasta = (25 - pasos) if blancas else pasos
+        else:
+            self.__set_conteo__(jugador, desde, propias[desde] - 1)
+            hasta = desde - pasos if blancas else desde + pasos
 
+        capturo = False
         # Dentro del tablero: aplicar captura si hay blote
         if 1 <= hasta <= 24:
-            if self.__conteo__(oponente, hasta) == 1:
+            if rivales[hasta] == 1:
                 # Captura
                 self.__set_conteo__(oponente, hasta, 0)
-                if oponente == "BLANCAS":
-                    self.__bar_blancas__ += 1
-                else:
-                    self.__bar_negras__ += 1
+                self.__sumar_barra__(oponente, 1)
+                capturo = True
             # Colocar ficha
-            self.__set_conteo__(jugador, hasta, self.__conteo__(jugador, hasta) + 1)
+            self.__set_conteo__(jugador, hasta, propias[hasta] + 1)
         else:
             # Borne-off
-            if jugador == "BLANCAS":
-                self.__fuera_blancas__ += 1
-            else:
-                self.__fuera_negras__ += 1
+            self.__sumar_fuera__(jugador, 1)
+        return (desde, hasta, capturo)
 
-        # Consumir dado usado
-        self.__movimientos_pendientes__.remove(pasos)
-        if not self.hay_movimientos():
-            self.cambiar_turno()
+    def deshacer_paso(self, token: Paso) -> None:
+        """
+        Revierte exactamente un aplicar_paso() del jugador en turno.
+        Parámetros: token (Paso)
+        Retorna: None
+        """
+        desde, hasta, capturo = token
+        jugador = self.__turno__
+        propias = self.__blancas__ if jugador == "BLANCAS" else self.__negras__
+        if 1 <= hasta <= 24:
+            self.__set_conteo__(jugador, hasta, propias[hasta] - 1)
+            if capturo:
+                oponente = self.__oponente__()
+                self.__sumar_barra__(oponente, -1)
+                self.__set_conteo__(oponente, hasta, 1)
+        else:
+            self.__sumar_fuera__(jugador, -1)
+        if desde == BARRA:
+            self.__sumar_barra__(jugador, 1)
+        else:
+            self.__set_conteo__(jugador, desde, propias[desde] + 1)
+
+    def mover(self, desde: int, pasos: int) -> None:
+        """
+        Ejecuta el movimiento (captura y borne-off incluidos).
+        Parámetros: desde (int), pasos (int)
+        Retorna: None
+        """
+        if not self.puede_mover(desde, pasos):
+            raise ValueError("Movimiento inválido.")
+        self.aplicar_paso(desde, pasos)
+        self.__consumir__(pasos)
 
     def puede_reingresar(self, pasos: int) -> bool:
         """
@@ -264,22 +594,7 @@ class EstadoJuego:
         """
         if pasos not in self.__movimientos_pendientes__:
             return False
-        jugador = self.__turno__
-        oponente = self.__oponente__()
-        if jugador == "BLANCAS":
-            if self.__bar_blancas__ <= 0:
-                return False
-            destino = 25 - pasos  # 24..19
-        else:
-            if self.__bar_negras__ <= 0:
-                return False
-            destino = pasos  # 1..6
-        if not (1 <= destino <= 24):
-            return False
-        # Bloqueado si hay 2+ del oponente
-        if self.__conteo__(oponente, destino) >= 2:
-            return False
-        return True
+        return self.paso_legal(BARRA, pasos)
 
     def reingresar(self, pasos: int) -> None:
         """
@@ -289,29 +604,26 @@ class EstadoJuego:
         """
         if not self.puede_reingresar(pasos):
             raise ValueError("Reingreso inválido.")
+        self.aplicar_paso(BARRA, pasos)
+        self.__consumir__(pasos)
 
-        jugador = self.__turno__
-        oponente = self.__oponente__()
-        destino = (25 - pasos) if jugador == "BLANCAS" else pasos
-
-        # Bajar de la barra
-        if jugador == "BLANCAS":
-            self.__bar_blancas__ -= 1
-        else:
-            self.__bar_negras__ -= 1
-
-        # Captura si hay blote
-        if self.__conteo__(oponente, destino) == 1:
-            self.__set_conteo__(oponente, destino, 0)
-            if oponente == "BLANCAS":
-                self.__bar_blancas__ += 1
-            else:
-                self.__bar_negras__ += 1
-
-        # Colocar ficha
-        self.__set_conteo__(jugador, destino, self.__conteo__(jugador, destino) + 1)
-
-        # Consumir movimiento
+    def __consumir__(self, pasos: int) -> None:
+        """
+        Consume el dado usado y pasa el turno si no quedan movimientos.
+        Parámetros: pasos (int)
+        Retorna: None
+        """
         self.__movimientos_pendientes__.remove(pasos)
         if not self.hay_movimientos():
             self.cambiar_turno()
+        if zobrist.VERIFICAR:
+            self.__verificar_zobrist__()
+
+    def jugadas_legales(self) -> List[Jugada]:
+        """
+        Jugadas completas legales para los movimientos pendientes (ver cli.jugadas),
+        servidas desde la caché de cli.cache_jugadas.
+        Retorna: List[Jugada]
+        """
+        from cli.cache_jugadas import jugadas_cacheadas  # pylint: disable=import-outside-toplevel
+        return jugadas_cacheadas(self, sitio="estado")
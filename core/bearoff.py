@@ -0,0 +1,285 @@
+"""
+Base de bearoff de un lado (hasta 15 fichas en los 6 puntos de casa).
+
+Para cada posición de casa guarda la distribución del número de tiradas que faltan
+para bornear todas las fichas, jugando cada tirada de forma que se minimice la
+cantidad esperada de tiradas.
+
+Índice: número combinatorio de la posición leída del punto 6 al 1
+(q = c6, c5, ..., c1): con b_i = q_1 + ... + q_i + (i - 1), índice = Σ C(b_i, i).
+No depende del máximo de fichas (una base chica es prefijo de una grande) y toda
+posición alcanzable tiene índice menor, así que la generación es una sola pasada.
+
+Archivo (little-endian, tamaño fijo):
+  cabecera de 16 bytes: b"BGBO1\\0\\0\\0", uint16 max_fichas, uint16 LARGO, uint32 posiciones
+  luego, por índice, LARGO float32: P(terminar en exactamente n tiradas), n = 0..LARGO-1.
+Las consultas leen con `mmap`, así todos los procesos comparten las mismas páginas.
+
+Uso:
+    python -m core.bearoff --salida bearoff1.bin [--fichas 15]
+"""
+
+from __future__ import annotations
+import argparse
+import mmap
+import os
+import struct
+from math import comb
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MAGIA = b"BGBO1\0\0\0"
+_CABECERA = struct.Struct("<8sHHI")
+LARGO = 32
+MAX_FICHAS = 15
+PUNTOS_CASA = 6
+RUTA_POR_DEFECTO = os.environ.get("BACKGAMMON_BEAROFF_DB", "bearoff1.bin")
+
+_TIRADAS: Tuple[Tuple[int, int, float], ...] = tuple(
+    (a, b, (1 if a == b else 2) / 36) for a in range(1, 7) for b in range(a, 7)
+)
+
+
+def posiciones_totales(max_fichas: int) -> int:
+    """Cantidad de posiciones con hasta 'max_fichas' en 6 puntos: C(max_fichas + 6, 6)."""
+    return comb(max_fichas + PUNTOS_CASA, PUNTOS_CASA)
+
+
+def indice(puntos: Sequence[int]) -> int:
+    """
+    Índice de una posición de casa.
+    Parámetros: puntos (Sequence[int]): fichas en los puntos 1..6 (6 valores).
+    Retorna: int
+    """
+    if len(puntos) != PUNTOS_CASA or any(c < 0 for c in puntos):
+        raise ValueError(f"Posición de bearoff inválida: {puntos}")
+    total, rango = -1, 0
+    for i, c in enumerate(reversed(puntos), start=1):
+        total += c + 1
+        rango += comb(total, i)
+    return rango
+
+
+def _pasos(puntos: Tuple[int, ...], dado: int) -> List[Tuple[int, ...]]:
+    """Posiciones tras usar un dado (índices 0..5 = puntos 1..6)."""
+    if not any(puntos):
+        return [puntos]
+    alto = max(i for i in range(PUNTOS_CASA) if puntos[i])
+    out = []
+    for i in range(PUNTOS_CASA):
+        if not puntos[i]:
+            continue
+        destino = i - dado
+        if destino >= 0:
+            nuevo = list(puntos)
+            nuevo[i] -= 1
+            nuevo[destino] += 1
+            out.append(tuple(nuevo))
+        elif destino == -1 or i == alto:
+            nuevo = list(puntos)
+            nuevo[i] -= 1
+            out.append(tuple(nuevo))
+    return out
+
+
+def _todas(max_fichas: int) -> List[Tuple[int, ...]]:
+    """Todas las posiciones ordenadas por índice."""
+    out: List[Tuple[int, ...]] = [()] * posiciones_totales(max_fichas)
+
+    def rec(prefijo: List[int], resto: int) -> None:
+        if len(prefijo) == PUNTOS_CASA:
+            pos = tuple(prefijo)
+            out[indice(pos)] = pos
+            return
+        for c in range(resto + 1):
+            prefijo.append(c)
+            rec(prefijo, resto - c)
+            prefijo.pop()
+
+    rec([], max_fichas)
+    return out
+
+
+def generar_distribuciones(max_fichas: int = MAX_FICHAS):
+    """
+    Calcula las distribuciones en memoria (una pasada en orden de índice).
+    Parámetros: max_fichas (int)
+    Retorna: np.ndarray (posiciones, LARGO) float64
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if not 0 <= max_fichas <= MAX_FICHAS:
+        raise ValueError(f"max_fichas debe estar entre 0 y {MAX_FICHAS}.")
+    posiciones = _todas(max_fichas)
+    n = len(posiciones)
+    dist = np.zeros((n, LARGO))
+    media = np.zeros(n)
+    dist[0, 0] = 1.0
+    # mejor[k][d][i] = (media, índice) mínima tras k pasos de 'd' desde la posición i
+    mejor: Dict[int, Dict[int, List[Tuple[float, int]]]] = {
+        k: {d: [(0.0, 0)] * n for d in range(1, 7)} for k in range(1, 4)
+    }
+    pasos_de: List[Dict[int, List[int]]] = [dict() for _ in range(n)]
+
+    for i in range(n):
+        pos = posiciones[i]
+        pasos_de[i] = {d: [indice(s) for s in _pasos(pos, d)] for d in range(1, 7)}
+        if i:
+            destinos = []
+            pesos = []
+            for a, b, prob in _TIRADAS:
+                if a == b:
+                    # 4 pasos: el primero desde acá, los otros 3 ya precalculados
+                    elegido = min(mejor[3][a][s] for s in pasos_de[i][a])[1]
+                else:
+                    elegido = min(
+                        min(mejor[1][b][s] for s in pasos_de[i][a]),
+                        min(mejor[1][a][s] for s in pasos_de[i][b]),
+                    )[1]
+                destinos.append(elegido)
+                pesos.append(prob)
+            pesos_arr = np.array(pesos)
+            dist[i, 1:] = pesos_arr @ dist[destinos, :-1]
+            media[i] = 1.0 + pesos_arr @ media[destinos]
+            if dist[i].sum() < 1 - 1e-9:
+                raise RuntimeError(f"LARGO={LARGO} no alcanza para la posición {pos}.")
+        for d in range(1, 7):
+            mejor[1][d][i] = min((media[s], s) for s in pasos_de[i][d])
+            mejor[2][d][i] = min(mejor[1][d][s] for s in pasos_de[i][d])
+            mejor[3][d][i] = min(mejor[2][d][s] for s in pasos_de[i][d])
+    return dist
+
+
+def generar(ruta: str, max_fichas: int = MAX_FICHAS) -> int:
+    """
+    Genera el archivo de la base (escritura atómica).
+    Parámetros: ruta (str), max_fichas (int)
+    Retorna: int (posiciones escritas)
+    """
+    dist = generar_distribuciones(max_fichas)
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(_CABECERA.pack(MAGIA, max_fichas, LARGO, len(dist)))
+        archivo.write(dist.astype("<f4").tobytes())
+    os.replace(temporal, ruta)
+    return len(dist)
+
+
+class BaseBearoff:
+    """
+    Consultas sobre el archivo de bearoff mapeado en memoria (sólo lectura).
+
+    Atributos (todos dunder):
+      __archivo__, __mapa__ (mmap.mmap): archivo abierto y su mapeo.
+      __max_fichas__ (int), __posiciones__ (int): datos de la cabecera.
+    """
+
+    _FILA = struct.Struct(f"<{LARGO}f")
+
+    def __init__(self, ruta: Optional[str] = None) -> None:
+        """Abre y mapea la base (por defecto BACKGAMMON_BEAROFF_DB o bearoff1.bin)."""
+        ruta = ruta or RUTA_POR_DEFECTO
+        self.__archivo__ = open(ruta, "rb")  # pylint: disable=consider-using-with
+        try:
+            self.__mapa__ = mmap.mmap(self.__archivo__.fileno(), 0, access=mmap.ACCESS_READ)
+            magia, max_fichas, largo, posiciones = _CABECERA.unpack_from(self.__mapa__, 0)
+            if magia != MAGIA or largo != LARGO:
+                raise ValueError(f"{ruta} no es una base de bearoff válida.")
+            if len(self.__mapa__) != _CABECERA.size + posiciones * self._FILA.size:
+                raise ValueError(f"{ruta} está truncado.")
+        except Exception:
+            self.__archivo__.close()
+            raise
+        self.__max_fichas__ = max_fichas
+        self.__posiciones__ = posiciones
+
+    def __enter__(self) -> "BaseBearoff":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    def cerrar(self) -> None:
+        """Libera el mapeo y el archivo."""
+        self.__mapa__.close()
+        self.__archivo__.close()
+
+    @property
+    def max_fichas(self) -> int:
+        return self.__max_fichas__
+
+    def distribucion(self, puntos: Sequence[int]) -> Tuple[float, ...]:
+        """
+        P(terminar en exactamente n tiradas), n = 0..LARGO-1.
+        Parámetros: puntos (Sequence[int]): fichas en los puntos 1..6
+        Retorna: Tuple[float, ...]
+        """
+        if sum(puntos) > self.__max_fichas__:
+            raise ValueError(f"La base sólo cubre hasta {self.__max_fichas__} fichas.")
+        return self._FILA.unpack_from(self.__mapa__, _CABECERA.size + indice(puntos) * self._FILA.size)
+
+    def media(self, puntos: Sequence[int]) -> float:
+        """Cantidad esperada de tiradas para terminar."""
+        return sum(n * p for n, p in enumerate(self.distribucion(puntos)))
+
+    def probabilidad_ganar(self, en_turno: Sequence[int], rival: Sequence[int]) -> float:
+        """
+        Probabilidad de que gane quien tira primero en una carrera pura de bearoff
+        (gana si termina en n tiradas y el rival necesita n o más).
+        Parámetros: en_turno, rival (Sequence[int]): fichas en los puntos 1..6 de cada uno
+        Retorna: float
+        """
+        propia = self.distribucion(en_turno)
+        ajena = self.distribucion(rival)
+        cola = 0.0  # P(rival necesita >= n)
+        colas = [0.0] * (LARGO + 1)
+        for n in range(LARGO - 1, -1, -1):
+            cola += ajena[n]
+            colas[n] = cola
+        return sum(p * colas[n] for n, p in enumerate(propia))
+
+
+def puntos_casa(estado, jugador: str) -> Optional[Tuple[int, ...]]:
+    """
+    Fichas de 'jugador' en sus puntos 1..6 (desde su perspectiva), o None si tiene
+    fichas fuera de casa o en la barra.
+    Parámetros: estado (EstadoJuego), jugador ("BLANCAS"|"NEGRAS")
+    Retorna: Optional[Tuple[int, ...]]
+    """
+    if jugador == "BLANCAS":
+        if estado.__bar_blancas__ or any(estado.__blancas__[7:25]):
+            return None
+        return tuple(estado.__blancas__[1:7])
+    if estado.__bar_negras__ or any(estado.__negras__[1:19]):
+        return None
+    return tuple(estado.__negras__[25 - k] for k in range(1, 7))
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    Genera la base desde la línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description="Backgammon - base de bearoff de un lado")
+    parser.add_argument("--salida", default=RUTA_POR_DEFECTO, help="Archivo a generar")
+    parser.add_argument("--fichas", type=int, default=MAX_FICHAS, help="Máximo de fichas (<= 15)")
+    args = parser.parse_args(argv)
+    try:
+        n = generar(args.salida, args.fichas)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(f"{n} posiciones escritas en {args.salida}")
+    return 0
+
+
+__all__ = [
+    "BaseBearoff",
+    "generar",
+    "generar_distribuciones",
+    "indice",
+    "posiciones_totales",
+    "puntos_casa",
+    "LARGO",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
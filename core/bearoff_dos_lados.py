@@ -0,0 +1,199 @@
+"""
+Tabla exacta de bearoff de dos lados (por defecto hasta 6 fichas en 6 puntos por lado).
+
+W[a][b] = probabilidad de que gane quien está en turno con la casa 'a' contra la
+casa 'b' del rival, jugando ambos para maximizar esa probabilidad:
+    W[a][b] = Σ_tirada p · max_{a' tras la tirada} (1 - W[b][a'])   (W[b][vacía] = 0)
+Los índices son los de `core.bearoff.indice` (toda jugada baja el índice), así que
+la iteración k completa la fila W[k][·] con columnas ya calculadas y luego la
+columna W[·][k] con la fila recién hecha; cada paso se vectoriza con NumPy.
+
+Archivo (little-endian): cabecera b"BGBO2\\0\\0\\0", uint16 max_fichas, uint16 0,
+uint32 posiciones; luego la matriz posiciones x posiciones en uint16 (p · 65535)
+por filas. Las consultas son O(1) sobre un `mmap` de sólo lectura.
+
+Uso:
+    python -m core.bearoff_dos_lados --salida bearoff2.bin [--fichas 6]
+"""
+
+from __future__ import annotations
+import argparse
+import mmap
+import os
+import struct
+from typing import List, Optional, Sequence, Set, Tuple
+
+from core.bearoff import _TIRADAS, _pasos, _todas, indice, posiciones_totales, puntos_casa
+
+MAGIA = b"BGBO2\0\0\0"
+_CABECERA = struct.Struct("<8sHHI")
+_CELDA = struct.Struct("<H")
+ESCALA = 65535
+MAX_FICHAS = 6
+RUTA_POR_DEFECTO = os.environ.get("BACKGAMMON_BEAROFF2_DB", "bearoff2.bin")
+
+
+def _tras_tirada(pos: Tuple[int, ...], a: int, b: int) -> Set[int]:
+    """Índices alcanzables usando la tirada completa (ambos órdenes; dobles x4)."""
+    ordenes = [(a,) * 4] if a == b else [(a, b), (b, a)]
+    finales: Set[int] = set()
+    for orden in ordenes:
+        frontera = {pos}
+        for dado in orden:
+            frontera = {s for p in frontera for s in _pasos(p, dado)}
+        finales.update(indice(p) for p in frontera)
+    return finales
+
+
+def generar_matriz(max_fichas: int = MAX_FICHAS):
+    """
+    Calcula W en memoria.
+    Parámetros: max_fichas (int)
+    Retorna: np.ndarray (posiciones, posiciones) float64
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if not 1 <= max_fichas <= 15:
+        raise ValueError("max_fichas debe estar entre 1 y 15.")
+    posiciones = _todas(max_fichas)
+    n = len(posiciones)
+    pesos = np.array([p for _, _, p in _TIRADAS])
+    # sucesores[t] (n, m_t): índices tras la tirada t, rellenando con repetidos
+    listas: List[List[List[int]]] = [
+        [sorted(_tras_tirada(pos, a, b)) for pos in posiciones] for a, b, _ in _TIRADAS
+    ]
+    sucesores = []
+    for por_pos in listas:
+        m = max(len(s) for s in por_pos)
+        sucesores.append(np.array([s + [s[0]] * (m - len(s)) for s in por_pos]))
+
+    w = np.zeros((n, n))
+    w[0, :] = 1.0  # sin fichas en turno: ya ganó (nunca se consulta como posición real)
+    for k in range(1, n):
+        # Fila k: W[k][b] para todo b (usa columnas < k, ya completas)
+        fila = np.zeros(n)
+        for t, suc in enumerate(sucesores):
+            fila += pesos[t] * (1.0 - w[:, suc[k]]).max(axis=1)
+        w[k, :] = fila
+        w[k, 0] = 0.0
+        # Columna k: W[b][k] para b > k (usa la fila k)
+        col = np.zeros(n - k - 1)
+        for t, suc in enumerate(sucesores):
+            col += pesos[t] * (1.0 - w[k, suc[k + 1:]]).max(axis=1)
+        w[k + 1:, k] = col
+    return w
+
+
+def generar(ruta: str, max_fichas: int = MAX_FICHAS) -> int:
+    """
+    Genera el archivo de la tabla (escritura atómica).
+    Parámetros: ruta (str), max_fichas (int)
+    Retorna: int (posiciones por lado)
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    w = generar_matriz(max_fichas)
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(_CABECERA.pack(MAGIA, max_fichas, 0, len(w)))
+        archivo.write(np.rint(w * ESCALA).astype("<u2").tobytes())
+    os.replace(temporal, ruta)
+    return len(w)
+
+
+class TablaBearoffDosLados:
+    """
+    Consultas O(1) sobre la tabla mapeada en memoria.
+
+    Atributos (todos dunder):
+      __archivo__, __mapa__ (mmap.mmap): archivo abierto y su mapeo.
+      __max_fichas__ (int), __posiciones__ (int): datos de la cabecera.
+    """
+
+    def __init__(self, ruta: Optional[str] = None) -> None:
+        """Abre y mapea la tabla (por defecto BACKGAMMON_BEAROFF2_DB o bearoff2.bin)."""
+        ruta = ruta or RUTA_POR_DEFECTO
+        self.__archivo__ = open(ruta, "rb")  # pylint: disable=consider-using-with
+        try:
+            self.__mapa__ = mmap.mmap(self.__archivo__.fileno(), 0, access=mmap.ACCESS_READ)
+            magia, max_fichas, _, posiciones = _CABECERA.unpack_from(self.__mapa__, 0)
+            if magia != MAGIA or posiciones != posiciones_totales(max_fichas):
+                raise ValueError(f"{ruta} no es una tabla de bearoff de dos lados válida.")
+            if len(self.__mapa__) != _CABECERA.size + posiciones * posiciones * _CELDA.size:
+                raise ValueError(f"{ruta} está truncado.")
+        except Exception:
+            self.__archivo__.close()
+            raise
+        self.__max_fichas__ = max_fichas
+        self.__posiciones__ = posiciones
+
+    def __enter__(self) -> "TablaBearoffDosLados":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    def cerrar(self) -> None:
+        """Libera el mapeo y el archivo."""
+        self.__mapa__.close()
+        self.__archivo__.close()
+
+    @property
+    def max_fichas(self) -> int:
+        return self.__max_fichas__
+
+    def cubre(self, en_turno: Sequence[int], rival: Sequence[int]) -> bool:
+        """True si ambas casas están dentro de la tabla."""
+        return sum(en_turno) <= self.__max_fichas__ and sum(rival) <= self.__max_fichas__
+
+    def probabilidad_ganar(self, en_turno: Sequence[int], rival: Sequence[int]) -> float:
+        """
+        Probabilidad exacta de que gane quien tira (casas en puntos 1..6 de cada uno).
+        Parámetros: en_turno, rival (Sequence[int])
+        Retorna: float
+        """
+        if not self.cubre(en_turno, rival):
+            raise ValueError(f"La tabla sólo cubre hasta {self.__max_fichas__} fichas por lado.")
+        a, b = indice(en_turno), indice(rival)
+        if a == 0:
+            return 1.0
+        if b == 0:
+            return 0.0
+        celda = _CABECERA.size + (a * self.__posiciones__ + b) * _CELDA.size
+        return _CELDA.unpack_from(self.__mapa__, celda)[0] / ESCALA
+
+    def probabilidad_estado(self, estado) -> Optional[float]:
+        """
+        Probabilidad de ganar del jugador en turno de un EstadoJuego, o None si
+        alguna de las dos casas no está en bearoff o excede la tabla.
+        Parámetros: estado (EstadoJuego)
+        Retorna: Optional[float]
+        """
+        propia = puntos_casa(estado, estado.__turno__)
+        ajena = puntos_casa(estado, estado.__oponente__())
+        if propia is None or ajena is None or not self.cubre(propia, ajena):
+            return None
+        return self.probabilidad_ganar(propia, ajena)
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    Genera la tabla desde la línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description="Backgammon - tabla exacta de bearoff de dos lados")
+    parser.add_argument("--salida", default=RUTA_POR_DEFECTO, help="Archivo a generar")
+    parser.add_argument("--fichas", type=int, default=MAX_FICHAS, help="Máximo de fichas por lado")
+    args = parser.parse_args(argv)
+    try:
+        n = generar(args.salida, args.fichas)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(f"{n} x {n} posiciones escritas en {args.salida}")
+    return 0
+
+
+__all__ = ["TablaBearoffDosLados", "generar", "generar_matriz"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
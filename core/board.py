@@ -1,6 +1,9 @@
 """In-memory Backgammon board representation and basic rules/helpers."""
 from __future__ import annotations
-from typing import List, Dict, Optional
+from array import array
+from typing import List, Dict, Optional, Tuple
+
+from . import position_id, zobrist
 
 BLANCO = "blanco"
 NEGRO = "negro"
@@ -15,90 +18,347 @@ DIRECTION = {
     NEGRO:  -1,
 }
 
+# Disposición del arreglo de conteos: 0..23 puntos (con signo: + blancas, - negras),
+# luego barra y borneadas por color (sin signo).
+NUM_SLOTS = 28
+SLOT_BARRA = {BLANCO: 24, NEGRO: 25}
+SLOT_FUERA = {BLANCO: 26, NEGRO: 27}
+SIGNO = {BLANCO: +1, NEGRO: -1}
+
+# Movimientos para apply/undo: (origen, destino, color); origen BARRA = desde la barra,
+# destino FUERA = borne-off. El token guarda además si hubo captura.
+BARRA = -1
+FUERA = -2
+Movimiento = Tuple[int, int, str]
+TokenDeshacer = Tuple[int, int, str, bool]
+
+_INICIO = array("b", [0] * NUM_SLOTS)
+_INICIO[0] = 2
+_INICIO[11] = 5
+_INICIO[16] = 3
+_INICIO[18] = 5
+_INICIO[23] = -2
+_INICIO[12] = -5
+_INICIO[7] = -3
+_INICIO[5] = -5
+
+_Z = zobrist.TABLA
+_ZE = zobrist.TABLA_ESPEJO
+_ZO = zobrist.MAX_FICHAS  # desplazamiento del conteo 0 en cada fila de _Z
+# Deltas de un paso: _DZ[slot][v + _ZO] = clave(v) ^ clave(v + 1), ídem _DZE para el espejo
+_DZ = [[fila[i] ^ fila[i + 1] for i in range(2 * _ZO)] for fila in _Z]
+_DZE = [[fila[i] ^ fila[i + 1] for i in range(2 * _ZO)] for fila in _ZE]
+
+# Celdas de `points_snapshot` precalculadas por conteo con signo (se devuelven copias)
+_CELDAS = {
+    v: {"color": BLANCO if v > 0 else NEGRO if v < 0 else None, "cantidad": abs(v)}
+    for v in range(-15, 16)
+}
+_CLAVE_INICIO = zobrist.clave_slots(_INICIO)
+_CLAVE_ESPEJO_INICIO = zobrist.clave_espejo_slots(_INICIO)
+
+# Índices de `__pips__` / `__atras__` por color
+LADO = {BLANCO: 0, NEGRO: 1}
+
+
+def _buscar_atras(c, lado: int, desde: int) -> int:
+    """Primera distancia <= `desde` con fichas del lado en los conteos `c` (25 = barra), o 0."""
+    if desde >= 25:
+        if c[NUM_POINTS + lado]:
+            return 25
+        desde = 24
+    if lado == 0:
+        for d in range(desde, 0, -1):
+            if c[24 - d] > 0:
+                return d
+    else:
+        for d in range(desde, 0, -1):
+            if c[d - 1] < 0:
+                return d
+    return 0
+
+
+def _carrera_slots(c) -> Tuple[List[int], List[int]]:
+    """(`__pips__`, `__atras__`) recorriendo los 28 conteos `c`."""
+    blanco = sum((24 - i) * v for i, v in enumerate(c[:NUM_POINTS]) if v > 0)
+    negro = sum((i + 1) * -v for i, v in enumerate(c[:NUM_POINTS]) if v < 0)
+    pips = [blanco + 25 * c[SLOT_BARRA[BLANCO]], negro + 25 * c[SLOT_BARRA[NEGRO]]]
+    return pips, [_buscar_atras(c, 0, 25), _buscar_atras(c, 1, 25)]
+
+
+_PIPS_INICIO, _ATRAS_INICIO = _carrera_slots(_INICIO)
+
+
+def _pila(valor: int) -> List[str]:
+    """Lista de fichas equivalente a un conteo con signo."""
+    if valor > 0:
+        return [BLANCO] * valor
+    return [NEGRO] * -valor
+
+
+class _VistaPila(list):
+    """
+    Copia materializada de una pila (punto, barra o borneadas).
+    Las mutaciones se replican en el arreglo de conteos del Board. Si el slot cambió
+    desde que se creó la vista (o desde su última escritura), la vista quedó vieja y
+    la mutación se rechaza con ValueError sin tocar ni la vista ni el tablero.
+    """
+
+    def __init__(self, board: "Board", slot: int) -> None:
+        valor = board.__conteos__[slot]
+        if slot < NUM_POINTS:
+            super().__init__(_pila(valor))
+        else:
+            super().__init__([BLANCO if slot in (24, 26) else NEGRO] * valor)
+        self._board = board
+        self._slot = slot
+        self._valor = valor
+
+    def _comprobar(self) -> None:
+        if self._board.__conteos__[self._slot] != self._valor:
+            raise ValueError(
+                f"La vista del slot {self._slot} quedó desactualizada: "
+                "volver a pedirla al tablero."
+            )
+
+    def _sincronizar(self) -> None:
+        # pylint: disable=protected-access
+        self._board._escribir_pila(self._slot, self)
+        self._valor = self._board.__conteos__[self._slot]
+
+    def append(self, ficha) -> None:
+        self._comprobar()
+        super().append(ficha)
+        self._sincronizar()
+
+    def extend(self, fichas) -> None:
+        self._comprobar()
+        super().extend(fichas)
+        self._sincronizar()
+
+    def insert(self, indice, ficha) -> None:
+        self._comprobar()
+        super().insert(indice, ficha)
+        self._sincronizar()
+
+    def pop(self, indice=-1):
+        self._comprobar()
+        ficha = super().pop(indice)
+        self._sincronizar()
+        return ficha
+
+    def remove(self, ficha) -> None:
+        self._comprobar()
+        super().remove(ficha)
+        self._sincronizar()
+
+    def clear(self) -> None:
+        self._comprobar()
+        super().clear()
+        self._sincronizar()
+
+    def __setitem__(self, indice, valor) -> None:
+        self._comprobar()
+        super().__setitem__(indice, valor)
+        self._sincronizar()
+
+    def __delitem__(self, indice) -> None:
+        self._comprobar()
+        super().__delitem__(indice)
+        self._sincronizar()
+
+    def __iadd__(self, otras):
+        self._comprobar()
+        super().__iadd__(otras)
+        self._sincronizar()
+        return self
+
+
+class _VistaPuntos(list):
+    """Vista de los 24 puntos como listas de fichas (API histórica `__posiciones__`)."""
+
+    def __init__(self, board: "Board") -> None:
+        super().__init__()
+        self._board = board
+
+    def __len__(self) -> int:
+        return NUM_POINTS
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [_VistaPila(self._board, i) for i in range(NUM_POINTS)[indice]]
+        if indice < 0:
+            indice += NUM_POINTS
+        self._board._require_point(indice)  # pylint: disable=protected-access
+        return _VistaPila(self._board, indice)
+
+    def __setitem__(self, indice, pila) -> None:
+        # pylint: disable=protected-access
+        if isinstance(indice, slice):
+            for i, p in zip(range(NUM_POINTS)[indice], list(pila)):
+                self._board._escribir_pila(i, p)
+            return
+        if indice < 0:
+            indice += NUM_POINTS
+        self._board._require_point(indice)
+        self._board._escribir_pila(indice, pila)
+
+    def __iter__(self):
+        return (_VistaPila(self._board, i) for i in range(NUM_POINTS))
+
+    def __eq__(self, otro) -> bool:
+        return list(self) == list(otro)
+
+    def __ne__(self, otro) -> bool:
+        return not self == otro
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _VistaColores(dict):
+    """
+    Vista color -> lista de fichas sobre un par de slots (barra o borneadas).
+    El almacenamiento del dict guarda las pilas del momento en que se creó la vista, así
+    dict(), {**vista} y json.dumps ven valores reales; el acceso por clave lee el tablero.
+    """
+
+    def __init__(self, board: "Board", slots: Dict[str, int]) -> None:
+        super().__init__({c: _VistaPila(board, slots[c]) for c in (BLANCO, NEGRO)})
+        self._board = board
+        self._slots = slots
+
+    def __getitem__(self, color: str) -> List[str]:
+        self._board._require_color(color)  # pylint: disable=protected-access
+        return _VistaPila(self._board, self._slots[color])
+
+    def __setitem__(self, color: str, pila) -> None:
+        # pylint: disable=protected-access
+        self._board._require_color(color)
+        self._board._escribir_pila(self._slots[color], pila)
+        super().__setitem__(color, _VistaPila(self._board, self._slots[color]))
+
+    def get(self, color, default=None):
+        if color in (BLANCO, NEGRO):
+            return self[color]
+        return default
+
+    def values(self):
+        return [self[c] for c in (BLANCO, NEGRO)]
+
+    def items(self):
+        return [(c, self[c]) for c in (BLANCO, NEGRO)]
+
+    def copy(self) -> Dict[str, List[str]]:
+        return dict(self.items())
+
+    def __eq__(self, otro) -> bool:
+        return dict(self.items()) == otro
+
+    def __ne__(self, otro) -> bool:
+        return not self == otro
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
 
 class Board:
-    """Tablero con puntos, barra y borne-off, más utilidades de validación."""
+    """
+    Tablero con puntos, barra y borne-off, más utilidades de validación.
+
+    El estado vive en `__conteos__`, un `array('b')` de 28 posiciones:
+    conteos con signo por punto (0..23), barra (24, 25) y borneadas (26, 27).
+    Las listas de fichas de la API histórica se generan a demanda.
+    `__zobrist__` mantiene la clave Zobrist de la posición (sin turno) de forma incremental,
+    y `__zobrist_espejo__` la de la posición con los colores intercambiados.
+    `__pips__` y `__atras__` ([blanco, negro]) llevan el pip count y la distancia de la ficha
+    más atrasada (25 = barra, 0 = ninguna) de cada color, también de forma incremental.
+    """
     # pylint: disable=too-many-public-methods
 
     def __init__(self) -> None:
-        self.__points__: List[List[str]] = [[] for _ in range(NUM_POINTS)]
-        self.__bar_map__: Dict[str, List[str]] = {BLANCO: [], NEGRO: []}
-        self.__borne_off_map__: Dict[str, List[str]] = {BLANCO: [], NEGRO: []}
-        # Exponer alias esperados por los tests
-        self.__posiciones__ = self.__points__
-        self.__barra__ = self.__bar_map__
-        self.__fichas_fuera__ = self.__borne_off_map__
-        self.reset_to_start()
+        self.__conteos__ = array("b", _INICIO)
+        self.__zobrist__ = _CLAVE_INICIO
+        self.__zobrist_espejo__ = _CLAVE_ESPEJO_INICIO
+        self.__pila_deshacer__: List[TokenDeshacer] = []
+        self.__pips__: List[int] = _PIPS_INICIO[:]
+        self.__atras__: List[int] = _ATRAS_INICIO[:]
+
+    # Alias esperados por los tests y la CLI (vistas sobre el arreglo de conteos)
+    @property
+    def __points__(self) -> List[List[str]]:
+        return _VistaPuntos(self)
+
+    @property
+    def __bar_map__(self) -> Dict[str, List[str]]:
+        return _VistaColores(self, SLOT_BARRA)
+
+    @property
+    def __borne_off_map__(self) -> Dict[str, List[str]]:
+        return _VistaColores(self, SLOT_FUERA)
+
+    __posiciones__ = __points__
+    __barra__ = __bar_map__
+    __fichas_fuera__ = __borne_off_map__
 
     def reset_to_start(self) -> None:
         """Coloca las fichas en posiciones estándar de inicio."""
-        # Reemplazar contenido en lugar de re-binder para mantener alias válidos
-        self.__points__[:] = [[] for _ in range(NUM_POINTS)]
-        self.__bar_map__.clear()
-        self.__bar_map__[BLANCO] = []
-        self.__bar_map__[NEGRO] = []
-        self.__borne_off_map__.clear()
-        self.__borne_off_map__[BLANCO] = []
-        self.__borne_off_map__[NEGRO] = []
-
-        self.__points__[0]  = [BLANCO] * 2
-        self.__points__[11] = [BLANCO] * 5
-        self.__points__[16] = [BLANCO] * 3
-        self.__points__[18] = [BLANCO] * 5
-        # Negras
-        self.__points__[23] = [NEGRO] * 2
-        self.__points__[12] = [NEGRO] * 5
-        self.__points__[7]  = [NEGRO] * 3
-        self.__points__[5]  = [NEGRO] * 5
+        self.__conteos__[:] = _INICIO
+        self.__zobrist__ = _CLAVE_INICIO
+        self.__zobrist_espejo__ = _CLAVE_ESPEJO_INICIO
+        self.__pila_deshacer__ = []
+        self.__pips__ = _PIPS_INICIO[:]
+        self.__atras__ = _ATRAS_INICIO[:]
 
     def stack_at(self, index: int) -> List[str]:
         """Copia de la pila en el punto `index` (0..23)."""
         self._require_point(index)
-        return list(self.__points__[index])
+        return _pila(self.__conteos__[index])
 
     def bar(self, color: Optional[str] = None) -> Dict[str, List[str]] | List[str]:  # pylint: disable=disallowed-name
         """Copia de la(s) barra(s)."""
         if color is None:
-            return {c: list(p) for c, p in self.__bar_map__.items()}
+            return {c: [c] * self.__conteos__[SLOT_BARRA[c]] for c in (BLANCO, NEGRO)}
         self._require_color(color)
-        return list(self.__bar_map__[color])
+        return [color] * self.__conteos__[SLOT_BARRA[color]]
 
     def borne_off(self, color: Optional[str] = None) -> Dict[str, List[str]] | List[str]:
         """Copia de las fichas borneadas."""
         if color is None:
-            return {c: list(p) for c, p in self.__borne_off_map__.items()}
+            return {c: [c] * self.__conteos__[SLOT_FUERA[c]] for c in (BLANCO, NEGRO)}
         self._require_color(color)
-        return list(self.__borne_off_map__[color])
+        return [color] * self.__conteos__[SLOT_FUERA[color]]
 
     def bar_count(self, color: str) -> int:
         """Cantidad de fichas en la barra para el color dado."""
         self._require_color(color)
-        return len(self.__bar_map__[color])
+        return self.__conteos__[SLOT_BARRA[color]]
 
     def borne_off_count(self, color: str) -> int:
         """Cantidad de fichas borneadas (fuera) para el color dado."""
         self._require_color(color)
-        return len(self.__borne_off_map__[color])
+        return self.__conteos__[SLOT_FUERA[color]]
 
     def point_count(self, index: int) -> int:
         """Cantidad de fichas en el punto indicado (0..23)."""
         self._require_point(index)
-        return len(self.__points__[index])
+        return abs(self.__conteos__[index])
 
     def top_color_at(self, index: int) -> Optional[str]:
         """Color del tope en el punto, o None si vacío."""
         self._require_point(index)
-        return self.__points__[index][-1] if self.__points__[index] else None
+        valor = self.__conteos__[index]
+        if valor == 0:
+            return None
+        return BLANCO if valor > 0 else NEGRO
 
     def points_snapshot(self) -> List[dict]:
         """Resumen compacto de puntos (para UI/logs)."""
-        out = []
-        for pile in self.__points__:
-            if pile:
-                out.append({"color": pile[0], "cantidad": len(pile)})
-            else:
-                out.append({"color": None, "cantidad": 0})
-        return out
+        return [_CELDAS[v].copy() for v in self.__conteos__[:NUM_POINTS]]
 
     def is_home_point(self, color: str, index: int) -> bool:
         self._require_color(color)
@@ -113,31 +373,44 @@ class Board:
         """Agrega una ficha del `color` al punto `index`."""
         self._require_point(index)
         self._require_color(color)
-        self.__points__[index].append(color)
+        signo = SIGNO[color]
+        valor = self.__conteos__[index]
+        if valor * signo < 0:
+            raise ValueError(f"Punto {index} ocupado por fichas rivales.")
+        self._fijar(index, valor + signo)
 
     def remove_from_point(self, index: int) -> Optional[str]:
         """Saca y devuelve la ficha del tope del punto, o None si vacío."""
         self._require_point(index)
-        if self.__points__[index]:
-            return self.__points__[index].pop()
+        valor = self.__conteos__[index]
+        if valor > 0:
+            self._fijar(index, valor - 1)
+            return BLANCO
+        if valor < 0:
+            self._fijar(index, valor + 1)
+            return NEGRO
         return None
 
     def push_to_bar(self, color: str) -> None:
         """Envía una ficha del `color` a la barra (captura)."""
         self._require_color(color)
-        self.__bar_map__[color].append(color)
+        slot = SLOT_BARRA[color]
+        self._fijar(slot, self.__conteos__[slot] + 1)
 
     def pop_from_bar(self, color: str) -> Optional[str]:
         """Quita una ficha de la barra del `color`, o None si no hay."""
         self._require_color(color)
-        if self.__bar_map__[color]:
-            return self.__bar_map__[color].pop()
+        slot = SLOT_BARRA[color]
+        if self.__conteos__[slot]:
+            self._fijar(slot, self.__conteos__[slot] - 1)
+            return color
         return None
 
     def push_borne_off(self, color: str) -> None:
         """Agrega una ficha borneada (fuera) del `color`."""
         self._require_color(color)
-        self.__borne_off_map__[color].append(color)
+        slot = SLOT_FUERA[color]
+        self._fijar(slot, self.__conteos__[slot] + 1)
 
     # --- Compatibilidad API en español (utilizado por tests) ---
     def inicializar_posiciones(self) -> None:
@@ -165,15 +438,70 @@ class Board:
         return self.remove_from_point(punto)
 
     def mover_ficha(self, origen: int, destino: int) -> None:
-        """Mueve una ficha aplicando captura simple si hay una rival en destino."""
-        ficha = self.remove_from_point(origen)
-        if ficha is None:
+        """
+        Mueve una ficha aplicando captura simple si hay una rival en destino.
+        Lanza ValueError si el destino está bloqueado (2+ rivales).
+        """
+        if not (0 <= origen < NUM_POINTS and 0 <= destino < NUM_POINTS):
+            raise IndexError(f"Punto fuera de rango: {origen} -> {destino}")
+        c = self.__conteos__
+        valor = c[origen]
+        if not valor:
             return
-        destino_fichas = self.__points__[destino]
-        if destino_fichas and len(destino_fichas) == 1 and destino_fichas[0] != ficha:
-            capturado = self.__points__[destino].pop()
-            self.push_to_bar(capturado)
-        self.__points__[destino].append(ficha)
+        dest = c[destino]
+        atras = self.__atras__
+        # Una rama por color: Zobrist por deltas de un paso (_DZ) y carrera medida en
+        # distancia a la salida del que mueve; el blot capturado vuelve a 25.
+        if valor > 0:
+            if dest < -1:
+                raise ValueError(f"Destino bloqueado: {destino}")
+            io = valor + _ZO - 1
+            clave = self.__zobrist__ ^ _DZ[origen][io]
+            espejo = self.__zobrist_espejo__ ^ _DZE[origen][io]
+            d_origen, d_destino = 24 - origen, 24 - destino
+            if dest == -1:
+                n = c[25]  # SLOT_BARRA[NEGRO]
+                clave ^= _DZ[25][n + _ZO] ^ _DZ[destino][_ZO - 1]
+                espejo ^= _DZE[25][n + _ZO] ^ _DZE[destino][_ZO - 1]
+                c[25] = n + 1
+                dest = 0
+                self.__pips__[1] += d_destino
+                atras[1] = 25
+            c[origen] = valor - 1
+            c[destino] = dest + 1
+            self.__zobrist__ = clave ^ _DZ[destino][dest + _ZO]
+            self.__zobrist_espejo__ = espejo ^ _DZE[destino][dest + _ZO]
+            self.__pips__[0] -= d_origen - d_destino
+            if d_destino > atras[0]:
+                atras[0] = d_destino
+            elif d_origen == atras[0] and valor == 1:
+                atras[0] = self._buscar_atras(0, d_origen)
+        else:
+            if dest > 1:
+                raise ValueError(f"Destino bloqueado: {destino}")
+            io = valor + _ZO
+            clave = self.__zobrist__ ^ _DZ[origen][io]
+            espejo = self.__zobrist_espejo__ ^ _DZE[origen][io]
+            d_origen, d_destino = origen + 1, destino + 1
+            if dest == 1:
+                n = c[24]  # SLOT_BARRA[BLANCO]
+                clave ^= _DZ[24][n + _ZO] ^ _DZ[destino][_ZO]
+                espejo ^= _DZE[24][n + _ZO] ^ _DZE[destino][_ZO]
+                c[24] = n + 1
+                dest = 0
+                self.__pips__[0] += d_destino
+                atras[0] = 25
+            c[origen] = valor + 1
+            c[destino] = dest - 1
+            self.__zobrist__ = clave ^ _DZ[destino][dest + _ZO - 1]
+            self.__zobrist_espejo__ = espejo ^ _DZE[destino][dest + _ZO - 1]
+            self.__pips__[1] -= d_origen - d_destino
+            if d_destino > atras[1]:
+                atras[1] = d_destino
+            elif d_origen == atras[1] and valor == -1:
+                atras[1] = self._buscar_atras(1, d_origen)
+        if zobrist.VERIFICAR:
+            self._verificar_zobrist()
 
     def mover_desde_barra(self, color: str, destino: int) -> bool:
         """
@@ -181,22 +509,29 @@ class Board:
         Captura si hay una sola ficha rival.
         """
         self._require_color(color)
-        if not self.__bar_map__[color]:
+        c = self.__conteos__
+        slot = SLOT_BARRA[color]
+        if not c[slot]:
             return False
-        destino_fichas = self.__points__[destino]
+        self._require_point(destino)
+        signo = SIGNO[color]
+        dest = c[destino]
         # Bloqueado si hay 2+ del rival
-        if destino_fichas and destino_fichas[0] != color and len(destino_fichas) > 1:
+        if dest * signo < -1:
             return False
 
         # Sale de la barra
-        self.__bar_map__[color].pop()
+        self._fijar(slot, c[slot] - 1)
 
         # Captura si corresponde
-        if destino_fichas and len(destino_fichas) == 1 and destino_fichas[0] != color:
-            capturado = self.__points__[destino].pop()
-            self.push_to_bar(capturado)
-
-        self.__points__[destino].append(color)
+        if dest == -signo:
+            barra_rival = SLOT_BARRA[NEGRO if signo > 0 else BLANCO]
+            self._fijar(barra_rival, c[barra_rival] + 1)
+            dest = 0
+
+        self._fijar(destino, dest + signo)
+        if zobrist.VERIFICAR:
+            self._verificar_zobrist()
         return True
 
     def aplicar_movimiento(self, origen: int, destino: int, color: str) -> bool:
@@ -219,24 +554,29 @@ class Board:
         return self.points_snapshot()
 
     def bornear_ficha(self, punto: int, color: str) -> None:
-        """Borneo directo sin validar reglas."""
-        ficha = self.remove_from_point(punto)
-        if ficha == color:
-            self.push_borne_off(color)
-        elif ficha is not None:
-            # Revertir si no coincide el color
-            self.add_to_point(punto, ficha)
+        """Borneo directo sin validar reglas (no hace nada si el tope es de otro color)."""
+        self._require_point(punto)
+        self._require_color(color)
+        signo = SIGNO[color]
+        valor = self.__conteos__[punto]
+        if valor * signo > 0:
+            self._fijar(punto, valor - signo)
+            fuera = SLOT_FUERA[color]
+            self._fijar(fuera, self.__conteos__[fuera] + 1)
+            if zobrist.VERIFICAR:
+                self._verificar_zobrist()
 
     def total_checkers(self, color: Optional[str] = None) -> int:
         """
         Cuenta fichas por color (o total si color=None) incluyendo puntos, barra y borneadas.
         Útil para tests de invariantes (debe ser 15 por color).
         """
-        def count_color(c: str) -> int:
-            points = sum(1 for pile in self.__points__ for ch in pile if ch == c)
-            bar_len = len(self.__bar_map__[c])  # evitar nombre desaconsejado
-            off = len(self.__borne_off_map__[c])
-            return points + bar_len + off
+        c = self.__conteos__
+
+        def count_color(col: str) -> int:
+            signo = SIGNO[col]
+            points = sum(v * signo for v in c[:NUM_POINTS] if v * signo > 0)
+            return points + c[SLOT_BARRA[col]] + c[SLOT_FUERA[col]]
 
         if color is None:
             return count_color(BLANCO) + count_color(NEGRO)
@@ -244,17 +584,235 @@ class Board:
         return count_color(color)
 
     def clone(self) -> "Board":
-        """Copia profunda liviana (para simulaciones/tests)."""
+        """Copia liviana (para simulaciones/tests): sólo duplica el arreglo de conteos."""
         nb = Board.__new__(Board)  # evita reset_to_start
-        # pylint: disable=protected-access
-        nb.__points__ = [list(p) for p in self.__points__]
-        nb.__bar_map__ = {c: list(p) for c, p in self.__bar_map__.items()}
-        nb.__borne_off_map__ = {c: list(p) for c, p in self.__borne_off_map__.items()}
-        nb.__posiciones__ = nb.__points__
-        nb.__barra__ = nb.__bar_map__
-        nb.__fichas_fuera__ = nb.__borne_off_map__
+        nb.__conteos__ = self.__conteos__[:]
+        nb.__zobrist__ = self.__zobrist__
+        nb.__zobrist_espejo__ = self.__zobrist_espejo__
+        nb.__pila_deshacer__ = []
+        nb.__pips__ = self.__pips__[:]
+        nb.__atras__ = self.__atras__[:]
+        return nb
+
+    def position_key(self, color_en_turno: str = BLANCO) -> bytes:
+        """Position ID binario de 10 bytes (perspectiva del `color_en_turno`)."""
+        self._require_color(color_en_turno)
+        return position_id.codificar_slots(self.__conteos__, color_en_turno == NEGRO)
+
+    def position_id(self, color_en_turno: str = BLANCO) -> str:
+        """Position ID en texto (base64, 14 caracteres)."""
+        return position_id.a_texto(self.position_key(color_en_turno))
+
+    @classmethod
+    def from_position_id(cls, clave: str | bytes, color_en_turno: str = BLANCO) -> "Board":
+        """Construye un Board desde un Position ID (texto o binario)."""
+        if color_en_turno not in (BLANCO, NEGRO):
+            raise ValueError(f"Color inválido: {color_en_turno}")
+        if isinstance(clave, str):
+            clave = position_id.desde_texto(clave)
+        nb = cls.__new__(cls)
+        nb.__conteos__ = array("b", position_id.decodificar_slots(clave, color_en_turno == NEGRO))
+        nb.__pila_deshacer__ = []
+        nb.recalcular_zobrist()
         return nb
 
+    def apply(self, move: Movimiento) -> TokenDeshacer:
+        """
+        Aplica `move` = (origen, destino, color) en el lugar y devuelve el token para undo().
+        origen BARRA reingresa; destino FUERA bornea; captura si hay un blot rival.
+        Valida sólo lo necesario para poder deshacer (ficha propia, destino no bloqueado).
+        """
+        origen, destino, color = move
+        self._require_color(color)
+        c = self.__conteos__
+        signo = SIGNO[color]
+        if origen == BARRA:
+            slot_origen = SLOT_BARRA[color]
+            if not c[slot_origen]:
+                raise ValueError(f"No hay fichas {color} en la barra.")
+            nuevo_origen = c[slot_origen] - 1
+        else:
+            self._require_point(origen)
+            slot_origen = origen
+            if c[origen] * signo <= 0:
+                raise ValueError(f"No hay fichas {color} en el punto {origen}.")
+            nuevo_origen = c[origen] - signo
+        capturo = False
+        if destino == FUERA:
+            self._fijar(slot_origen, nuevo_origen)
+            fuera = SLOT_FUERA[color]
+            self._fijar(fuera, c[fuera] + 1)
+        else:
+            self._require_point(destino)
+            dest = c[destino]
+            if dest * signo < -1:
+                raise ValueError(f"Destino bloqueado: {destino}")
+            self._fijar(slot_origen, nuevo_origen)
+            if dest == -signo:
+                barra_rival = SLOT_BARRA[NEGRO if signo > 0 else BLANCO]
+                self._fijar(barra_rival, c[barra_rival] + 1)
+                dest = 0
+                capturo = True
+            self._fijar(destino, dest + signo)
+        token = (origen, destino, color, capturo)
+        self.__pila_deshacer__.append(token)
+        return token
+
+    def undo(self, token: Optional[TokenDeshacer] = None) -> None:
+        """
+        Revierte el último apply() (LIFO). Si se pasa `token`, debe ser el último aplicado.
+        """
+        if not self.__pila_deshacer__:
+            raise ValueError("No hay movimientos para deshacer.")
+        if token is not None and self.__pila_deshacer__[-1] != token:
+            raise ValueError("Sólo se puede deshacer el último movimiento aplicado.")
+        origen, destino, color, capturo = self.__pila_deshacer__.pop()
+        c = self.__conteos__
+        signo = SIGNO[color]
+        if destino == FUERA:
+            fuera = SLOT_FUERA[color]
+            self._fijar(fuera, c[fuera] - 1)
+        else:
+            self._fijar(destino, c[destino] - signo)
+            if capturo:
+                barra_rival = SLOT_BARRA[NEGRO if signo > 0 else BLANCO]
+                self._fijar(barra_rival, c[barra_rival] - 1)
+                self._fijar(destino, -signo)
+        if origen == BARRA:
+            barra = SLOT_BARRA[color]
+            self._fijar(barra, c[barra] + 1)
+        else:
+            self._fijar(origen, c[origen] + signo)
+
+    def profundidad_deshacer(self) -> int:
+        """Cantidad de movimientos aplicados con apply() pendientes de deshacer."""
+        return len(self.__pila_deshacer__)
+
+    def aplicar(self, movimiento: Movimiento) -> TokenDeshacer:
+        """Alias de apply()."""
+        return self.apply(movimiento)
+
+    def deshacer(self, token: Optional[TokenDeshacer] = None) -> None:
+        """Alias de undo()."""
+        self.undo(token)
+
+    def clave_zobrist(self, color_en_turno: Optional[str] = None) -> int:
+        """
+        Clave Zobrist de 64 bits de la posición (mantenida incrementalmente).
+        Si se indica `color_en_turno`, incluye el lado que mueve.
+        """
+        if color_en_turno is None:
+            return self.__zobrist__
+        self._require_color(color_en_turno)
+        return self.__zobrist__ ^ (zobrist.TURNO_NEGRAS if color_en_turno == NEGRO else 0)
+
+    def clave_canonica(self, color_en_turno: str = BLANCO) -> int:
+        """
+        Clave de la posición vista por `color_en_turno` como si jugara con blancas:
+        una posición y su espejo con el otro color en turno comparten clave.
+        """
+        self._require_color(color_en_turno)
+        return self.__zobrist__ if color_en_turno == BLANCO else self.__zobrist_espejo__
+
+    def recalcular_zobrist(self) -> int:
+        """
+        Recalcula la clave desde cero (útil tras escribir `__conteos__` a mano).
+        También reconstruye pip counts y fichas más atrasadas.
+        """
+        self.__zobrist__ = zobrist.clave_slots(self.__conteos__)
+        self.__zobrist_espejo__ = zobrist.clave_espejo_slots(self.__conteos__)
+        self.__pips__, self.__atras__ = _carrera_slots(self.__conteos__)
+        return self.__zobrist__
+
+    def pip_count(self, color: str) -> int:
+        """Pip count del color (barra = 25), mantenido incrementalmente."""
+        self._require_color(color)
+        return self.__pips__[LADO[color]]
+
+    def furthest_back(self, color: str) -> int:
+        """Distancia en pips de la ficha más atrasada del color (25 = barra, 0 = ninguna)."""
+        self._require_color(color)
+        return self.__atras__[LADO[color]]
+
+    def is_race(self) -> bool:
+        """True si ya no hay contacto (cada color pasó todas las fichas rivales). O(1)."""
+        return self.__atras__[0] + self.__atras__[1] < 25
+
+    def conteo_pips(self, color: str) -> int:
+        """Alias de pip_count()."""
+        return self.pip_count(color)
+
+    def ficha_mas_atrasada(self, color: str) -> int:
+        """Alias de furthest_back()."""
+        return self.furthest_back(color)
+
+    def es_carrera(self) -> bool:
+        """Alias de is_race()."""
+        return self.is_race()
+
+    def _buscar_atras(self, lado: int, desde: int) -> int:
+        """Primera distancia <= `desde` con fichas del lado (25 = barra), o 0."""
+        return _buscar_atras(self.__conteos__, lado, desde)
+
+    def _sumar_carrera(self, slot: int, antes: int, despues: int) -> None:
+        """Ajusta pips y ficha más atrasada tras cambiar el conteo de `slot`."""
+        if slot >= NUM_POINTS:
+            if slot < SLOT_FUERA[BLANCO]:
+                self._sumar_lado(slot - NUM_POINTS, 25, despues - antes)
+            return
+        if antes > 0 or despues > 0:
+            self._sumar_lado(0, 24 - slot, max(despues, 0) - max(antes, 0))
+        if antes < 0 or despues < 0:
+            self._sumar_lado(1, slot + 1, max(-despues, 0) - max(-antes, 0))
+
+    def _sumar_lado(self, lado: int, distancia: int, delta: int) -> None:
+        """Suma `delta` fichas a `distancia` pips; sólo recorre si se vacía la más atrasada."""
+        if not delta:
+            return
+        self.__pips__[lado] += delta * distancia
+        atras = self.__atras__
+        if delta > 0:
+            if distancia > atras[lado]:
+                atras[lado] = distancia
+        elif distancia == atras[lado]:
+            atras[lado] = self._buscar_atras(lado, distancia)
+
+    def _verificar_zobrist(self) -> None:
+        """Modo depuración: compara la clave incremental con el recálculo completo."""
+        zobrist.comprobar(self.__zobrist__, zobrist.clave_slots(self.__conteos__))
+        zobrist.comprobar(self.__zobrist_espejo__, zobrist.clave_espejo_slots(self.__conteos__))
+
+    def _fijar(self, slot: int, valor: int) -> None:
+        """Escribe un conteo actualizando la clave Zobrist."""
+        if not -_ZO <= valor <= _ZO:
+            raise ValueError(f"Conteo fuera de rango en el slot {slot}: {valor}")
+        fila = _Z[slot]
+        antes = self.__conteos__[slot]
+        self.__zobrist__ ^= fila[antes + _ZO] ^ fila[valor + _ZO]
+        fila = _ZE[slot]
+        self.__zobrist_espejo__ ^= fila[antes + _ZO] ^ fila[valor + _ZO]
+        self.__conteos__[slot] = valor
+        self._sumar_carrera(slot, antes, valor)
+
+    def _escribir_pila(self, slot: int, pila) -> None:
+        """Vuelca una lista de fichas (API histórica) al conteo del slot."""
+        pila = list(pila)
+        colores = set(pila)
+        if slot < NUM_POINTS:
+            if len(colores) > 1:
+                raise ValueError(f"Pila mixta no soportada en el punto {slot}: {pila}")
+            if colores:
+                (color,) = colores
+                self._require_color(color)
+                self._fijar(slot, SIGNO[color] * len(pila))
+            else:
+                self._fijar(slot, 0)
+            return
+        esperado = BLANCO if slot in (SLOT_BARRA[BLANCO], SLOT_FUERA[BLANCO]) else NEGRO
+        if colores - {esperado}:
+            raise ValueError(f"Sólo se admiten fichas '{esperado}' en esta pila: {pila}")
+        self._fijar(slot, len(pila))
+
     def _require_point(self, index: int) -> None:
         """Valida rango de punto (0..23)."""
         if not 0 <= index < NUM_POINTS:
@@ -275,25 +833,23 @@ class Board:
         self._require_color(color)
         if not 0 <= destino < NUM_POINTS:
             return False
-
-        def bloqueado(idx: int) -> bool:
-            pila = self.__points__[idx]
-            return bool(pila) and pila[0] != color and len(pila) > 1
+        c = self.__conteos__
+        signo = SIGNO[color]
+        bloqueado = c[destino] * signo < -1
 
         if origen == -1:
             # Desde barra: debe haber fichas en barra y destino no bloqueado
-            if not self.__bar_map__[color]:
+            if not c[SLOT_BARRA[color]]:
                 return False
-            return not bloqueado(destino)
+            return not bloqueado
 
         # Origen en tablero
         if not 0 <= origen < NUM_POINTS:
             return False
-        pila_origen = self.__points__[origen]
-        if not pila_origen or pila_origen[0] != color:
+        if c[origen] * signo <= 0:
             return False
 
-        return not bloqueado(destino)
+        return not bloqueado
 
     def calcular_destino(self, origen: int, color: str, tirada: int) -> int:
         """Calcula el destino desde un origen según color y tirada (no valida bloqueo)."""
@@ -313,21 +869,22 @@ class Board:
     def puede_mover(self, color: str, tiradas: List[int]) -> bool:
         """True si existe algún movimiento legal con las tiradas dadas."""
         self._require_color(color)
+        c = self.__conteos__
+        signo = SIGNO[color]
         # Si hay fichas en barra, sólo se consideran reingresos
-        if self.__bar_map__[color]:
+        if c[SLOT_BARRA[color]]:
             for d in tiradas:
                 dest = self.calcular_destino_barra(color, d)
-                if 0 <= dest < NUM_POINTS and self.es_movimiento_legal(-1, dest, color):
+                if 0 <= dest < NUM_POINTS and c[dest] * signo >= -1:
                     return True
             return False
 
         # Sin fichas en barra: buscar cualquier origen válido que pueda mover
         for origen in range(NUM_POINTS):
-            pila = self.__points__[origen]
-            if not pila or pila[0] != color:
+            if c[origen] * signo <= 0:
                 continue
             for d in tiradas:
-                dest = self.calcular_destino(origen, color, d)
-                if 0 <= dest < NUM_POINTS and self.es_movimiento_legal(origen, dest, color):
+                dest = origen + signo * d
+                if 0 <= dest < NUM_POINTS and c[dest] * signo >= -1:
                     return True
         return False
@@ -0,0 +1,97 @@
+"""
+Forma canónica "quien tira juega con blancas".
+
+Los dos colores son simétricos (ver `DIRECTION` y `HOME_RANGE` en core.board): una
+posición con las negras en turno es el espejo de otra con las blancas en turno.
+Antes de buscar en una tabla (transposición, jugadas legales, evaluaciones) se usa la
+clave canónica, y lo que se guardó desde la perspectiva espejada se traduce de vuelta
+con `espejar_jugada` / `espejar_movimiento`.
+
+Espejo sobre los 28 slots: punto i <-> 23 - i con el signo invertido, barras (24, 25)
+y borneadas (26, 27) intercambiadas. En puntos de EstadoJuego: p <-> 25 - p.
+Las claves canónicas se mantienen de forma incremental en Board y EstadoJuego
+(`clave_canonica()`), a partir de `core.zobrist.TABLA_ESPEJO`.
+"""
+
+from __future__ import annotations
+from typing import Any, List, Sequence, Tuple
+
+from core import zobrist
+from core.board import BARRA as BARRA_BOARD, BLANCO, FUERA, NEGRO, Movimiento
+
+# Origen "barra" de los pasos de EstadoJuego (cli.state.BARRA)
+BARRA_ESTADO = -1
+
+
+def espejar_slots(slots: Sequence[int]) -> List[int]:
+    """
+    Los 28 slots con los colores intercambiados.
+    Parámetros: slots (Sequence[int])
+    Retorna: List[int]
+    """
+    espejo = [0] * zobrist.NUM_SLOTS
+    for slot, valor in enumerate(slots):
+        espejo[zobrist.ESPEJO_SLOT[slot]] = -valor if slot < 24 else valor
+    return espejo
+
+
+def forma_canonica(slots: Sequence[int], negras_en_turno: bool) -> Tuple[List[int], bool]:
+    """
+    Slots desde la perspectiva de quien tira (siempre blancas) y si hubo que espejar.
+    Parámetros: slots (Sequence[int]), negras_en_turno (bool)
+    Retorna: Tuple[List[int], bool]
+    """
+    if negras_en_turno:
+        return espejar_slots(slots), True
+    return list(slots), False
+
+
+def clave_canonica(origen: Any, color_en_turno: str = BLANCO) -> int:
+    """
+    Clave canónica de un EstadoJuego (usa su turno), un Board (usa 'color_en_turno')
+    o un Game (Board del adaptador + jugador_actual).
+    Parámetros: origen (EstadoJuego|Board|Game), color_en_turno (str)
+    Retorna: int
+    """
+    if hasattr(origen, "jugador_actual") and hasattr(origen, "board"):
+        board = getattr(origen.board, "_b", origen.board)
+        return board.clave_canonica(origen.jugador_actual)
+    if hasattr(origen, "conteos_slots"):
+        return origen.clave_canonica()
+    return origen.clave_canonica(color_en_turno)
+
+
+def espejar_jugada(jugada: Sequence[Tuple[int, int]]) -> Tuple[Tuple[int, int], ...]:
+    """
+    Traduce los pasos (desde, pasos) de EstadoJuego al otro color (p -> 25 - p).
+    Parámetros: jugada (Sequence[Tuple[int, int]])
+    Retorna: Tuple[Tuple[int, int], ...]
+    """
+    return tuple(
+        (desde if desde == BARRA_ESTADO else 25 - desde, pasos) for desde, pasos in jugada
+    )
+
+
+def espejar_movimiento(movimiento: Movimiento) -> Movimiento:
+    """
+    Traduce un movimiento de Board.apply al otro color (índice i -> 23 - i).
+    Parámetros: movimiento (Movimiento)
+    Retorna: Movimiento
+    """
+    origen, destino, color = movimiento
+    if color not in (BLANCO, NEGRO):
+        raise ValueError(f"Color inválido: {color}")
+    return (
+        origen if origen == BARRA_BOARD else 23 - origen,
+        destino if destino == FUERA else 23 - destino,
+        NEGRO if color == BLANCO else BLANCO,
+    )
+
+
+__all__ = [
+    "clave_canonica",
+    "espejar_jugada",
+    "espejar_movimiento",
+    "espejar_slots",
+    "forma_canonica",
+]
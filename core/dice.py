@@ -1,11 +1,88 @@
 """Dice implementation for a Backgammon turn (supports doubles and consumption)."""
 import random
 
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: se usa random.Random.choices como respaldo
+    np = None
+
+_CARAS = range(1, 7)
+
+
+class FlujoDados:
+    """
+    Fuente de dados con buffer pregenerado en una sola llamada vectorizada.
+
+    Compatible con random.Random donde importa (randint(1, 6)), así que sirve como
+    `Dice(rng=...)`, en `Player.tirar_dados(rng)` y en la UI. `tirada()` entrega el
+    par completo. Misma (semilla, flujo) => misma secuencia; flujos distintos son
+    independientes (SeedSequence con spawn_key en numpy), p. ej. uno por worker.
+    """
+
+    def __init__(self, semilla=None, flujo=0, tam_buffer=4096):
+        """Crea el flujo 'flujo' de la semilla dada (None => entropía del sistema)."""
+        if tam_buffer < 2:
+            raise ValueError("El buffer debe admitir al menos una tirada.")
+        self.__tam__ = tam_buffer
+        if np is not None:
+            secuencia = np.random.SeedSequence(semilla, spawn_key=(flujo,))
+            self.__gen__ = np.random.Generator(np.random.PCG64(secuencia))
+        else:
+            base = random.randrange(1 << 64) if semilla is None else semilla
+            self.__gen__ = random.Random(f"{base}:{flujo}")
+        self.__buffer__ = []
+        self.__pos__ = 0
+
+    @classmethod
+    def para_workers(cls, semilla, cantidad, tam_buffer=4096):
+        """Lista de 'cantidad' flujos independientes de la misma semilla."""
+        return [cls(semilla, i, tam_buffer) for i in range(cantidad)]
+
+    def __rellenar__(self):
+        """Genera el próximo bloque de valores 1..6."""
+        if np is not None:
+            self.__buffer__ = self.__gen__.integers(1, 7, size=self.__tam__, dtype=np.int8).tolist()
+        else:
+            self.__buffer__ = self.__gen__.choices(_CARAS, k=self.__tam__)
+        self.__pos__ = 0
+
+    def siguiente(self):
+        """Un valor de dado (1..6)."""
+        if self.__pos__ >= len(self.__buffer__):
+            self.__rellenar__()
+        valor = self.__buffer__[self.__pos__]
+        self.__pos__ += 1
+        return valor
+
+    def tirada(self):
+        """Par (d1, d2) del buffer."""
+        pos = self.__pos__
+        if pos + 2 > len(self.__buffer__):
+            return self.siguiente(), self.siguiente()
+        self.__pos__ = pos + 2
+        return self.__buffer__[pos], self.__buffer__[pos + 1]
+
+    def randint(self, a, b):
+        """Compatibilidad con random.Random: sólo admite el rango de un dado."""
+        if (a, b) != (1, 6):
+            raise ValueError("FlujoDados sólo genera valores de 1 a 6.")
+        return self.siguiente()
+
+
+def tirar_par(rng=None):
+    """Par de dados desde un FlujoDados (tirada()) o cualquier fuente con randint()."""
+    fuente = rng or random
+    tirada = getattr(fuente, "tirada", None)
+    if tirada is not None:
+        return tirada()
+    return fuente.randint(1, 6), fuente.randint(1, 6)
+
+
 class __Dice__:  # pylint: disable=invalid-name
     """Dados de un turno: tirar, consultar valores/movimientos y consumir."""
 
     def __init__(self, rng=None):
-        """Inicializa con RNG opcional (random.Random compatible)."""
+        """Inicializa con RNG opcional (random.Random compatible o FlujoDados)."""
         self.__rng__ = rng or random.Random()
         self.__valor1__ = None
         self.__valor2__ = None
@@ -16,8 +93,7 @@ class __Dice__:  # pylint: disable=invalid-name
         """Tira los dados; si es doble, genera 4 movimientos."""
         if self.__tirado__:
             raise ValueError("Los dados ya fueron tirados este turno.")
-        self.__valor1__ = self.__rng__.randint(1, 6)
-        self.__valor2__ = self.__rng__.randint(1, 6)
+        self.__valor1__, self.__valor2__ = tirar_par(self.__rng__)
         self.__tirado__ = True
         self.__restantes__ = (
             [self.__valor1__] * 4 if self.es_doble() else [self.__valor1__, self.__valor2__]
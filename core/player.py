@@ -3,6 +3,7 @@ import random
 from typing import Iterable, List, Optional, TYPE_CHECKING
 
 from .checker import Checker, BLANCO, NEGRO
+from .dice import tirar_par
 
 if TYPE_CHECKING:
     from .board import Board  # solo para type hints, evita ciclos de import
@@ -23,8 +24,8 @@ class Player:
 
     # Dados
     def tirar_dados(self, rng: random.Random | None = None) -> List[int]:
-        r = rng or random
-        d1, d2 = r.randint(1, 6), r.randint(1, 6)
+        # rng puede ser random.Random o core.dice.FlujoDados (buffer pregenerado)
+        d1, d2 = tirar_par(rng)
         if d1 == d2:
             return [d1, d1, d1, d1]
         return [d1, d2]
@@ -0,0 +1,105 @@
+"""
+Position ID compacto (80 bits / 10 bytes, texto base64 de 14 caracteres).
+
+Sigue el esquema del Position ID estándar de backgammon: para cada jugador se
+recorren sus puntos 1..24 (desde su propia perspectiva) y la barra, escribiendo
+un bit 1 por ficha y un 0 como separador. Primero va el jugador sin turno y luego
+el jugador en turno. Las fichas borneadas no se guardan: son 15 menos el resto.
+
+Trabaja sobre los 28 slots de `core.board` (ver `core.zobrist`), por lo que sirve
+tanto para `Board` (índices 0..23) como para `EstadoJuego` (puntos 1..24).
+"""
+
+from __future__ import annotations
+import base64
+from typing import List, Sequence
+
+MAX_FICHAS = 15
+LARGO_BYTES = 10
+LARGO_TEXTO = 14
+
+
+def _indice_slot(negras: bool, punto: int) -> int:
+    """Slot de core.board para el punto 1..24 visto por blancas o negras."""
+    return punto - 1 if negras else 24 - punto
+
+
+def _fichas_por_punto(slots: Sequence[int], negras: bool) -> List[int]:
+    """Conteos del jugador en sus puntos 1..24 más la barra (25 valores)."""
+    signo = -1 if negras else 1
+    out = [max(0, signo * slots[_indice_slot(negras, p)]) for p in range(1, 25)]
+    out.append(slots[25] if negras else slots[24])
+    return out
+
+
+def codificar_slots(slots: Sequence[int], negras_en_turno: bool = False) -> bytes:
+    """Codifica los 28 slots en la clave binaria de 10 bytes."""
+    bits: List[int] = []
+    for negras in (not negras_en_turno, negras_en_turno):
+        fichas = _fichas_por_punto(slots, negras)
+        if sum(fichas) > MAX_FICHAS:
+            raise ValueError("Más de 15 fichas para un jugador.")
+        for n in fichas:
+            bits.extend([1] * n)
+            bits.append(0)
+    bits.extend([0] * (8 * LARGO_BYTES - len(bits)))
+    clave = bytearray(LARGO_BYTES)
+    for i, bit in enumerate(bits):
+        if bit:
+            clave[i >> 3] |= 1 << (i & 7)
+    return bytes(clave)
+
+
+def decodificar_slots(clave: bytes, negras_en_turno: bool = False) -> List[int]:
+    """Reconstruye los 28 slots (borneadas = 15 - fichas en juego) desde la clave binaria."""
+    if len(clave) != LARGO_BYTES:
+        raise ValueError(f"La clave debe tener {LARGO_BYTES} bytes.")
+    bits = [(clave[i >> 3] >> (i & 7)) & 1 for i in range(8 * LARGO_BYTES)]
+    slots = [0] * 28
+    pos = 0
+    for negras in (not negras_en_turno, negras_en_turno):
+        signo = -1 if negras else 1
+        total = 0
+        for punto in range(1, 26):
+            n = 0
+            while pos < len(bits) and bits[pos]:
+                n += 1
+                pos += 1
+            pos += 1  # separador
+            total += n
+            if punto == 25:
+                slots[25 if negras else 24] = n
+            elif n:
+                slot = _indice_slot(negras, punto)
+                if slots[slot]:
+                    raise ValueError(f"Punto ocupado por ambos jugadores (slot {slot}).")
+                slots[slot] = signo * n
+        if total > MAX_FICHAS:
+            raise ValueError("Position ID inválido: más de 15 fichas para un jugador.")
+        slots[27 if negras else 26] = MAX_FICHAS - total
+    return slots
+
+
+def a_texto(clave: bytes) -> str:
+    """Forma texto (base64 sin relleno, 14 caracteres) de la clave binaria."""
+    return base64.b64encode(clave).decode("ascii").rstrip("=")
+
+
+def desde_texto(texto: str) -> bytes:
+    """Clave binaria a partir de la forma texto."""
+    if len(texto) != LARGO_TEXTO:
+        raise ValueError(f"El Position ID debe tener {LARGO_TEXTO} caracteres: {texto!r}")
+    try:
+        return base64.b64decode(texto + "==", validate=True)
+    except ValueError as exc:
+        raise ValueError(f"Position ID inválido: {texto!r}") from exc
+
+
+__all__ = [
+    "codificar_slots",
+    "decodificar_slots",
+    "a_texto",
+    "desde_texto",
+    "LARGO_BYTES",
+    "LARGO_TEXTO",
+]
@@ -0,0 +1,234 @@
+"""
+Evaluador de posiciones con una red neuronal (MLP) en NumPy puro.
+
+Entrada: codificación estándar de 198 unidades (Tesauro) sobre los 28 slots de
+`core.board` (ver `core.zobrist`), de modo que sirve para `EstadoJuego` y `Board`:
+  - por jugador (blancas primero, luego negras) y por cada uno de sus 24 puntos
+    (desde su propia perspectiva): n>=1, n>=2, n>=3 y (n-3)/2 si n>3  -> 2 x 96
+  - barra/2 de blancas y negras, borneadas/15 de blancas y negras    -> 4
+  - turno: (1, 0) si mueven blancas, (0, 1) si mueven negras           -> 2
+Salida (sigmoide, para el jugador en turno): gana, gana gammon, gana backgammon,
+pierde gammon, pierde backgammon.
+
+La API principal es por lotes: `evaluar_lote` recibe una matriz (N, 198) o una lista
+de posiciones y resuelve todo con una multiplicación de matrices por capa.
+Los pesos se guardan/cargan en un `.npz` local con las claves w1, b1, w2, b2.
+"""
+
+from __future__ import annotations
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+ENTRADAS = 198
+SALIDAS = 5
+OCULTAS_POR_DEFECTO = 40
+GANA, GANA_GAMMON, GANA_BACKGAMMON, PIERDE_GAMMON, PIERDE_BACKGAMMON = range(SALIDAS)
+
+_PUNTOS = np.arange(1, 25)
+# Slot de core.board del punto p (1..24) visto por blancas / negras
+_SLOTS_BLANCAS = 24 - _PUNTOS
+_SLOTS_NEGRAS = _PUNTOS - 1
+
+
+def slots_y_turno(posicion: Any, color_en_turno: Optional[str] = None) -> Tuple[List[int], bool]:
+    """
+    28 slots y si mueven las negras, para un EstadoJuego (usa su turno) o un Board
+    (usa 'color_en_turno', blancas por defecto).
+    Parámetros: posicion (EstadoJuego|Board), color_en_turno (str|None)
+    Retorna: Tuple[List[int], bool]
+    """
+    if hasattr(posicion, "conteos_slots"):
+        return posicion.conteos_slots(), posicion.__turno__ == "NEGRAS"
+    return list(posicion.__conteos__), color_en_turno == "negro"
+
+
+def codificar_slots(slots: np.ndarray, negras_en_turno: np.ndarray) -> np.ndarray:
+    """
+    Codificación vectorizada de 198 unidades.
+    Parámetros: slots (N, 28), negras_en_turno (N,) bool
+    Retorna: np.ndarray (N, 198) float32
+    """
+    slots = np.asarray(slots, dtype=np.int16).reshape(-1, 28)
+    negras_en_turno = np.asarray(negras_en_turno, dtype=bool).reshape(-1)
+    n = slots.shape[0]
+    x = np.zeros((n, ENTRADAS), dtype=np.float32)
+    for j, (columnas, signo) in enumerate(((_SLOTS_BLANCAS, 1), (_SLOTS_NEGRAS, -1))):
+        conteo = np.maximum(signo * slots[:, columnas], 0).astype(np.float32)  # (N, 24)
+        bloque = x[:, 96 * j: 96 * (j + 1)].reshape(n, 24, 4)
+        bloque[:, :, 0] = conteo >= 1
+        bloque[:, :, 1] = conteo >= 2
+        bloque[:, :, 2] = conteo >= 3
+        bloque[:, :, 3] = np.maximum(conteo - 3, 0) / 2
+    x[:, 192] = slots[:, 24] / 2
+    x[:, 193] = slots[:, 25] / 2
+    x[:, 194] = slots[:, 26] / 15
+    x[:, 195] = slots[:, 27] / 15
+    x[:, 196] = ~negras_en_turno
+    x[:, 197] = negras_en_turno
+    return x
+
+
+def codificar(posiciones: Iterable[Any], color_en_turno: Optional[str] = None) -> np.ndarray:
+    """
+    Codifica posiciones (EstadoJuego o Board) en una matriz (N, 198).
+    Parámetros: posiciones (Iterable), color_en_turno (str|None): sólo para Board
+    Retorna: np.ndarray
+    """
+    pares = [slots_y_turno(p, color_en_turno) for p in posiciones]
+    if not pares:
+        return np.zeros((0, ENTRADAS), dtype=np.float32)
+    slots, negras = zip(*pares)
+    return codificar_slots(np.array(slots), np.array(negras))
+
+
+def equidad(probabilidades: np.ndarray) -> np.ndarray:
+    """
+    Equidad cúbica-libre (-3..3) a partir de las 5 salidas: 2*gana - 1 + gammons + backgammons.
+    Parámetros: probabilidades (..., 5)
+    Retorna: np.ndarray (...)
+    """
+    p = np.asarray(probabilidades)
+    return (
+        2 * p[..., GANA] - 1
+        + p[..., GANA_GAMMON] - p[..., PIERDE_GAMMON]
+        + p[..., GANA_BACKGAMMON] - p[..., PIERDE_BACKGAMMON]
+    )
+
+
+def _sigmoide(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+class RedEvaluadora:
+    """
+    MLP 198 -> ocultas -> 5 con activaciones sigmoides.
+
+    Atributos (todos dunder):
+      __w1__ (198, H), __b1__ (H,), __w2__ (H, 5), __b2__ (5,): pesos float32.
+    """
+
+    def __init__(self, ocultas: int = OCULTAS_POR_DEFECTO, semilla: Optional[int] = None, pesos: Optional[dict] = None) -> None:
+        """
+        Red con pesos dados (dict w1, b1, w2, b2) o inicializados al azar con 'semilla'.
+        """
+        if pesos is None:
+            if ocultas < 1:
+                raise ValueError("La red necesita al menos una unidad oculta.")
+            rng = np.random.default_rng(semilla)
+            pesos = {
+                "w1": rng.normal(0, 1 / np.sqrt(ENTRADAS), (ENTRADAS, ocultas)),
+                "b1": np.zeros(ocultas),
+                "w2": rng.normal(0, 1 / np.sqrt(ocultas), (ocultas, SALIDAS)),
+                "b2": np.zeros(SALIDAS),
+            }
+        self.cargar_pesos(pesos)
+
+    # ---------------- Pesos ----------------
+
+    def cargar_pesos(self, pesos: dict) -> None:
+        """
+        Reemplaza los pesos validando formas.
+        Parámetros: pesos (dict con w1, b1, w2, b2)
+        Retorna: None
+        """
+        try:
+            w1, b1, w2, b2 = (np.asarray(pesos[k], dtype=np.float32) for k in ("w1", "b1", "w2", "b2"))
+        except KeyError as exc:
+            raise ValueError(f"Faltan pesos: {exc}") from exc
+        ocultas = w1.shape[1] if w1.ndim == 2 else -1
+        if w1.shape != (ENTRADAS, ocultas) or b1.shape != (ocultas,) or w2.shape != (ocultas, SALIDAS) or b2.shape != (SALIDAS,):
+            raise ValueError("Formas de pesos inválidas para una red 198 -> H -> 5.")
+        self.__w1__, self.__b1__, self.__w2__, self.__b2__ = w1, b1, w2, b2
+
+    def pesos(self) -> dict:
+        """Copia de los pesos (w1, b1, w2, b2)."""
+        return {"w1": self.__w1__.copy(), "b1": self.__b1__.copy(), "w2": self.__w2__.copy(), "b2": self.__b2__.copy()}
+
+    @property
+    def ocultas(self) -> int:
+        """Cantidad de unidades ocultas."""
+        return self.__w1__.shape[1]
+
+    @classmethod
+    def desde_npz(cls, ruta: str) -> "RedEvaluadora":
+        """
+        Carga una red desde un archivo .npz local (claves w1, b1, w2, b2).
+        Parámetros: ruta (str)
+        Retorna: RedEvaluadora
+        """
+        with np.load(ruta) as datos:
+            return cls(pesos={k: datos[k] for k in datos.files})
+
+    def guardar_npz(self, ruta: str) -> None:
+        """
+        Guarda los pesos en un .npz.
+        Parámetros: ruta (str)
+        Retorna: None
+        """
+        np.savez(ruta, **self.pesos())
+
+    # ---------------- Inferencia ----------------
+
+    def propagar(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Forward con activaciones intermedias (para entrenamiento).
+        Parámetros: x (N, 198)
+        Retorna: (ocultas (N, H), salidas (N, 5))
+        """
+        h = _sigmoide(x @ self.__w1__ + self.__b1__)
+        return h, _sigmoide(h @ self.__w2__ + self.__b2__)
+
+    def evaluar_lote(self, entradas: Any, color_en_turno: Optional[str] = None) -> np.ndarray:
+        """
+        Probabilidades (N, 5) para una matriz (N, 198) o una secuencia de posiciones.
+        Parámetros: entradas (np.ndarray|Sequence), color_en_turno (str|None): sólo para Board
+        Retorna: np.ndarray
+        """
+        if isinstance(entradas, np.ndarray):
+            x = entradas.reshape(-1, ENTRADAS).astype(np.float32, copy=False)
+        else:
+            x = codificar(entradas, color_en_turno)
+        return self.propagar(x)[1]
+
+    def evaluar(self, posicion: Any, color_en_turno: Optional[str] = None) -> np.ndarray:
+        """
+        Probabilidades (5,) de una sola posición.
+        Parámetros: posicion (EstadoJuego|Board), color_en_turno (str|None)
+        Retorna: np.ndarray
+        """
+        return self.evaluar_lote([posicion], color_en_turno)[0]
+
+    def __call__(self, estado: Any) -> float:
+        """Equidad para el jugador en turno (compatible con cli.busqueda.Evaluador)."""
+        return float(equidad(self.evaluar(estado)))
+
+    def evaluar_jugadas(self, estado: Any, jugadas: Sequence[Sequence[Tuple[int, int]]]) -> np.ndarray:
+        """
+        Equidad de cada jugada para quien la hace, en una sola pasada por lotes.
+        Aplica cada jugada con aplicar_paso()/deshacer_paso() sobre 'estado' y lo deja igual.
+        Parámetros: estado (EstadoJuego), jugadas (Sequence[Jugada])
+        Retorna: np.ndarray (len(jugadas),)
+        """
+        if not jugadas:
+            return np.zeros(0, dtype=np.float32)
+        slots = np.empty((len(jugadas), 28), dtype=np.int16)
+        for i, jugada in enumerate(jugadas):
+            tokens = [estado.aplicar_paso(desde, pasos) for desde, pasos in jugada]
+            slots[i] = estado.conteos_slots()
+            for token in reversed(tokens):
+                estado.deshacer_paso(token)
+        # Tras la jugada mueve el rival: su equidad negada es la de quien movió
+        rival_negras = np.full(len(jugadas), estado.__turno__ == "BLANCAS")
+        return -equidad(self.evaluar_lote(codificar_slots(slots, rival_negras)))
+
+
+__all__ = [
+    "RedEvaluadora",
+    "codificar",
+    "codificar_slots",
+    "slots_y_turno",
+    "equidad",
+    "ENTRADAS",
+    "SALIDAS",
+]
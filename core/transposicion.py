@@ -0,0 +1,196 @@
+"""
+Tabla de transposición para evaluaciones de posiciones.
+
+La clave es la clave Zobrist de la posición (con turno) combinada con la tirada,
+así que sirve igual para `core.board.Board` / `core.game.Game` y para
+`cli.state.EstadoJuego` (comparten el espacio de claves de `core.zobrist`).
+
+Memoria fija: la capacidad se deriva de un presupuesto en bytes y se reparte en
+cubetas de `VIAS` entradas. Al llenarse una cubeta se reemplaza primero la entrada
+de una generación anterior (edad) y, entre las de la generación actual, la de menor
+profundidad. Lleva contadores de aciertos, fallos y desalojos.
+"""
+
+from __future__ import annotations
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+VIAS = 4
+# Estimación aproximada del costo de una entrada en CPython (4 referencias + objetos int)
+BYTES_POR_ENTRADA = 96
+MEMORIA_POR_DEFECTO = 16 * 1024 * 1024
+
+_rng = random.Random(0x7AB1E)
+# Máscara por tirada (índice 6 * (menor - 1) + mayor; 0 = sin tirada)
+_TIRADAS = (0,) + tuple(_rng.getrandbits(64) for _ in range(36))
+
+
+def codigo_tirada(dados: Optional[Sequence[int]]) -> int:
+    """
+    Código 0..36 de la tirada sin importar el orden (dobles expandidos cuentan igual).
+    Parámetros: dados (Sequence[int]|None)
+    Retorna: int (0 si no hay dados)
+    """
+    if not dados:
+        return 0
+    menor, mayor = min(dados[:2]), max(dados[:2])
+    if not 1 <= menor <= mayor <= 6:
+        raise ValueError(f"Tirada inválida: {dados}")
+    return 6 * (menor - 1) + mayor
+
+
+def clave_de(origen: Any) -> int:
+    """
+    Clave Zobrist con turno de un EstadoJuego, un Board (sin turno) o un Game
+    (Board del adaptador + jugador_actual).
+    Parámetros: origen (EstadoJuego|Board|Game)
+    Retorna: int
+    """
+    if hasattr(origen, "jugador_actual") and hasattr(origen, "board"):
+        board = getattr(origen.board, "_b", origen.board)
+        return board.clave_zobrist(origen.jugador_actual)
+    return origen.clave_zobrist()
+
+
+class TablaTransposicion:
+    """
+    Tabla (clave de posición, tirada) -> valor con presupuesto de memoria fijo.
+
+    Atributos (todos dunder):
+      __claves__, __valores__, __profundidades__, __generaciones__ (List): cubetas planas.
+      __generacion__ (int): edad actual; nueva_generacion() la incrementa.
+      __aciertos__, __fallos__, __desalojos__ (int): contadores.
+    """
+
+    def __init__(self, memoria_bytes: int = MEMORIA_POR_DEFECTO, capacidad: Optional[int] = None) -> None:
+        """
+        Crea la tabla. 'capacidad' (entradas) tiene prioridad sobre 'memoria_bytes'.
+        Parámetros: memoria_bytes (int), capacidad (int|None)
+        """
+        entradas = capacidad if capacidad is not None else memoria_bytes // BYTES_POR_ENTRADA
+        if entradas < 1:
+            raise ValueError("La tabla de transposición necesita al menos una entrada.")
+        self.__cubetas__ = max(1, entradas // VIAS)
+        total = self.__cubetas__ * VIAS
+        self.__claves__: List[Optional[int]] = [None] * total
+        self.__valores__: List[Any] = [None] * total
+        self.__profundidades__: List[int] = [0] * total
+        self.__generaciones__: List[int] = [0] * total
+        self.__generacion__ = 0
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
+        self.__desalojos__ = 0
+
+    def __len__(self) -> int:
+        return sum(1 for c in self.__claves__ if c is not None)
+
+    @property
+    def capacidad(self) -> int:
+        """Cantidad máxima de entradas."""
+        return len(self.__claves__)
+
+    @staticmethod
+    def combinar(clave: int, dados: Optional[Sequence[int]] = None) -> int:
+        """Clave interna de (posición, tirada)."""
+        return clave ^ _TIRADAS[codigo_tirada(dados)]
+
+    def __base__(self, clave: int) -> int:
+        return (clave % self.__cubetas__) * VIAS
+
+    def buscar(self, clave: int, dados: Optional[Sequence[int]] = None, profundidad: int = 0) -> Optional[Any]:
+        """
+        Valor guardado para (clave, tirada) con al menos 'profundidad', o None.
+        Un acierto refresca la edad de la entrada.
+        Parámetros: clave (int), dados (Sequence[int]|None), profundidad (int)
+        Retorna: Any|None
+        """
+        k = self.combinar(clave, dados)
+        base = self.__base__(k)
+        for i in range(base, base + VIAS):
+            if self.__claves__[i] == k:
+                if self.__profundidades__[i] >= profundidad:
+                    self.__aciertos__ += 1
+                    self.__generaciones__[i] = self.__generacion__
+                    return self.__valores__[i]
+                break
+        self.__fallos__ += 1
+        return None
+
+    def guardar(self, clave: int, dados: Optional[Sequence[int]], valor: Any, profundidad: int = 0) -> None:
+        """
+        Guarda 'valor' para (clave, tirada). Una entrada existente sólo se pisa con
+        igual o mayor profundidad (o si es de una generación anterior).
+        Parámetros: clave (int), dados (Sequence[int]|None), valor (Any), profundidad (int)
+        Retorna: None
+        """
+        k = self.combinar(clave, dados)
+        base = self.__base__(k)
+        victima = base
+        peor = None
+        for i in range(base, base + VIAS):
+            actual = self.__claves__[i]
+            if actual == k:
+                if (
+                    profundidad >= self.__profundidades__[i]
+                    or self.__generaciones__[i] != self.__generacion__
+                ):
+                    self.__escribir__(i, k, valor, profundidad)
+                return
+            if actual is None:
+                if peor is None or peor[0] >= 0:
+                    victima, peor = i, (-1, 0)
+                continue
+            # Prioridad de desalojo: generación más vieja primero, luego menor profundidad
+            prioridad = (self.__generaciones__[i], self.__profundidades__[i])
+            if peor is None or prioridad < peor:
+                victima, peor = i, prioridad
+        if self.__claves__[victima] is not None:
+            self.__desalojos__ += 1
+        self.__escribir__(victima, k, valor, profundidad)
+
+    def __escribir__(self, i: int, k: int, valor: Any, profundidad: int) -> None:
+        self.__claves__[i] = k
+        self.__valores__[i] = valor
+        self.__profundidades__[i] = profundidad
+        self.__generaciones__[i] = self.__generacion__
+
+    # Atajos para EstadoJuego / Board / Game
+    def buscar_posicion(self, origen: Any, dados: Optional[Sequence[int]] = None, profundidad: int = 0) -> Optional[Any]:
+        """buscar() usando clave_de(origen)."""
+        return self.buscar(clave_de(origen), dados, profundidad)
+
+    def guardar_posicion(self, origen: Any, dados: Optional[Sequence[int]], valor: Any, profundidad: int = 0) -> None:
+        """guardar() usando clave_de(origen)."""
+        self.guardar(clave_de(origen), dados, valor, profundidad)
+
+    def nueva_generacion(self) -> None:
+        """Envejece las entradas actuales (p. ej. al empezar una búsqueda nueva)."""
+        self.__generacion__ += 1
+
+    def limpiar(self) -> None:
+        """Vacía la tabla y reinicia contadores."""
+        n = len(self.__claves__)
+        self.__claves__ = [None] * n
+        self.__valores__ = [None] * n
+        self.__profundidades__ = [0] * n
+        self.__generaciones__ = [0] * n
+        self.__generacion__ = 0
+        self.__aciertos__ = self.__fallos__ = self.__desalojos__ = 0
+
+    def estadisticas(self) -> Dict[str, float]:
+        """
+        Contadores de uso.
+        Retorna: Dict con aciertos, fallos, desalojos, ocupadas, capacidad y tasa_aciertos.
+        """
+        consultas = self.__aciertos__ + self.__fallos__
+        return {
+            "aciertos": self.__aciertos__,
+            "fallos": self.__fallos__,
+            "desalojos": self.__desalojos__,
+            "ocupadas": len(self),
+            "capacidad": self.capacidad,
+            "tasa_aciertos": self.__aciertos__ / consultas if consultas else 0.0,
+        }
+
+
+__all__ = ["TablaTransposicion", "codigo_tirada", "clave_de", "VIAS", "BYTES_POR_ENTRADA"]
@@ -0,0 +1,105 @@
+"""
+Claves Zobrist de 64 bits compartidas por `core.board.Board` y `cli.state.EstadoJuego`.
+
+Ambos modelos se proyectan sobre los 28 slots de `core.board`:
+  - 0..23: puntos con conteo con signo (+ blancas, - negras).
+  - 24, 25: barra de blancas / negras.  26, 27: borneadas de blancas / negras.
+El punto `p` (1..24) de `EstadoJuego` corresponde al slot `24 - p`, de modo que
+la misma posición tiene la misma clave en ambos modelos.
+
+`TABLA_ESPEJO` permite mantener además, con el mismo costo, la clave de la posición
+con los colores intercambiados (punto i <-> 23 - i, barra y borneadas cruzadas):
+es la base de la forma canónica "el que tira juega con blancas" (ver core.canonico).
+"""
+
+from __future__ import annotations
+import os
+import random
+from typing import Sequence, Tuple
+
+MAX_FICHAS = 15
+NUM_SLOTS = 28
+_DESPLAZAMIENTO = MAX_FICHAS  # índice de conteo 0 dentro de cada fila
+
+_rng = random.Random(0x5EED_BAC6)
+
+# TABLA[slot][valor + 15]; el conteo 0 aporta 0 para que los slots vacíos no alteren la clave.
+TABLA: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(0 if v == 0 else _rng.getrandbits(64) for v in range(-MAX_FICHAS, MAX_FICHAS + 1))
+    for _ in range(NUM_SLOTS)
+)
+# Se aplica (XOR) cuando el turno es de las negras.
+TURNO_NEGRAS: int = _rng.getrandbits(64)
+
+# Espejo de colores: slot del punto i -> 23 - i (signo invertido); barras y borneadas se cruzan.
+ESPEJO_SLOT: Tuple[int, ...] = tuple(23 - s for s in range(24)) + (25, 24, 27, 26)
+# TABLA_ESPEJO[slot][valor + 15] = TABLA del slot y conteo espejados.
+TABLA_ESPEJO: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        TABLA[ESPEJO_SLOT[slot]][(-v if slot < 24 else v) + _DESPLAZAMIENTO]
+        for v in range(-MAX_FICHAS, MAX_FICHAS + 1)
+    )
+    for slot in range(NUM_SLOTS)
+)
+
+# Modo depuración: cada actualización incremental se compara con un recálculo completo.
+VERIFICAR: bool = os.environ.get("BACKGAMMON_ZOBRIST_DEBUG", "0") == "1"
+
+
+def activar_verificacion(activo: bool = True) -> None:
+    """Activa/desactiva la verificación incremental vs. recálculo completo."""
+    global VERIFICAR  # pylint: disable=global-statement
+    VERIFICAR = activo
+
+
+def delta(slot: int, antes: int, despues: int) -> int:
+    """Máscara XOR para pasar el `slot` del conteo `antes` al conteo `despues`."""
+    fila = TABLA[slot]
+    return fila[antes + _DESPLAZAMIENTO] ^ fila[despues + _DESPLAZAMIENTO]
+
+
+def delta_espejo(slot: int, antes: int, despues: int) -> int:
+    """Como delta(), pero para la clave de la posición espejada."""
+    fila = TABLA_ESPEJO[slot]
+    return fila[antes + _DESPLAZAMIENTO] ^ fila[despues + _DESPLAZAMIENTO]
+
+
+def clave_espejo_slots(conteos: Sequence[int]) -> int:
+    """Clave (sin turno) de la posición con los colores intercambiados, desde cero."""
+    clave = 0
+    for slot, valor in enumerate(conteos):
+        if valor:
+            clave ^= TABLA_ESPEJO[slot][valor + _DESPLAZAMIENTO]
+    return clave
+
+
+def clave_slots(conteos: Sequence[int], negras_en_turno: bool = False) -> int:
+    """Clave completa a partir de los 28 conteos (recálculo desde cero)."""
+    clave = TURNO_NEGRAS if negras_en_turno else 0
+    for slot, valor in enumerate(conteos):
+        if valor:
+            clave ^= TABLA[slot][valor + _DESPLAZAMIENTO]
+    return clave
+
+
+def comprobar(incremental: int, completa: int) -> None:
+    """Lanza RuntimeError si la clave incremental no coincide con la recalculada."""
+    if incremental != completa:
+        raise RuntimeError(
+            f"Clave Zobrist desincronizada: incremental={incremental:#018x} completa={completa:#018x}"
+        )
+
+
+__all__ = [
+    "ESPEJO_SLOT",
+    "TABLA",
+    "TABLA_ESPEJO",
+    "TURNO_NEGRAS",
+    "VERIFICAR",
+    "activar_verificacion",
+    "delta",
+    "delta_espejo",
+    "clave_slots",
+    "clave_espejo_slots",
+    "comprobar",
+]
@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from cli import almacen_rollouts as ar
+from cli.almacen_rollouts import AlmacenRollouts, clave_de, rollout_almacenado
+from cli.rollout import combinar, rollout
+from cli.state import EstadoJuego
+from core.board import BLANCO, Board
+from core.dice import Dice
+from core.game import Game
+
+OPCIONES = {"estrategia": "primera", "antitetica": False}
+
+
+def _inicial(turno="BLANCAS"):
+    e = EstadoJuego(__turno__=turno)
+    e.restablecer_inicio()
+    return e
+
+
+def _carrera(n):
+    """Posiciones distintas de carrera (n fichas blancas en el punto 1..24)."""
+    e = EstadoJuego()
+    e.__blancas__[n % 24 + 1] = 1 + n // 24
+    e.__negras__[24] = 15
+    e.__fuera_blancas__ = 15 - e.__blancas__[n % 24 + 1]
+    e.recalcular_zobrist()
+    return e
+
+
+def test_combinar_equivale_a_un_solo_rollout():
+    total = rollout(_inicial(), pruebas=144, **OPCIONES)
+    primera = rollout(_inicial(), pruebas=72, **OPCIONES)
+    segunda = rollout(_inicial(), pruebas=72, previo=primera, **OPCIONES)
+    unido = combinar(primera, segunda)
+    assert (unido.pruebas, unido.muestras, unido.conteos) == (144, 144, total.conteos)
+    assert unido.equidad == pytest.approx(total.equidad)
+    assert unido.varianza == pytest.approx(total.varianza)
+    with pytest.raises(ValueError):
+        combinar(primera, rollout(_inicial(), pruebas=36, seed=1, **OPCIONES))
+
+
+def test_guardar_buscar_y_lector_concurrente(tmp_path):
+    ruta = str(tmp_path / "r.bin")
+    res = rollout(_inicial(), pruebas=72, **OPCIONES)
+    with AlmacenRollouts(ruta, escritura=True) as escritor:
+        lector = AlmacenRollouts(ruta)
+        assert lector.buscar(_inicial()) is None
+        escritor.guardar(_inicial(), res)
+        # La posición inicial con negras en turno tiene el mismo Position ID
+        leido = lector.buscar(_inicial("NEGRAS"))
+        assert leido.equidad == res.equidad and leido.conteos == res.conteos
+        assert leido.configuracion["estrategia"] == "primera" and len(lector) == 1
+        with pytest.raises(RuntimeError):
+            lector.guardar(_inicial(), res)
+        with pytest.raises(RuntimeError):
+            AlmacenRollouts(ruta, escritura=True)
+        lector.cerrar()
+    assert AlmacenRollouts(ruta).buscar(_inicial().id_posicion()).pruebas == 72
+
+
+def test_rollout_almacenado_continua_lo_guardado(tmp_path):
+    with AlmacenRollouts(str(tmp_path / "r.bin"), escritura=True) as almacen:
+        rollout_almacenado(_inicial(), almacen, pruebas=72, **OPCIONES)
+        res = rollout_almacenado(_inicial(), almacen, pruebas=144, **OPCIONES)
+        assert res.pruebas == 144
+        assert res.conteos == rollout(_inicial(), pruebas=144, **OPCIONES).conteos
+        # Ya alcanza: no juega de nuevo
+        assert rollout_almacenado(_inicial(), almacen, pruebas=100, **OPCIONES) == res
+        # Otra estrategia: se queda con el de más pruebas
+        otro = rollout_almacenado(_inicial(), almacen, pruebas=36, seed=3, **OPCIONES)
+        assert otro.configuracion["seed"] == 0
+        assert almacen.buscar(_inicial()).pruebas == 144
+
+
+def test_crece_y_los_lectores_reabren(tmp_path, monkeypatch):
+    monkeypatch.setattr(ar, "CAPACIDAD_INICIAL", 4)
+    ruta = str(tmp_path / "r.bin")
+    res = rollout(_carrera(0), pruebas=36, **OPCIONES)
+    with AlmacenRollouts(ruta, escritura=True) as escritor:
+        lector = AlmacenRollouts(ruta)
+        for n in range(40):
+            escritor.guardar(_carrera(n), res)
+        assert len(escritor) == 40 and escritor.capacidad >= 80
+        assert all(lector.buscar(_carrera(n)) is not None for n in range(40))
+        assert lector.capacidad == escritor.capacidad
+        assert {k for k, _ in lector.items()} == {clave_de(_carrera(n)) for n in range(40)}
+        lector.cerrar()
+
+
+def test_claves_y_archivos_invalidos(tmp_path):
+    board = Board()
+    game = Game(board, dice=Dice(random.Random(0)), jugador_inicial=BLANCO)
+    assert clave_de(game) == clave_de(_inicial()) == clave_de(_inicial().id_posicion())
+    with pytest.raises(ValueError):
+        clave_de(b"corta")
+    ruta = tmp_path / "otro.bin"
+    ruta.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        AlmacenRollouts(str(ruta))
+    with pytest.raises(ValueError):
+        with AlmacenRollouts(str(tmp_path / "r.bin"), escritura=True) as almacen:
+            rollout_almacenado(board, almacen)
+
+
+def test_registro_a_medio_escribir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ar, "REINTENTOS_LECTURA", 3)
+    ruta = str(tmp_path / "r.bin")
+    res = rollout(_inicial(), pruebas=36, **OPCIONES)
+    with AlmacenRollouts(ruta, escritura=True) as escritor:
+        escritor.guardar(_inicial(), res)
+        # Un escritor que murió entre las dos escrituras de la secuencia
+        indice, _ = escritor.__ubicar__(clave_de(_inicial()))
+        ar._SECUENCIA.pack_into(escritor.__mapa__, escritor.__offset__(indice), 3)
+        lector = AlmacenRollouts(ruta)
+        assert lector.buscar(_inicial()) is None and not list(lector.items())
+        # El escritor lo descarta y vuelve a guardar la posición en otro registro
+        assert escritor.guardar(_inicial(), res).pruebas == 36
+        assert lector.buscar(_inicial()).pruebas == 36 and len(list(lector.items())) == 1
+        lector.cerrar()
@@ -0,0 +1,70 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cli.state import EstadoJuego  # noqa: E402
+from core import bearoff  # noqa: E402
+from core.bearoff import BaseBearoff, indice, posiciones_totales, puntos_casa  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def base(tmp_path_factory):
+    ruta = str(tmp_path_factory.mktemp("bo") / "bearoff.bin")
+    assert bearoff.generar(ruta, max_fichas=4) == posiciones_totales(4) == 210
+    with BaseBearoff(ruta) as b:
+        yield b
+
+
+def test_indice_biyectivo_y_sucesores_menores():
+    posiciones = bearoff._todas(4)
+    assert sorted(indice(p) for p in posiciones) == list(range(210))
+    for p in posiciones[1:]:
+        for dado in range(1, 7):
+            assert all(indice(s) < indice(p) for s in bearoff._pasos(p, dado))
+    with pytest.raises(ValueError):
+        indice([1, 2, 3])
+
+
+def test_base_chica_es_prefijo_de_la_grande():
+    chica = bearoff.generar_distribuciones(2)
+    grande = bearoff.generar_distribuciones(3)
+    assert np.allclose(grande[: len(chica)], chica)
+
+
+def test_valores_conocidos(base):
+    assert base.distribucion((0,) * 6)[0] == 1.0
+    assert base.media((1, 0, 0, 0, 0, 0)) == pytest.approx(1.0)
+    # Un ficha en el 6: falla con 1-1, 1-2, 1-3, 1-4 y 2-3 (9/36)
+    assert base.media((0, 0, 0, 0, 0, 1)) == pytest.approx(1.25, abs=1e-6)
+    for pos in ((2, 0, 1, 0, 0, 1), (0, 0, 0, 0, 0, 4)):
+        assert sum(base.distribucion(pos)) == pytest.approx(1.0, abs=1e-5)
+
+
+def test_probabilidad_ganar(base):
+    assert base.probabilidad_ganar((1, 0, 0, 0, 0, 0), (0, 0, 0, 0, 0, 4)) == pytest.approx(1.0)
+    assert base.probabilidad_ganar((0, 0, 0, 0, 0, 1), (1, 0, 0, 0, 0, 0)) == pytest.approx(27 / 36, abs=1e-6)
+    with pytest.raises(ValueError):
+        base.distribucion((5, 0, 0, 0, 0, 0))
+
+
+def test_archivo_invalido(tmp_path):
+    ruta = tmp_path / "malo.bin"
+    ruta.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        BaseBearoff(str(ruta))
+
+
+def test_puntos_casa_desde_estado():
+    e = EstadoJuego()
+    e.__blancas__[1], e.__blancas__[6] = 2, 1
+    e.__negras__[24], e.__negras__[19] = 3, 1
+    assert puntos_casa(e, "BLANCAS") == (2, 0, 0, 0, 0, 1)
+    assert puntos_casa(e, "NEGRAS") == (3, 0, 0, 0, 0, 1)
+    e.__negras__[10] = 1
+    assert puntos_casa(e, "NEGRAS") is None
+
+
+def test_main_genera(tmp_path, capsys):
+    ruta = str(tmp_path / "b.bin")
+    assert bearoff.main(["--salida", ruta, "--fichas", "2"]) == 0
+    assert "28 posiciones" in capsys.readouterr().out
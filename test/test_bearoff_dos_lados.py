@@ -0,0 +1,64 @@
+import functools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cli.state import EstadoJuego  # noqa: E402
+from core import bearoff_dos_lados as dos  # noqa: E402
+from core.bearoff import _TIRADAS, _todas, indice  # noqa: E402
+from core.bearoff_dos_lados import TablaBearoffDosLados  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def tabla(tmp_path_factory):
+    ruta = str(tmp_path_factory.mktemp("bo2") / "bearoff2.bin")
+    assert dos.generar(ruta, max_fichas=3) == 84
+    with TablaBearoffDosLados(ruta) as t:
+        yield t
+
+
+def test_coincide_con_recursion_exacta():
+    w = dos.generar_matriz(2)
+    posiciones = _todas(2)
+
+    @functools.lru_cache(maxsize=None)
+    def referencia(a, b):
+        if not any(a):
+            return 1.0
+        if not any(b):
+            return 0.0
+        return sum(
+            p * max(1 - referencia(b, posiciones[s]) for s in dos._tras_tirada(a, x, y))
+            for x, y, p in _TIRADAS
+        )
+
+    for a in posiciones[1:]:
+        for b in posiciones[1:]:
+            assert w[indice(a), indice(b)] == pytest.approx(referencia(a, b), abs=1e-12)
+
+
+def test_consultas(tabla):
+    uno_en_6, uno_en_1 = (0, 0, 0, 0, 0, 1), (1, 0, 0, 0, 0, 0)
+    assert tabla.probabilidad_ganar(uno_en_1, uno_en_6) == 1.0
+    assert tabla.probabilidad_ganar(uno_en_6, uno_en_1) == pytest.approx(27 / 36, abs=1e-4)
+    assert tabla.probabilidad_ganar((0,) * 6, uno_en_6) == 1.0
+    with pytest.raises(ValueError):
+        tabla.probabilidad_ganar((4, 0, 0, 0, 0, 0), uno_en_1)
+
+
+def test_desde_estado(tabla):
+    e = EstadoJuego(__turno__="NEGRAS")
+    e.__blancas__[1] = 1
+    e.__negras__[19] = 1
+    e.__fuera_blancas__ = e.__fuera_negras__ = 14
+    assert tabla.probabilidad_estado(e) == pytest.approx(27 / 36, abs=1e-4)
+    e.__negras__[19], e.__negras__[10] = 0, 1
+    assert tabla.probabilidad_estado(e) is None
+
+
+def test_archivo_invalido(tmp_path):
+    ruta = tmp_path / "malo.bin"
+    ruta.write_bytes(b"y" * 32)
+    with pytest.raises(ValueError):
+        TablaBearoffDosLados(str(ruta))
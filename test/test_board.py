@@ -170,6 +170,25 @@ class TestAliasesAndCounts(unittest.TestCase):
         self.b.__barra__[BLANCO].append(BLANCO)
         self.assertEqual(self.b.contar_en_barra(BLANCO), 1)
 
+    def test_vista_vieja_no_pisa_el_tablero(self):
+        vista = self.b.__posiciones__[0]
+        self.b.mover_ficha(0, 1)
+        with self.assertRaises(ValueError):
+            vista.append(vista[0])
+        self.assertEqual(self.b.total_checkers(), 30)
+        # Una vista nueva sí escribe, y sigue vigente tras sus propias escrituras
+        vista = self.b.__posiciones__[0]
+        vista.append(BLANCO)
+        vista.pop()
+        self.assertEqual(self.b.point_count(0), 1)
+
+    def test_barra_como_dict(self):
+        import json
+        self.b.__barra__[NEGRO].append(NEGRO)
+        self.assertEqual(dict(self.b.__barra__), {BLANCO: [], NEGRO: [NEGRO]})
+        self.assertEqual({**self.b.__fichas_fuera__}, {BLANCO: [], NEGRO: []})
+        self.assertEqual(json.loads(json.dumps(self.b.__barra__)), {BLANCO: [], NEGRO: [NEGRO]})
+
 
 class TestTopAndSnapshots(unittest.TestCase):
     def setUp(self):
@@ -289,5 +308,249 @@ class TestCalculosYValidaciones(unittest.TestCase):
         ok = self.b.aplicar_movimiento(-1, destino, BLANCO)
         self.assertFalse(ok)
 
+
+class TestMotorDeConteos(unittest.TestCase):
+    def setUp(self):
+        self.b = Board()
+
+    def test_conteos_con_signo_en_el_arreglo(self):
+        self.assertEqual(self.b.__conteos__[0], 2)
+        self.assertEqual(self.b.__conteos__[5], -5)
+        self.b.push_to_bar(NEGRO)
+        self.b.push_borne_off(BLANCO)
+        self.assertEqual(self.b.bar_count(NEGRO), 1)
+        self.assertEqual(self.b.borne_off_count(BLANCO), 1)
+
+    def test_clone_copia_solo_conteos(self):
+        c = self.b.clone()
+        c.mover_ficha(0, 1)
+        self.assertEqual(self.b.point_count(0), 2)
+        self.assertEqual(c.point_count(0), 1)
+        self.assertEqual(c.total_checkers(BLANCO), 15)
+
+    def test_vistas_reflejan_escrituras_y_lecturas(self):
+        self.b.__posiciones__[9] = [NEGRO, NEGRO, NEGRO]
+        self.assertEqual(self.b.point_count(9), 3)
+        self.assertEqual(self.b.__posiciones__[9], [NEGRO] * 3)
+        self.assertEqual(len(self.b.__posiciones__), 24)
+        self.b.__fichas_fuera__[NEGRO].append(NEGRO)
+        self.assertEqual(self.b.__fichas_fuera__.get(NEGRO), [NEGRO])
+        self.b.__barra__[BLANCO].append(BLANCO)
+        self.b.__barra__[BLANCO].pop()
+        self.assertEqual(self.b.bar_count(BLANCO), 0)
+
+    def test_pila_mixta_rechazada(self):
+        with self.assertRaises(ValueError):
+            self.b.__posiciones__[9] = [NEGRO, BLANCO]
+        with self.assertRaises(ValueError):
+            self.b.__barra__[BLANCO].append(NEGRO)
+
+    def test_agregar_sobre_rival_y_mover_a_bloqueo(self):
+        with self.assertRaises(ValueError):
+            self.b.agregar_ficha(5, BLANCO)
+        # 0 -> 5: punto negro con 5 fichas, no se modifica nada
+        with self.assertRaises(ValueError):
+            self.b.mover_ficha(0, 5)
+        self.assertEqual(self.b.point_count(0), 2)
+        self.assertEqual(self.b.total_checkers(), 30)
+
+    def test_captura_negra_sobre_blot_blanco(self):
+        self.b.mover_ficha(0, 6)  # blot blanco en 6
+        self.b.mover_ficha(7, 6)
+        self.assertEqual(self.b.obtener_barra(BLANCO), [BLANCO])
+        self.assertEqual(self.b.obtener_punto(6), [NEGRO])
+        self.assertEqual(self.b.total_checkers(BLANCO), 15)
+
+
+class TestZobrist(unittest.TestCase):
+    def setUp(self):
+        from core import zobrist
+        self.zobrist = zobrist
+        zobrist.activar_verificacion(True)
+        self.b = Board()
+
+    def tearDown(self):
+        self.zobrist.activar_verificacion(False)
+
+    def test_clave_incremental_tras_movimientos(self):
+        inicial = self.b.clave_zobrist()
+        self.b.mover_ficha(0, 3)
+        self.assertNotEqual(self.b.clave_zobrist(), inicial)
+        self.b.mover_ficha(3, 0)
+        self.assertEqual(self.b.clave_zobrist(), inicial)
+
+    def test_clave_con_captura_barra_y_borneo(self):
+        self.b.__posiciones__[20] = [BLANCO]
+        self.b.mover_ficha(23, 20)  # negra captura
+        self.assertTrue(self.b.mover_desde_barra(BLANCO, 2))
+        self.b.bornear_ficha(18, BLANCO)
+        self.assertEqual(self.b.clave_zobrist(), self.b.clone().recalcular_zobrist())
+
+    def test_clave_con_turno(self):
+        self.assertNotEqual(self.b.clave_zobrist(BLANCO), self.b.clave_zobrist(NEGRO))
+        self.assertEqual(self.b.clave_zobrist(BLANCO), self.b.clave_zobrist())
+
+    def test_vistas_mantienen_clave(self):
+        self.b.__barra__[NEGRO].append(NEGRO)
+        self.b.__posiciones__[4] = [BLANCO, BLANCO]
+        self.assertEqual(self.b.clave_zobrist(), self.b.clone().recalcular_zobrist())
+
+
+class TestApplyUndo(unittest.TestCase):
+    def setUp(self):
+        self.b = Board()
+
+    def _estado(self, b):
+        return (list(b.__conteos__), b.clave_zobrist())
+
+    def test_round_trip_con_captura(self):
+        self.b.__posiciones__[3] = [NEGRO]
+        antes = self._estado(self.b)
+        token = self.b.apply((0, 3, BLANCO))
+        self.assertTrue(token[3])
+        self.assertEqual(self.b.bar_count(NEGRO), 1)
+        self.b.undo(token)
+        self.assertEqual(self._estado(self.b), antes)
+
+    def test_round_trip_barra_y_borneo(self):
+        from core.board import BARRA, FUERA
+        self.b.__barra__[NEGRO].append(NEGRO)
+        self.b.__posiciones__[23] = []
+        antes = self._estado(self.b)
+        self.b.apply((BARRA, 20, NEGRO))
+        self.b.apply((18, FUERA, BLANCO))
+        self.assertEqual(self.b.borne_off_count(BLANCO), 1)
+        self.assertEqual(self.b.profundidad_deshacer(), 2)
+        self.b.undo()
+        self.b.undo()
+        self.assertEqual(self._estado(self.b), antes)
+
+    def test_movimientos_invalidos_no_modifican(self):
+        from core.board import BARRA
+        antes = self._estado(self.b)
+        with self.assertRaises(ValueError):
+            self.b.apply((0, 5, BLANCO))  # bloqueado
+        with self.assertRaises(ValueError):
+            self.b.apply((BARRA, 3, BLANCO))  # barra vacía
+        with self.assertRaises(ValueError):
+            self.b.apply((5, 4, BLANCO))  # ficha ajena
+        with self.assertRaises(ValueError):
+            self.b.undo()
+        self.assertEqual(self._estado(self.b), antes)
+
+    def test_undo_fuera_de_orden(self):
+        t1 = self.b.apply((0, 1, BLANCO))
+        self.b.apply((0, 2, BLANCO))
+        with self.assertRaises(ValueError):
+            self.b.undo(t1)
+
+    def test_secuencia_aleatoria_invariantes(self):
+        import random
+        from core.board import BARRA
+        rng = random.Random(5)
+        antes = self._estado(self.b)
+        tokens = []
+        for paso in range(300):
+            color = BLANCO if paso % 2 == 0 else NEGRO
+            d = rng.randint(1, 6)
+            if self.b.bar_count(color):
+                movs = [(BARRA, self.b.calcular_destino_barra(color, d), color)]
+            else:
+                movs = [(o, self.b.calcular_destino(o, color, d), color)
+                        for o in range(24) if self.b.top_color_at(o) == color]
+            movs = [m for m in movs if self.b.es_movimiento_legal(m[0], m[1], color)]
+            if not movs:
+                continue
+            tokens.append(self.b.apply(rng.choice(movs)))
+            self.assertEqual(self.b.total_checkers(BLANCO), 15)
+            self.assertEqual(self.b.total_checkers(NEGRO), 15)
+        self.assertGreater(len(tokens), 100)
+        for token in reversed(tokens):
+            self.b.undo(token)
+        self.assertEqual(self._estado(self.b), antes)
+        self.assertEqual(self.b.clave_zobrist(), self.b.recalcular_zobrist())
+
+
+class TestCarrera(unittest.TestCase):
+    @staticmethod
+    def _por_recorrido(b):
+        c = list(b.__conteos__)
+        pips_b = sum((24 - i) * v for i, v in enumerate(c[:24]) if v > 0) + 25 * c[24]
+        pips_n = sum((i + 1) * -v for i, v in enumerate(c[:24]) if v < 0) + 25 * c[25]
+        blancas = [24 - i for i in range(24) if c[i] > 0] + [25] * (c[24] > 0)
+        negras = [i + 1 for i in range(24) if c[i] < 0] + [25] * (c[25] > 0)
+        atras_b, atras_n = max(blancas, default=0), max(negras, default=0)
+        contacto = any(i < j for i in range(24) if c[i] > 0 for j in range(24) if c[j] < 0)
+        contacto = contacto or (c[24] > 0 and negras) or (c[25] > 0 and blancas)
+        return pips_b, pips_n, atras_b, atras_n, not contacto
+
+    def _incremental(self, b):
+        return (b.pip_count(BLANCO), b.pip_count(NEGRO),
+                b.furthest_back(BLANCO), b.furthest_back(NEGRO), b.is_race())
+
+    def test_inicio(self):
+        b = Board()
+        self.assertEqual(self._incremental(b), (167, 167, 24, 24, False))
+        self.assertEqual(b.conteo_pips(NEGRO), 167)
+        self.assertFalse(b.es_carrera())
+
+    def test_carrera_tras_pasarse(self):
+        from array import array
+        b = Board()
+        b.__conteos__[:] = array("b", [0] * 28)
+        b.__conteos__[20], b.__conteos__[2] = 15, -15
+        b.recalcular_zobrist()
+        self.assertTrue(b.is_race())
+        b.mover_ficha(2, 1)
+        self.assertTrue(b.is_race())
+        b.apply((20, 22, BLANCO))
+        self.assertEqual(self._incremental(b), self._por_recorrido(b))
+
+    def test_partida_aleatoria_coincide_con_recorrido(self):
+        import random
+        from core.board import BARRA, FUERA
+        rng = random.Random(11)
+        b = Board()
+        for paso in range(600):
+            if paso == 300:
+                b = b.clone()  # pila de deshacer vacía: la segunda mitad usa sólo apply()
+            color = BLANCO if paso % 2 == 0 else NEGRO
+            d = rng.randint(1, 6)
+            if b.bar_count(color):
+                movs = [(BARRA, b.calcular_destino_barra(color, d), color)]
+            else:
+                movs = []
+                for o in range(24):
+                    if b.top_color_at(o) != color:
+                        continue
+                    destino = b.calcular_destino(o, color, d)
+                    if 0 <= destino < 24:
+                        movs.append((o, destino, color))
+                    elif all(b.is_home_point(color, i) for i in range(24) if b.top_color_at(i) == color):
+                        movs.append((o, FUERA, color))
+            movs = [m for m in movs if m[1] == FUERA or b.es_movimiento_legal(m[0], m[1], color)]
+            if not movs:
+                continue
+            m = rng.choice(movs)
+            if paso < 300 and m[0] != BARRA and m[1] != FUERA:
+                b.mover_ficha(m[0], m[1])
+            else:
+                b.apply(m)
+            self.assertEqual(self._incremental(b), self._por_recorrido(b))
+        while b.profundidad_deshacer():
+            b.undo()
+            self.assertEqual(self._incremental(b), self._por_recorrido(b))
+
+    def test_barra_y_position_id(self):
+        b = Board()
+        b.mover_ficha(0, 1)
+        b.mover_ficha(5, 1)  # captura: la blanca vuelve a la barra
+        self.assertEqual(self._incremental(b), self._por_recorrido(b))
+        self.assertTrue(b.mover_desde_barra(BLANCO, 2))
+        self.assertEqual(self._incremental(b), self._por_recorrido(b))
+        copia = Board.from_position_id(b.position_id())
+        self.assertEqual(self._incremental(copia), self._por_recorrido(b))
+
+
 if __name__ == "__main__":
     unittest.main()
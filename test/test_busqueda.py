@@ -0,0 +1,134 @@
+import random
+
+import pytest
+
+from cli import cache_jugadas, simulate
+from cli.busqueda import (
+    TIRADAS,
+    MotorExpectiminimax,
+    estado_desde_game,
+    evaluar_heuristica,
+    jugada_a_movimientos,
+)
+from cli.jugadas import generar_jugadas
+from cli.state import BARRA, EstadoJuego
+from core.board import BARRA as BARRA_BOARD, BLANCO, FUERA, NEGRO, Board
+from core.dice import Dice
+from core.game import Game
+
+
+def _inicial(d1, d2):
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    e.set_dados(d1, d2)
+    return e
+
+
+def test_tiradas_suman_uno():
+    assert len(TIRADAS) == 21
+    assert abs(sum(p for _, _, p in TIRADAS) - 1.0) < 1e-12
+
+
+def test_heuristica_simetrica_en_el_inicio():
+    e = _inicial(3, 1)
+    blancas = evaluar_heuristica(e)
+    e.cambiar_turno()
+    assert abs(blancas - evaluar_heuristica(e)) < 1e-12
+    assert -1 < blancas < 1
+
+
+def test_apertura_31_hace_el_punto_5():
+    for profundidad in (1, 2):
+        jugada = MotorExpectiminimax(profundidad, top_k=4).elegir(_inicial(3, 1))
+        assert sorted(jugada) == [(6, 1), (8, 3)]
+
+
+def test_busqueda_no_modifica_el_estado():
+    e = _inicial(6, 4)
+    antes = (e.conteos_slots(), e.clave_zobrist(), list(e.__movimientos_pendientes__))
+    valores = MotorExpectiminimax(2, top_k=3).evaluar_jugadas(e)
+    assert (e.conteos_slots(), e.clave_zobrist(), e.__movimientos_pendientes__) == antes
+    assert len(valores) == 3
+    assert [v for _, v in valores] == sorted((v for _, v in valores), reverse=True)
+
+
+def test_termina_la_partida_si_puede():
+    e = EstadoJuego(__turno__="BLANCAS")
+    e.__blancas__[2], e.__fuera_blancas__ = 1, 14
+    e.__negras__[24], e.__fuera_negras__ = 1, 14
+    e.recalcular_zobrist()
+    e.set_dados(2, 1)
+    valores = MotorExpectiminimax(2).evaluar_jugadas(e)
+    assert valores[0][1] == 1.0
+
+
+def test_tabla_de_transposicion_reutiliza_valores():
+    m = MotorExpectiminimax(2, top_k=None)
+    primera = m.evaluar_jugadas(_inicial(4, 2))
+    nodos = m.estadisticas()["nodos"]
+    assert m.evaluar_jugadas(_inicial(4, 2)) == primera
+    assert m.estadisticas()["aciertos"] >= nodos > m.estadisticas()["nodos"]
+
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        MotorExpectiminimax(0)
+    with pytest.raises(ValueError):
+        MotorExpectiminimax(1, top_k=0)
+
+
+def test_game_traduce_a_movimientos_de_board():
+    board = Board()
+    game = Game(board, dice=Dice(random.Random(0)), jugador_inicial=BLANCO)
+    game.dice.tirar()
+    estado = estado_desde_game(game)
+    inicial = EstadoJuego()
+    inicial.restablecer_inicio()
+    assert estado.conteos_slots() == inicial.conteos_slots()
+    movimientos = MotorExpectiminimax(1).elegir_para_game(game)
+    assert movimientos
+    for mov in movimientos:
+        board.apply(mov)
+    assert board.total_checkers(BLANCO) == 15
+
+
+def test_jugada_a_movimientos_barra_y_borneo():
+    assert jugada_a_movimientos(((BARRA, 3), (2, 2)), BLANCO) == [
+        (BARRA_BOARD, 2, BLANCO),
+        (22, FUERA, BLANCO),
+    ]
+    assert jugada_a_movimientos(((BARRA, 3), (23, 2)), NEGRO) == [
+        (BARRA_BOARD, 21, NEGRO),
+        (1, FUERA, NEGRO),
+    ]
+
+
+def test_estrategia_en_simulacion():
+    e = _inicial(6, 5)
+    jugadas = e.jugadas_legales()
+    elegida = simulate.resolver_estrategia("expectiminimax")(e, jugadas, random.Random(5))
+    assert elegida in jugadas
+
+
+def test_estrategia_negras_con_cache_espejada_de_blancas():
+    cache_jugadas.activar(True)
+    negras = EstadoJuego.desde_id_posicion("74QriADuX4CAQA", "NEGRAS")
+    negras.set_dados(6, 6)
+    blancas = EstadoJuego.desde_id_posicion(negras.clave_posicion(), "BLANCAS")
+    blancas.set_dados(6, 6)
+    cache_jugadas.CACHE.limpiar()
+    cache_jugadas.CACHE.jugadas(blancas)
+    jugadas = generar_jugadas(negras)
+    motor = MotorExpectiminimax(profundidad=2, top_k=6)
+    espejada = motor.elegir(negras)
+    assert espejada not in jugadas  # mismo destino con otro orden de pasos
+    elegida = simulate.resolver_estrategia("expectiminimax")(negras, jugadas, random.Random(0))
+    assert elegida in jugadas
+
+    def destino(jugada):
+        copia = EstadoJuego.desde_id_posicion(negras.clave_posicion(), "NEGRAS")
+        for desde, pasos in jugada:
+            copia.aplicar_paso(desde, pasos)
+        return copia.conteos_slots()
+
+    assert destino(elegida) == destino(espejada)
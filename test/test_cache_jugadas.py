@@ -0,0 +1,100 @@
+import pytest
+
+from cli import cache_jugadas
+from cli.busqueda import jugada_a_movimientos
+from cli.cache_jugadas import CacheJugadas
+from cli.jugadas import generar_jugadas
+from cli.state import EstadoJuego
+from core.board import BLANCO, NEGRO, Board
+
+
+def _inicial(d1=3, d2=1):
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    e.set_dados(d1, d2)
+    return e
+
+
+@pytest.fixture(autouse=True)
+def cache_activa():
+    cache_jugadas.activar(True)
+    yield
+    cache_jugadas.activar(True)
+
+
+def test_aciertos_por_sitio_y_mismo_resultado():
+    cache = CacheJugadas()
+    e = _inicial()
+    esperado = generar_jugadas(e)
+    assert cache.jugadas(e, sitio="a") == esperado
+    assert cache.jugadas(e, sitio="a") == esperado
+    assert cache.jugadas(e, (1, 3), sitio="b") == esperado  # dados ordenados en la clave
+    stats = cache.estadisticas()
+    assert stats["a"] == {"aciertos": 1, "fallos": 1, "tasa_aciertos": 0.5}
+    assert stats["b"]["aciertos"] == 1 and len(cache) == 1
+
+
+def _finales(estado, jugadas):
+    """Posiciones (slots) a las que llevan las jugadas."""
+    out = set()
+    for jugada in jugadas:
+        tokens = [estado.aplicar_paso(desde, pasos) for desde, pasos in jugada]
+        out.add(tuple(estado.conteos_slots()))
+        for token in reversed(tokens):
+            estado.deshacer_paso(token)
+    return out
+
+
+def test_la_clave_incluye_dados_y_espeja_al_otro_color():
+    cache = CacheJugadas()
+    e = _inicial()
+    cache.jugadas(e)
+    # La posición inicial con negras en turno es el espejo de la misma con blancas
+    e.cambiar_turno()
+    e.set_dados(3, 1)
+    negras = cache.jugadas(e, sitio="espejo")
+    assert cache.estadisticas()["espejo"]["aciertos"] == 1
+    assert len(negras) == len(generar_jugadas(e))
+    assert _finales(e, negras) == _finales(e, generar_jugadas(e))
+    assert sorted(cache.jugadas(e, (3, 3, 3, 3))) == sorted(generar_jugadas(e, (3, 3, 3, 3)))
+    assert len(cache) == 2
+
+
+def test_lru_acotada():
+    cache = CacheJugadas(max_entradas=2)
+    e = _inicial()
+    for dados in ((1, 2), (3, 4), (1, 2), (5, 6)):
+        cache.jugadas(e, dados)
+    assert len(cache) == 2
+    cache.jugadas(e, (1, 2))  # sobrevivió por ser la más reciente
+    cache.jugadas(e, (3, 4))  # fue desalojada
+    assert cache.estadisticas()["general"] == {"aciertos": 2, "fallos": 4, "tasa_aciertos": 2 / 6}
+    with pytest.raises(ValueError):
+        CacheJugadas(max_entradas=0)
+
+
+def test_desactivada_no_cuenta_ni_guarda():
+    cache = CacheJugadas()
+    cache_jugadas.activar(False)
+    e = _inicial()
+    assert cache.jugadas(e) == generar_jugadas(e)
+    assert len(cache) == 0 and cache.estadisticas() == {}
+
+
+def test_board_comparte_entradas_con_estado():
+    cache = CacheJugadas()
+    board = Board()
+    board.mover_ficha(0, 3)
+    e = EstadoJuego(__turno__="NEGRAS")
+    e.cargar_slots(list(board.__conteos__))
+    movs = cache.jugadas_board(board, NEGRO, (6, 5))
+    assert movs == [jugada_a_movimientos(j, NEGRO) for j in generar_jugadas(e, (6, 5))]
+    assert cache.jugadas(e, (5, 6), sitio="estado") == generar_jugadas(e, (6, 5))
+    assert cache.estadisticas()["estado"]["aciertos"] == 1
+    for jugada in movs:
+        tokens = [board.apply(m) for m in jugada]
+        for token in reversed(tokens):
+            board.undo(token)
+    assert cache.jugadas_board(board, BLANCO, (2, 2, 2, 2))
+    with pytest.raises(ValueError):
+        cache.jugadas_board(board, "verde", (1, 2))
@@ -0,0 +1,90 @@
+import random
+from array import array
+
+from cli.jugadas import generar_jugadas
+from cli.busqueda import jugada_a_movimientos
+from cli.state import EstadoJuego
+from core import zobrist
+from core.board import BLANCO, NEGRO, Board
+from core.canonico import (
+    clave_canonica,
+    espejar_jugada,
+    espejar_movimiento,
+    espejar_slots,
+    forma_canonica,
+)
+
+
+def _estado_aleatorio(semilla):
+    rng = random.Random(semilla)
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    for _ in range(rng.randint(4, 30)):
+        e.set_dados(rng.randint(1, 6), rng.randint(1, 6))
+        jugadas = e.jugadas_legales()
+        for desde, pasos in rng.choice(jugadas) if jugadas and jugadas[0] else ():
+            e.aplicar_paso(desde, pasos)
+        e.cambiar_turno()
+    return e
+
+
+def _espejo(e):
+    otro = EstadoJuego(__turno__="BLANCAS" if e.__turno__ == "NEGRAS" else "NEGRAS")
+    otro.cargar_slots(espejar_slots(e.conteos_slots()))
+    return otro
+
+
+def test_espejo_es_involucion_y_mantiene_fichas():
+    e = _estado_aleatorio(1)
+    slots = e.conteos_slots()
+    assert espejar_slots(espejar_slots(slots)) == slots
+    assert espejar_slots(Board().__conteos__) == list(Board().__conteos__)
+    canonicos, espejado = forma_canonica(slots, True)
+    assert espejado and canonicos == espejar_slots(slots)
+    assert forma_canonica(slots, False) == (slots, False)
+
+
+def test_claves_canonicas_coinciden_con_el_espejo():
+    for semilla in range(20):
+        e = _estado_aleatorio(semilla)
+        otro = _espejo(e)
+        assert e.clave_canonica() == otro.clave_canonica() == clave_canonica(otro)
+        b = Board()
+        b.__conteos__[:] = array("b", e.conteos_slots())
+        b.recalcular_zobrist()
+        color = BLANCO if e.__turno__ == "BLANCAS" else NEGRO
+        assert b.clave_canonica(color) == e.clave_canonica() == clave_canonica(b, color)
+
+
+def test_clave_espejo_incremental(monkeypatch):
+    monkeypatch.setattr(zobrist, "VERIFICAR", True)
+    b = Board()
+    b.mover_ficha(0, 4)
+    b.apply((11, 16, BLANCO))
+    b.apply((5, 0, NEGRO))
+    assert b.__zobrist_espejo__ == zobrist.clave_espejo_slots(b.__conteos__)
+    assert b.clone().clave_canonica(NEGRO) == b.clave_canonica(NEGRO)
+
+
+def test_jugadas_espejadas_llevan_a_posiciones_espejadas():
+    e = _estado_aleatorio(7)
+    otro = _espejo(e)
+    for jugada in generar_jugadas(e, (5, 2)):
+        reflejo = espejar_jugada(jugada)
+        assert espejar_jugada(reflejo) == tuple(jugada)
+        tokens = [e.aplicar_paso(d, p) for d, p in jugada]
+        tokens_otro = [otro.aplicar_paso(d, p) for d, p in reflejo]
+        assert otro.conteos_slots() == espejar_slots(e.conteos_slots())
+        for token in reversed(tokens_otro):
+            otro.deshacer_paso(token)
+        for token in reversed(tokens):
+            e.deshacer_paso(token)
+
+
+def test_espejar_movimiento_de_board():
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    (jugada, *_) = generar_jugadas(e, (6, 4))
+    blancas = jugada_a_movimientos(jugada, BLANCO)
+    negras = jugada_a_movimientos(espejar_jugada(jugada), NEGRO)
+    assert [espejar_movimiento(m) for m in blancas] == negras
@@ -1,6 +1,10 @@
 import unittest
 import random
-from core.dice import Dice
+from unittest import mock
+
+import core.dice as dice_mod
+from core.dice import Dice, FlujoDados, tirar_par
+from core.game import DicePort
 
 class TestDiceEstadoInicial(unittest.TestCase):
     def test_estado_inicial(self):
@@ -201,5 +205,50 @@ class TestDiceCoberturaAdicional(unittest.TestCase):
         d.__restantes__ = [1, 6, 3]
         self.assertEqual(d.valor_maximo(), 6)
 
+class TestFlujoDados(unittest.TestCase):
+    def test_reproducible_y_en_rango(self):
+        f1, f2 = FlujoDados(7, tam_buffer=64), FlujoDados(7, tam_buffer=64)
+        v1 = [f1.siguiente() for _ in range(300)]
+        v2 = [f2.siguiente() for _ in range(300)]
+        self.assertEqual(v1, v2)
+        self.assertEqual(set(v1), {1, 2, 3, 4, 5, 6})
+
+    def test_flujos_independientes_por_worker(self):
+        flujos = FlujoDados.para_workers(7, 3, tam_buffer=64)
+        secuencias = [tuple(f.siguiente() for _ in range(50)) for f in flujos]
+        self.assertEqual(len(set(secuencias)), 3)
+
+    def test_tirada_cruza_el_borde_del_buffer(self):
+        f, g = FlujoDados(3, tam_buffer=5), FlujoDados(3, tam_buffer=5)
+        pares = [f.tirada() for _ in range(10)]
+        self.assertEqual([v for par in pares for v in par], [g.siguiente() for _ in range(20)])
+
+    def test_randint_solo_rango_de_dado(self):
+        f = FlujoDados(1)
+        self.assertIn(f.randint(1, 6), range(1, 7))
+        with self.assertRaises(ValueError):
+            f.randint(0, 10)
+        with self.assertRaises(ValueError):
+            FlujoDados(1, tam_buffer=1)
+
+    def test_se_enchufa_en_dice_y_dice_port(self):
+        d = Dice(rng=FlujoDados(11))
+        self.assertIsInstance(d, DicePort)
+        d.tirar()
+        self.assertEqual(tuple(d.obtener_valores()[:2]), FlujoDados(11).tirada())
+
+    def test_respaldo_sin_numpy(self):
+        with mock.patch.object(dice_mod, "np", None):
+            primera = FlujoDados(5, tam_buffer=16).tirada()
+            f = FlujoDados(5, tam_buffer=16)
+            self.assertEqual(f.tirada(), primera)
+            self.assertTrue(all(1 <= f.siguiente() <= 6 for _ in range(100)))
+
+    def test_tirar_par_con_random(self):
+        d1, d2 = tirar_par(random.Random(2))
+        r = random.Random(2)
+        self.assertEqual((d1, d2), (r.randint(1, 6), r.randint(1, 6)))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,42 @@
+from ui.dirty_rects import CostoFrames, RegistroRegiones
+
+PANTALLA = (0, 0, 100, 100)
+
+
+def _regiones(hover=None, fichas=2):
+    return {
+        ("punta", 0): ((0, 0, 10, 50), (fichas, hover == 0)),
+        ("punta", 1): ((10, 0, 10, 50), (0, hover == 1)),
+        "dados": ((0, 60, 100, 20), ("BLANCAS", (3, 1))),
+    }
+
+
+def test_solo_redibuja_lo_que_cambio():
+    registro = RegistroRegiones()
+    assert registro.sucias(_regiones(), PANTALLA) == [PANTALLA]
+    assert registro.sucias(_regiones(), PANTALLA) == []
+    assert registro.sucias(_regiones(hover=1), PANTALLA) == [(10, 0, 10, 50)]
+    rects = registro.sucias(_regiones(hover=0, fichas=3), PANTALLA)
+    assert rects == [(0, 0, 10, 50), (10, 0, 10, 50)]
+    registro.invalidar_todo()
+    assert registro.sucias(_regiones(hover=0, fichas=3), PANTALLA) == [PANTALLA]
+
+
+def test_regiones_movidas_o_eliminadas():
+    registro = RegistroRegiones()
+    registro.sucias(_regiones(), PANTALLA)
+    regiones = _regiones()
+    regiones["dados"] = ((0, 70, 100, 20), ("BLANCAS", (3, 1)))
+    del regiones[("punta", 1)]
+    rects = registro.sucias(regiones, PANTALLA)
+    assert rects == [(0, 70, 100, 20), (0, 60, 100, 20), (10, 0, 10, 50)]
+
+
+def test_costo_de_frames_ociosos():
+    costo = CostoFrames()
+    costo.registrar([PANTALLA], 0.01)
+    for _ in range(3):
+        costo.registrar([])
+    stats = costo.estadisticas()
+    assert stats["frames"] == 4 and stats["redibujados"] == 1 and stats["ociosos"] == 0.75
+    assert stats["pixeles_por_frame"] == 2500 and stats["ms_por_frame"] == 2.5
@@ -0,0 +1,69 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cli import entrenar  # noqa: E402
+from cli.entrenar import EntrenadorTD, invertir, jugar_autojuego  # noqa: E402
+from core.red import ENTRADAS, RedEvaluadora  # noqa: E402
+
+
+def test_invertir_es_involucion():
+    p = np.array([0.7, 0.2, 0.05, 0.1, 0.01])
+    assert np.allclose(invertir(p), [0.3, 0.1, 0.01, 0.2, 0.05])
+    assert np.allclose(invertir(invertir(p)), p)
+
+
+def test_autojuego_reproducible():
+    red = RedEvaluadora(ocultas=6, semilla=1)
+    x1, final1 = jugar_autojuego(red, semilla=5)
+    x2, final2 = jugar_autojuego(red, semilla=5)
+    assert x1.shape[1] == ENTRADAS and len(x1) > 10
+    assert (x1 == x2).all() and (final1 == final2).all()
+    assert final1[0] == 0 and final1[3] in (0, 1)
+
+
+def test_td_converge_con_cambio_de_perspectiva():
+    rng = np.random.default_rng(0)
+    x = (rng.random((2, ENTRADAS)) < 0.2).astype(np.float32)
+    final = np.array([0, 0, 0, 1, 0], dtype=np.float32)
+    ent = EntrenadorTD(RedEvaluadora(ocultas=8, semilla=2), alfa=0.5, lambda_=1.0)
+    for _ in range(400):
+        ent.aprender((x, final))
+    v0, v1 = ent.red.evaluar_lote(x)
+    assert np.allclose(v1, final, atol=0.1)
+    assert np.allclose(v0, invertir(final), atol=0.1)
+    assert ent.actualizaciones == 800 and ent.partidas == 400
+
+
+def test_checkpoint_y_reanudacion(tmp_path):
+    ruta = str(tmp_path / "td.npz")
+    ent = EntrenadorTD(RedEvaluadora(ocultas=6, semilla=3), semilla=1, ruta_checkpoint=ruta)
+    res = ent.entrenar(2, por_tarea=1, cada=1)
+    assert res["partidas"] == 2 and res["actualizaciones_por_seg"] > 0
+    otro = EntrenadorTD(RedEvaluadora(ocultas=6, semilla=99), ruta_checkpoint=ruta)
+    assert otro.partidas == 2 and otro.actualizaciones == ent.actualizaciones
+    assert np.allclose(otro.red.pesos()["w1"], ent.red.pesos()["w1"])
+    assert RedEvaluadora.desde_npz(ruta).ocultas == 6
+
+
+def test_pool_de_procesos(tmp_path):
+    ent = EntrenadorTD(RedEvaluadora(ocultas=4, semilla=4), semilla=2)
+    res = ent.entrenar(3, workers=2, por_tarea=1)
+    assert res["partidas"] == 3 == ent.partidas
+
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        EntrenadorTD(lambda_=1.5)
+    with pytest.raises(ValueError):
+        EntrenadorTD(alfa=0)
+    with pytest.raises(ValueError):
+        EntrenadorTD().entrenar(0)
+
+
+def test_main_reporta(tmp_path, capsys):
+    ruta = str(tmp_path / "td.npz")
+    assert entrenar.main(["--partidas", "1", "--ocultas", "4", "--checkpoint", ruta]) == 0
+    assert "partidas/s" in capsys.readouterr().out
+    assert entrenar.main(["--partidas", "1", "--ocultas", "4", "--checkpoint", ruta]) == 0
+    assert "Reanudando" in capsys.readouterr().out
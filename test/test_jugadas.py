@@ -0,0 +1,118 @@
+import copy
+import random
+
+from cli.jugadas import aplicar_jugada, generar_jugadas
+from cli.state import BARRA, EstadoJuego
+
+
+def _inicial(d1, d2):
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    e.set_dados(d1, d2)
+    return e
+
+
+def _referencia(estado):
+    """Fuerza bruta con copias: posiciones finales (con la cantidad de pasos usada)."""
+    finales = {}
+
+    def rec(e, usados, primero):
+        en_barra = e.__bar_blancas__ if e.__turno__ == "BLANCAS" else e.__bar_negras__
+        opciones = []
+        if e.hay_movimientos() and e.__turno__ == estado.__turno__:
+            for p in set(e.__movimientos_pendientes__):
+                if en_barra:
+                    if e.puede_reingresar(p):
+                        opciones.append((BARRA, p))
+                else:
+                    opciones += [(d, p) for d in range(1, 25) if e.puede_mover(d, p)]
+        if not opciones:
+            if usados:
+                finales.setdefault(tuple(e.conteos_slots()), (usados, primero))
+            return
+        for desde, p in opciones:
+            c = copy.deepcopy(e)
+            if desde == BARRA:
+                c.reingresar(p)
+            else:
+                c.mover(desde, p)
+            rec(c, usados + 1, primero if primero is not None else p)
+
+    rec(copy.deepcopy(estado), 0, None)
+    if not finales:
+        return set()
+    maximo = max(u for u, _ in finales.values())
+    pos = {k: v for k, v in finales.items() if v[0] == maximo}
+    dados = set(estado.__movimientos_pendientes__)
+    if maximo == 1 and len(dados) > 1 and any(v[1] == max(dados) for v in pos.values()):
+        pos = {k: v for k, v in pos.items() if v[1] == max(dados)}
+    return set(pos)
+
+
+def _posiciones(estado, jugadas):
+    out = set()
+    for j in jugadas:
+        c = copy.deepcopy(estado)
+        aplicar_jugada(c, j)
+        out.add(tuple(c.conteos_slots()))
+    return out
+
+
+def test_apertura_sin_duplicados_y_estado_intacto():
+    e = _inicial(3, 1)
+    antes = (e.conteos_slots(), e.clave_zobrist(), list(e.__movimientos_pendientes__))
+    jugadas = generar_jugadas(e)
+    assert (e.conteos_slots(), e.clave_zobrist(), list(e.__movimientos_pendientes__)) == antes
+    assert len(jugadas) == len(_posiciones(e, jugadas))
+    assert _posiciones(e, jugadas) == _referencia(e)
+    assert all(len(j) == 2 for j in jugadas)
+
+
+def test_dobles_usan_cuatro_pasos():
+    e = _inicial(6, 6)
+    jugadas = e.jugadas_legales()
+    assert jugadas and all(len(j) == 4 for j in jugadas)
+    assert _posiciones(e, jugadas) == _referencia(e)
+
+
+def test_regla_del_dado_mayor():
+    # Una sola blanca en 13; el 6 la lleva a 7 y desde ahí el 5 choca con el 2 negro
+    e = EstadoJuego()
+    e.__blancas__[13] = 1
+    e.__blancas__[1] = 14
+    e.__negras__[2] = 2
+    e.__negras__[8] = 2
+    e.__negras__[20] = 11
+    e.recalcular_zobrist()
+    e.set_dados(6, 5)
+    jugadas = generar_jugadas(e)
+    assert jugadas == [((13, 6),)]
+
+
+def test_barra_obliga_a_reingresar_y_bloqueo_total():
+    e = _inicial(6, 6)
+    e.__bar_blancas__ = 1
+    e.__blancas__[6] = 4
+    e.recalcular_zobrist()
+    # 19 ocupado por 5 negras: con 6-6 no entra
+    assert generar_jugadas(e) == []
+    e.set_dados(5, 3)
+    jugadas = generar_jugadas(e)
+    assert all(j[0][0] == BARRA for j in jugadas)
+    assert _posiciones(e, jugadas) == _referencia(e)
+
+
+def test_coincide_con_fuerza_bruta_en_partidas_aleatorias():
+    rng = random.Random(11)
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    for _ in range(60):
+        e.set_dados(rng.randint(1, 6), rng.randint(1, 6))
+        jugadas = generar_jugadas(e)
+        assert _posiciones(e, jugadas) == _referencia(e)
+        if jugadas:
+            aplicar_jugada(e, rng.choice(jugadas))
+        if e.hay_movimientos() or jugadas == []:
+            e.cambiar_turno()
+        if e.__fuera_blancas__ == 15 or e.__fuera_negras__ == 15:
+            break
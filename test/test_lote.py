@@ -0,0 +1,119 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cli.jugadas import aplicar_jugada, generar_jugadas, origenes_legales  # noqa: E402
+from cli.lote import BARRA_LOTE, LoteEstados  # noqa: E402
+from cli.state import BARRA, EstadoJuego  # noqa: E402
+
+
+def _estados_aleatorios(cantidad, semilla):
+    """Estados variados (incluye barra y borneo) jugando partidas al azar."""
+    rng = random.Random(semilla)
+    estados = []
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    while len(estados) < cantidad:
+        if e.__fuera_blancas__ == 15 or e.__fuera_negras__ == 15:
+            e.restablecer_inicio()
+        e.set_dados(rng.randint(1, 6), rng.randint(1, 6))
+        estados.append(EstadoJuego(
+            __blancas__=list(e.__blancas__), __negras__=list(e.__negras__),
+            __bar_blancas__=e.__bar_blancas__, __bar_negras__=e.__bar_negras__,
+            __fuera_blancas__=e.__fuera_blancas__, __fuera_negras__=e.__fuera_negras__,
+            __turno__=e.__turno__, __dados__=e.__dados__,
+            __movimientos_pendientes__=list(e.__movimientos_pendientes__),
+        ))
+        jugadas = generar_jugadas(e)
+        if jugadas:
+            aplicar_jugada(e, rng.choice(jugadas))
+        else:
+            e.cambiar_turno()
+    return estados
+
+
+def _a_origen_lote(estado, desde):
+    if desde == BARRA:
+        return BARRA_LOTE
+    return desde if estado.__turno__ == "BLANCAS" else 25 - desde
+
+
+def test_inicio_y_conversion_ida_vuelta():
+    lote = LoteEstados(3)
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    for estado in lote.a_estados():
+        assert estado.conteos_slots() == e.conteos_slots()
+        assert estado.clave_zobrist() == e.clave_zobrist()
+    estados = _estados_aleatorios(40, 1)
+    vuelta = LoteEstados.desde_estados(estados).a_estados()
+    for a, b in zip(estados, vuelta):
+        assert a.conteos_slots() == b.conteos_slots()
+        assert a.__turno__ == b.__turno__
+        assert sorted(a.__movimientos_pendientes__) == sorted(b.__movimientos_pendientes__)
+
+
+def test_mascaras_coinciden_con_estado_juego():
+    estados = _estados_aleatorios(300, 2)
+    mascaras = LoteEstados.desde_estados(estados).mascaras_legales()
+    for i, e in enumerate(estados):
+        for pasos in range(1, 7):
+            esperado = {_a_origen_lote(e, d) for d in origenes_legales(e, pasos)}
+            assert set(np.flatnonzero(mascaras[i, pasos - 1])) == esperado
+
+
+def test_aplicar_pasos_coincide_con_estado_juego():
+    estados = _estados_aleatorios(200, 3)
+    lote = LoteEstados.desde_estados(estados)
+    legales = lote.mascaras_pendientes()
+    partidas, origenes, pasos = [], [], []
+    for i, e in enumerate(estados):
+        opciones = np.argwhere(legales[i])
+        if len(opciones):
+            dado, origen = opciones[i % len(opciones)]
+            partidas.append(i)
+            origenes.append(origen)
+            pasos.append(dado + 1)
+            desde = BARRA if origen == BARRA_LOTE else (origen if e.__turno__ == "BLANCAS" else 25 - origen)
+            if desde == BARRA:
+                e.reingresar(dado + 1)
+            else:
+                e.mover(desde, dado + 1)
+    assert partidas
+    lote.aplicar_pasos(np.array(partidas), np.array(origenes), np.array(pasos))
+    for i in partidas:
+        obtenido = lote.a_estado(i)
+        assert obtenido.conteos_slots() == estados[i].conteos_slots()
+        if estados[i].hay_movimientos():
+            assert sorted(obtenido.__movimientos_pendientes__) == sorted(estados[i].__movimientos_pendientes__)
+
+
+def test_tirar_dados_expande_dobles():
+    lote = LoteEstados(500, np.random.default_rng(7))
+    tirada = lote.tirar_dados()
+    assert ((tirada >= 1) & (tirada <= 6)).all()
+    dobles = tirada[:, 0] == tirada[:, 1]
+    assert dobles.any() and (~dobles).any()
+    assert (lote.__pendientes__[dobles] == tirada[dobles, :1]).all()
+    assert (lote.__pendientes__[~dobles, 2:] == 0).all()
+
+
+def test_partidas_aleatorias_terminan_y_conservan_fichas():
+    lote = LoteEstados(64, np.random.default_rng(11))
+    for _ in range(5000):
+        if lote.terminadas().all():
+            break
+        lote.avanzar_aleatorio()
+        assert (lote.__fichas__.sum(axis=2) == 15).all()
+        assert (lote.__fichas__ >= 0).all()
+    assert lote.terminadas().all()
+    ganadores = lote.ganadores()
+    assert set(ganadores.tolist()) <= {0, 1}
+    assert (lote.__fichas__[np.arange(64), ganadores, 0] == 15).all()
+
+
+def test_lote_vacio_invalido():
+    with pytest.raises(ValueError):
+        LoteEstados(0)
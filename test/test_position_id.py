@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from core import position_id
+from core.board import Board, BLANCO, NEGRO
+from cli.state import EstadoJuego
+
+INICIO = "4HPwATDgc/ABMA"
+
+
+def _board_aleatorio(rng):
+    b = Board()
+    for paso in range(rng.randint(0, 60)):
+        color = BLANCO if paso % 2 == 0 else NEGRO
+        d = rng.randint(1, 6)
+        if b.bar_count(color):
+            b.mover_desde_barra(color, b.calcular_destino_barra(color, d))
+            continue
+        origenes = [o for o in range(24) if b.top_color_at(o) == color]
+        o = rng.choice(origenes)
+        dest = b.calcular_destino(o, color, d)
+        if 0 <= dest < 24 and b.es_movimiento_legal(o, dest, color):
+            b.mover_ficha(o, dest)
+        elif not 0 <= dest < 24:
+            b.bornear_ficha(o, color)
+    return b
+
+
+def test_posicion_inicial_estandar():
+    assert Board().position_id() == INICIO
+    assert Board().position_id(NEGRO) == INICIO
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    assert e.id_posicion() == INICIO
+    assert len(e.clave_posicion()) == 10
+
+
+def test_round_trip_board_y_estado():
+    rng = random.Random(21)
+    for _ in range(200):
+        b = _board_aleatorio(rng)
+        for color, turno in ((BLANCO, "BLANCAS"), (NEGRO, "NEGRAS")):
+            texto = b.position_id(color)
+            assert len(texto) == 14
+            nb = Board.from_position_id(texto, color)
+            assert list(nb.__conteos__) == list(b.__conteos__)
+            assert nb.clave_zobrist() == b.clave_zobrist()
+            e = EstadoJuego.desde_id_posicion(texto, turno)
+            assert e.conteos_slots() == list(b.__conteos__)
+            assert e.id_posicion() == texto
+            assert Board.from_position_id(b.position_key(color), color).position_id(color) == texto
+
+
+def test_perspectiva_depende_del_turno():
+    b = Board()
+    b.mover_ficha(0, 3)
+    assert b.position_id(BLANCO) != b.position_id(NEGRO)
+
+
+def test_textos_invalidos():
+    with pytest.raises(ValueError):
+        position_id.desde_texto("corto")
+    with pytest.raises(ValueError):
+        position_id.desde_texto("!!!!!!!!!!!!!!")
+    with pytest.raises(ValueError):
+        position_id.decodificar_slots(b"\xff" * 10)
+    with pytest.raises(ValueError):
+        Board.from_position_id(INICIO, "rojo")
@@ -0,0 +1,85 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cli.state import EstadoJuego  # noqa: E402
+from core.board import Board, NEGRO  # noqa: E402
+from core.red import ENTRADAS, SALIDAS, RedEvaluadora, codificar, equidad  # noqa: E402
+
+
+def _inicial(d1=3, d2=1):
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    e.set_dados(d1, d2)
+    return e
+
+
+def test_codificacion_estandar_del_inicio():
+    x = codificar([_inicial()])[0]
+    assert x.shape == (ENTRADAS,)
+    # Blancas: punto 6 con 5 fichas -> (1, 1, 1, 1.0); punto 24 con 2 -> (1, 1, 0, 0)
+    assert list(x[4 * 5: 4 * 6]) == [1, 1, 1, 1.0]
+    assert list(x[4 * 23: 4 * 24]) == [1, 1, 0, 0]
+    # Negras desde su perspectiva: misma estructura que las blancas
+    assert list(x[96: 192]) == list(x[:96])
+    assert list(x[192:]) == [0, 0, 0, 0, 1, 0]
+
+
+def test_estado_y_board_codifican_igual():
+    e = _inicial()
+    e.cambiar_turno()
+    assert (codificar([e]) == codificar([Board()], color_en_turno=NEGRO)).all()
+
+
+def test_lote_igual_a_uno_por_uno():
+    red = RedEvaluadora(ocultas=8, semilla=1)
+    e = _inicial()
+    estados = []
+    for jugada in e.jugadas_legales():
+        c = _inicial()
+        for desde, pasos in jugada:
+            c.aplicar_paso(desde, pasos)
+        estados.append(c)
+    lote = red.evaluar_lote(estados)
+    assert lote.shape == (len(estados), SALIDAS)
+    for fila, estado in zip(lote, estados):
+        assert np.allclose(fila, red.evaluar(estado))
+    assert ((lote > 0) & (lote < 1)).all()
+
+
+def test_evaluar_jugadas_no_modifica_y_coincide():
+    red = RedEvaluadora(ocultas=8, semilla=2)
+    e = _inicial(6, 4)
+    jugadas = e.jugadas_legales()
+    antes = (e.conteos_slots(), e.clave_zobrist())
+    valores = red.evaluar_jugadas(e, jugadas)
+    assert (e.conteos_slots(), e.clave_zobrist()) == antes
+    c = _inicial(6, 4)
+    for desde, pasos in jugadas[0]:
+        c.aplicar_paso(desde, pasos)
+    c.cambiar_turno()
+    assert valores[0] == pytest.approx(-red(c), abs=1e-5)
+
+
+def test_npz_ida_y_vuelta(tmp_path):
+    red = RedEvaluadora(ocultas=5, semilla=3)
+    ruta = tmp_path / "pesos.npz"
+    red.guardar_npz(str(ruta))
+    otra = RedEvaluadora.desde_npz(str(ruta))
+    assert otra.ocultas == 5
+    e = _inicial()
+    assert np.allclose(red.evaluar(e), otra.evaluar(e))
+
+
+def test_pesos_invalidos():
+    with pytest.raises(ValueError):
+        RedEvaluadora(pesos={"w1": np.zeros((10, 3))})
+    pesos = RedEvaluadora(ocultas=4).pesos()
+    pesos["w2"] = np.zeros((4, 3))
+    with pytest.raises(ValueError):
+        RedEvaluadora(pesos=pesos)
+
+
+def test_equidad():
+    assert equidad(np.array([1, 1, 1, 0, 0])) == 3
+    assert equidad(np.array([0, 0, 0, 1, 0])) == -2
@@ -0,0 +1,73 @@
+import pytest
+
+from cli import rollout as rl
+from cli.state import EstadoJuego
+from core.dice import FlujoDados
+
+
+def _inicial():
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    return e
+
+
+def test_dados_antiteticos_reflejan_el_flujo():
+    normal = rl.DadosRollout(FlujoDados(5, flujo=3), primera=(6, 1))
+    espejo = rl.DadosRollout(FlujoDados(5, flujo=3), primera=(1, 6), reflejar=True)
+    assert normal.tirada() == (6, 1) and espejo.tirada() == (1, 6)
+    for _ in range(20):
+        a, b = normal.tirada()
+        assert espejo.tirada() == (7 - a, 7 - b)
+
+
+def test_estratificacion_cubre_las_36_tiradas():
+    assert len(set(rl.PRIMERAS)) == rl.ESTRATO == 36
+    tarea = (_inicial().conteos_slots(), "BLANCAS", 0, 36, 1, "primera", True, True)
+    puntos = rl._bloque_rollout(tarea)
+    assert len(puntos) == 72 and all(p in (-3, -2, -1, 1, 2, 3) for p in puntos)
+
+
+def test_resultado_no_depende_de_workers():
+    opciones = {"pruebas": 72, "estrategia": "primera", "seed": 4, "antitetica": False}
+    uno = rl.rollout(_inicial(), **opciones)
+    dos = rl.rollout(_inicial(), workers=2, **opciones)
+    assert (uno.pruebas, uno.muestras) == (dos.pruebas, dos.muestras) == (72, 72)
+    assert uno.equidad == dos.equidad and uno.varianza == dos.varianza
+    assert -3 <= uno.equidad <= 3 and 0 <= uno.gammons <= uno.ganadas <= 1
+
+
+def test_sin_reduccion_de_varianza_redondea_a_bloques():
+    res = rl.rollout(
+        _inicial(), pruebas=40, estrategia="primera", antitetica=False, estratificada=False
+    )
+    assert res.pruebas == res.muestras == 72
+    assert res.configuracion["antitetica"] is False
+
+
+def test_victoria_segura_y_corte_por_ancho():
+    e = EstadoJuego()
+    e.__blancas__[1] = 1
+    e.__negras__[20] = 15
+    e.__fuera_blancas__ = 14
+    e.recalcular_zobrist()
+    res = rl.rollout(e, pruebas=1296, estrategia="primera", ancho=0.1)
+    assert res.equidad == 2 and res.varianza == 0 and res.gammons == 1
+    assert res.detenido and res.muestras == 72
+    assert res.intervalo() == (2, 2)
+
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        rl.rollout(_inicial(), pruebas=0)
+    with pytest.raises(ValueError):
+        rl.rollout(_inicial(), workers=0)
+    with pytest.raises(ValueError):
+        rl.rollout(_inicial(), ancho=0)
+    with pytest.raises(ValueError):
+        rl.rollout(_inicial(), estrategia="inexistente")
+
+
+def test_main_imprime_equidad(capsys):
+    assert rl.main(["--pruebas", "72", "--estrategia", "primera", "--turno", "NEGRAS"]) == 0
+    salida = capsys.readouterr().out
+    assert "Equidad" in salida and "IC95%" in salida
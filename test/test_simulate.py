@@ -0,0 +1,62 @@
+import random
+import subprocess
+import sys
+
+import pytest
+
+from cli import simulate
+from cli.state import EstadoJuego
+
+
+def test_partida_completa_termina_con_ganador():
+    r = simulate.jugar_partida(
+        simulate.estrategia_aleatoria, simulate.estrategia_golosa, random.Random(3)
+    )
+    assert r.ganador in ("BLANCAS", "NEGRAS")
+    assert r.puntos in (1, 2, 3)
+    assert r.pasos >= 15 and r.turnos > 0
+
+
+def test_resultados_no_dependen_de_workers():
+    uno = simulate._jugar_bloque((0, 6, 42, "aleatoria", "primera"))
+    partes = simulate._jugar_bloque((0, 2, 42, "aleatoria", "primera"))
+    partes += simulate._jugar_bloque((2, 6, 42, "aleatoria", "primera"))
+    assert uno == partes
+    res = simulate.simular(6, seed=42, workers=2, blancas="aleatoria", negras="primera")
+    assert res["partidas"] == 6
+    assert res["victorias_blancas"] == sum(r.ganador == "BLANCAS" for r in uno) / 6
+
+
+def test_puntos_victoria():
+    e = EstadoJuego()
+    e.__fuera_blancas__ = 15
+    e.__negras__[20] = 15
+    assert simulate.puntos_victoria(e, "BLANCAS") == 2
+    e.__negras__[20], e.__negras__[3] = 14, 1
+    assert simulate.puntos_victoria(e, "BLANCAS") == 3
+    e.__negras__[3], e.__fuera_negras__ = 0, 1
+    assert simulate.puntos_victoria(e, "BLANCAS") == 1
+
+
+def test_resolver_estrategia():
+    assert simulate.resolver_estrategia("golosa") is simulate.estrategia_golosa
+    assert simulate.resolver_estrategia("cli.simulate:estrategia_primera") is simulate.estrategia_primera
+    with pytest.raises(ValueError):
+        simulate.resolver_estrategia("inexistente")
+
+
+def test_main_imprime_resumen(capsys):
+    assert simulate.main(["--games", "2", "--seed", "1"]) == 0
+    salida = capsys.readouterr().out
+    assert "Partidas/seg" in salida and "Gammons" in salida
+
+
+def test_no_importa_pygame():
+    codigo = "import sys, cli.simulate; print('pygame' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_main_rechaza_parametros_invalidos():
+    with pytest.raises(SystemExit):
+        simulate.main(["--games", "0"])
@@ -0,0 +1,192 @@
+import random
+
+import pytest
+
+from core import zobrist
+from core.board import Board
+from cli.state import EstadoJuego
+
+
+def _estado_inicial():
+    e = EstadoJuego()
+    e.restablecer_inicio()
+    return e
+
+
+@pytest.fixture
+def verificacion_zobrist():
+    zobrist.activar_verificacion(True)
+    yield
+    zobrist.activar_verificacion(False)
+
+
+def test_clave_inicial_coincide_con_board():
+    e = _estado_inicial()
+    assert e.conteos_slots() == list(Board().__conteos__)
+    assert e.clave_zobrist() == Board().clave_zobrist(color_en_turno="blanco")
+
+
+def test_clave_incremental_mover_captura_y_turno(verificacion_zobrist):
+    e = _estado_inicial()
+    e.__negras__[22] = 1  # blot negro a 2 pasos de las blancas del 24
+    e.recalcular_zobrist()
+    e.set_dados(2, 1)
+    e.mover(24, 2)
+    assert e.__bar_negras__ == 1
+    e.mover(6, 1)
+    assert e.__turno__ == "NEGRAS"
+    assert e.clave_zobrist() == e.recalcular_zobrist()
+
+
+def test_clave_incremental_reingreso_y_borne_off(verificacion_zobrist):
+    e = EstadoJuego()
+    e.__turno__ = "NEGRAS"
+    e.__bar_negras__ = 1
+    e.__negras__[24] = 14
+    e.__blancas__[3] = 1
+    e.recalcular_zobrist()
+    e.set_dados(3, 1)
+    e.reingresar(3)  # captura el blot blanco del 3
+    assert e.__bar_blancas__ == 1
+    e.mover(3, 1)
+    assert e.clave_zobrist() == e.recalcular_zobrist()
+
+    e.__turno__ = "NEGRAS"
+    e.__negras__[4] = 0
+    e.__negras__[24] = 15
+    e.recalcular_zobrist()
+    e.set_dados(1, 2)
+    e.mover(24, 1)
+    assert e.__fuera_negras__ == 1
+    assert e.clave_zobrist() == e.recalcular_zobrist()
+
+
+def test_misma_posicion_misma_clave_por_distinto_orden():
+    a, b = _estado_inicial(), _estado_inicial()
+    a.set_dados(3, 1)
+    a.mover(8, 3)
+    a.mover(6, 1)
+    b.set_dados(3, 1)
+    b.mover(6, 1)
+    b.mover(8, 3)
+    assert a.clave_zobrist() == b.clave_zobrist()
+    assert a.clave_zobrist() != _estado_inicial().clave_zobrist()
+
+
+def test_verificacion_detecta_edicion_manual(verificacion_zobrist):
+    e = _estado_inicial()
+    e.__blancas__[5] = 1  # edición directa sin recalcular
+    e.set_dados(6, 5)
+    with pytest.raises(RuntimeError):
+        e.mover(13, 6)
+
+
+def test_partida_aleatoria_mantiene_clave():
+    rng = random.Random(7)
+    e = _estado_inicial()
+    for _ in range(200):
+        e.set_dados(rng.randint(1, 6), rng.randint(1, 6))
+        while e.hay_movimientos():
+            opciones = [
+                ("r", p) for p in set(e.__movimientos_pendientes__) if e.puede_reingresar(p)
+            ] or [
+                ("m", d, p)
+                for d in range(1, 25)
+                for p in set(e.__movimientos_pendientes__)
+                if e.puede_mover(d, p)
+            ]
+            if not opciones:
+                e.cambiar_turno()
+                break
+            op = rng.choice(opciones)
+            if op[0] == "r":
+                e.reingresar(op[1])
+            else:
+                e.mover(op[1], op[2])
+        assert e.clave_zobrist() == e.recalcular_zobrist()
+
+
+def _carrera_por_recorrido(e):
+    blancas = [p for p in range(1, 25) if e.__blancas__[p]] + [25] * bool(e.__bar_blancas__)
+    negras = [25 - p for p in range(1, 25) if e.__negras__[p]] + [25] * bool(e.__bar_negras__)
+    pips_b = sum(p * n for p, n in enumerate(e.__blancas__)) + 25 * e.__bar_blancas__
+    pips_n = sum((25 - p) * n for p, n in enumerate(e.__negras__)) + 25 * e.__bar_negras__
+    contacto = any(25 - dn < db for db in blancas for dn in negras)
+    return pips_b, pips_n, max(blancas, default=0), max(negras, default=0), not contacto
+
+
+def _carrera(e):
+    return (e.pips("BLANCAS"), e.pips("NEGRAS"), e.punto_mas_atrasado("BLANCAS"),
+            e.punto_mas_atrasado("NEGRAS"), e.es_carrera())
+
+
+def test_carrera_incremental_en_partida_aleatoria():
+    rng = random.Random(3)
+    e = _estado_inicial()
+    assert _carrera(e) == (167, 167, 24, 24, False)
+    vistas_carrera = 0
+    for _ in range(300):
+        e.set_dados(rng.randint(1, 6), rng.randint(1, 6))
+        jugadas = e.jugadas_legales()
+        for desde, pasos in rng.choice(jugadas) if jugadas and jugadas[0] else ():
+            if desde == -1:
+                e.reingresar(pasos)
+            else:
+                e.mover(desde, pasos)
+            assert _carrera(e) == _carrera_por_recorrido(e)
+        if e.hay_movimientos():
+            e.cambiar_turno()
+        vistas_carrera += e.is_race()
+        if e.__fuera_blancas__ == 15 or e.__fuera_negras__ == 15:
+            e.restablecer_inicio()
+            assert _carrera(e) == (167, 167, 24, 24, False)
+    assert vistas_carrera
+
+
+def test_carrera_tras_edicion_manual():
+    e = EstadoJuego()
+    e.__blancas__[3] = 2
+    e.__negras__[20] = 1
+    e.__bar_negras__ = 1
+    e.recalcular_zobrist()
+    assert _carrera(e) == (6, 30, 3, 25, False)
+    e.__bar_negras__ = 0
+    e.recalcular_zobrist()
+    assert _carrera(e) == _carrera_por_recorrido(e) == (6, 5, 3, 5, True)
+
+
+def test_resumen_de_casa_coincide_con_recorrido():
+    from benchmarks.bench_estado import EstadoRecorrido, posicion_bearoff
+
+    rng = random.Random(9)
+    e = _estado_inicial()
+    for _ in range(400):
+        e.set_dados(rng.randint(1, 6), rng.randint(1, 6))
+        jugadas = e.jugadas_legales()
+        for desde, pasos in rng.choice(jugadas) if jugadas and jugadas[0] else ():
+            if desde == -1:
+                e.reingresar(pasos)
+            else:
+                e.mover(desde, pasos)
+        if e.hay_movimientos():
+            e.cambiar_turno()
+        referencia = EstadoRecorrido()
+        referencia.cargar_slots(e.conteos_slots())
+        for jugador in ("BLANCAS", "NEGRAS"):
+            assert e.__todos_en_casa__(jugador) == referencia.__todos_en_casa__(jugador)
+            assert e.__punto_mas_lejano_en_casa__(jugador) == referencia.__punto_mas_lejano_en_casa__(jugador)
+        if e.__fuera_blancas__ == 15 or e.__fuera_negras__ == 15:
+            e = posicion_bearoff()
+    assert e.__fuera_casa__ == [sum(e.__blancas__[7:25]), sum(e.__negras__[1:19])]
+
+
+def test_recalcular_derivados_tras_edicion_manual_del_resumen_de_casa():
+    e = EstadoJuego()
+    e.__blancas__[3] = 15
+    e.recalcular_derivados()
+    assert e.__todos_en_casa__("BLANCAS") and e.__punto_mas_lejano_en_casa__("BLANCAS") == 3
+    # Edición a mano: el resumen de casa queda viejo hasta recalcular
+    e.__blancas__[3], e.__blancas__[9] = 14, 1
+    assert e.__todos_en_casa__("BLANCAS")
+    e.recalcular_zobrist()  # alias
+    assert not e.__todos_en_casa__("BLANCAS") and e.__fuera_casa__ == [1, 0]
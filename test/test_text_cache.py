@@ -0,0 +1,36 @@
+import pytest
+
+from ui.text_cache import CacheTextos
+
+
+class FuenteFalsa:
+    def __init__(self):
+        self.llamadas = []
+
+    def render(self, texto, antialias, color):
+        self.llamadas.append((texto, antialias, color))
+        return ("superficie", texto, antialias, color)
+
+
+def test_rasteriza_solo_textos_nuevos():
+    fuente, cache = FuenteFalsa(), CacheTextos()
+    a = cache.render(fuente, "Tirar (R)", (20, 20, 20))
+    assert cache.render(fuente, "Tirar (R)", (20, 20, 20)) is a
+    cache.render(fuente, "Tirar (R)", (60, 60, 60))
+    cache.render(fuente, "Tirar (R)", (20, 20, 20), antialias=False)
+    cache.render(FuenteFalsa(), "Tirar (R)", (20, 20, 20))
+    assert len(fuente.llamadas) == 3 and len(cache) == 4
+    assert cache.estadisticas() == {"aciertos": 1, "fallos": 4, "tasa_aciertos": 0.2, "entradas": 4}
+
+
+def test_lru_acotada_y_limpiar():
+    fuente, cache = FuenteFalsa(), CacheTextos(max_entradas=2)
+    for texto in ("1", "2", "1", "3"):
+        cache.render(fuente, texto, (0, 0, 0))
+    cache.render(fuente, "1", (0, 0, 0))  # sobrevivió por ser la más reciente
+    cache.render(fuente, "2", (0, 0, 0))  # fue desalojado
+    assert [t for t, _, _ in fuente.llamadas] == ["1", "2", "3", "2"]
+    cache.limpiar()
+    assert len(cache) == 0 and cache.estadisticas()["aciertos"] == 0
+    with pytest.raises(ValueError):
+        CacheTextos(max_entradas=0)
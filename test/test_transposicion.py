@@ -0,0 +1,82 @@
+import unittest
+
+from cli.state import EstadoJuego
+from core.board import Board, BLANCO, NEGRO
+from core.game import Game
+from core.transposicion import TablaTransposicion, VIAS, clave_de, codigo_tirada
+
+
+class TestCodigoTirada(unittest.TestCase):
+    def test_orden_y_dobles(self):
+        self.assertEqual(codigo_tirada([3, 5]), codigo_tirada([5, 3]))
+        self.assertEqual(codigo_tirada([4, 4, 4, 4]), codigo_tirada((4, 4)))
+        self.assertEqual(codigo_tirada(None), 0)
+        self.assertEqual(len({codigo_tirada((a, b)) for a in range(1, 7) for b in range(a, 7)}), 21)
+        with self.assertRaises(ValueError):
+            codigo_tirada([0, 7])
+
+
+class TestTablaTransposicion(unittest.TestCase):
+    def test_acierto_fallo_y_profundidad(self):
+        t = TablaTransposicion(capacidad=64)
+        self.assertIsNone(t.buscar(123, (3, 1)))
+        t.guardar(123, (3, 1), 0.5, profundidad=2)
+        self.assertEqual(t.buscar(123, (1, 3)), 0.5)
+        self.assertIsNone(t.buscar(123, (1, 3), profundidad=3))
+        self.assertIsNone(t.buscar(123, (2, 3)))
+        est = t.estadisticas()
+        self.assertEqual((est["aciertos"], est["fallos"]), (1, 3))
+
+    def test_no_pisa_con_menor_profundidad_en_la_misma_generacion(self):
+        t = TablaTransposicion(capacidad=8)
+        t.guardar(7, None, "hondo", profundidad=3)
+        t.guardar(7, None, "llano", profundidad=1)
+        self.assertEqual(t.buscar(7), "hondo")
+        t.nueva_generacion()
+        t.guardar(7, None, "nuevo", profundidad=1)
+        self.assertEqual(t.buscar(7), "nuevo")
+
+    def test_desalojo_por_edad_y_profundidad(self):
+        t = TablaTransposicion(capacidad=VIAS)  # una sola cubeta
+        for i in range(VIAS):
+            t.guardar(i, None, i, profundidad=i)
+        t.nueva_generacion()
+        t.buscar(0)  # refresca la edad de la entrada 0
+        t.guardar(100, None, "a", profundidad=0)
+        self.assertEqual(t.buscar(0), 0)  # vieja pero usada: sobrevive
+        self.assertIsNone(t.buscar(1))  # vieja y más llana que 2 y 3
+        self.assertEqual(t.estadisticas()["desalojos"], 1)
+        self.assertEqual(len(t), VIAS)
+
+    def test_presupuesto_de_memoria_fijo(self):
+        t = TablaTransposicion(memoria_bytes=96 * 100)
+        for i in range(10_000):
+            t.guardar(i * 7919, (1, 2), i)
+        self.assertLessEqual(len(t), t.capacidad)
+        self.assertLessEqual(t.capacidad, 100)
+        self.assertGreater(t.estadisticas()["desalojos"], 0)
+        with self.assertRaises(ValueError):
+            TablaTransposicion(capacidad=0)
+
+    def test_limpiar(self):
+        t = TablaTransposicion(capacidad=16)
+        t.guardar(1, None, 1)
+        t.buscar(1)
+        t.limpiar()
+        self.assertEqual(len(t), 0)
+        self.assertEqual(t.estadisticas()["aciertos"], 0)
+
+
+class TestClaveCompartida(unittest.TestCase):
+    def test_estado_board_y_game_comparten_entradas(self):
+        estado = EstadoJuego()
+        estado.restablecer_inicio()
+        board = Board()
+        juego = Game(board, jugador_inicial=BLANCO)
+        self.assertEqual(clave_de(estado), clave_de(juego))
+        t = TablaTransposicion(capacidad=64)
+        t.guardar_posicion(estado, (6, 5), "valor")
+        self.assertEqual(t.buscar_posicion(juego, (5, 6)), "valor")
+        juego.jugador_actual = NEGRO
+        self.assertIsNone(t.buscar_posicion(juego, (5, 6)))
+        self.assertEqual(clave_de(board), board.clave_zobrist())
@@ -2,14 +2,30 @@
 Controlador de la UI con Pygame: eventos, redimensionado y loop principal.
 """
 
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Hashable
+import os
+import time
 import pygame
-import random
+
+from core.dice import FlujoDados, tirar_par
 
 from ui.theme import TemaTablero
 import ui.geometry as geometry
 from ui.hit_test import DeteccionPuntas
-from ui.render import RenderizadorTablero
+from ui.render import ANCHO_HOVER, ANCHO_SELECCION, RenderizadorTablero
+from ui.text_cache import CacheTextos
+from ui.dirty_rects import CostoFrames, RegistroRegiones
+
+# Eventos tras los que hay que redibujar la ventana entera (WINDOWEXPOSED es de pygame 2)
+_EVENTOS_EXPUESTA = (pygame.VIDEOEXPOSE, getattr(pygame, "WINDOWEXPOSED", pygame.VIDEOEXPOSE))
+# Estado de la ventana (pygame 2); sin ellos la ventana se considera siempre visible
+_SIN_EVENTO = -1
+_FOCO_PERDIDO = getattr(pygame, "WINDOWFOCUSLOST", _SIN_EVENTO)
+_FOCO_GANADO = getattr(pygame, "WINDOWFOCUSGAINED", _SIN_EVENTO)
+_MINIMIZADA = getattr(pygame, "WINDOWMINIMIZED", _SIN_EVENTO)
+_RESTAURADA = getattr(pygame, "WINDOWRESTORED", _SIN_EVENTO)
+# Evento propio para despertar el loop cuando el estado cambia por fuera de la UI
+EVENTO_DESPERTAR = pygame.USEREVENT + 1
 
 
 class ControladorUI:
@@ -26,8 +42,15 @@ class ControladorUI:
         self.__geo__ (GeometriaTablero): Geometría actual.
         self.__deteccion__ (DeteccionPuntas): Detección de puntas.
         self.__render__ (RenderizadorTablero): Renderizador.
+        self.__textos__ (CacheTextos): Textos rasterizados, compartidos con el renderizador.
         self.__estado__ (Any): Estado del juego (debe exponer __blancas__, __negras__).
         self.__indice_hover__ (Optional[int]): Índice de punta bajo el mouse.
+        self.__regiones__ (RegistroRegiones): Firmas del último frame (rectángulos sucios).
+        self.__costo_frames__ (CostoFrames): Costo de dibujo por frame
+            (BACKGAMMON_UI_STATS=1 lo imprime al salir).
+        self.__fps_fondo__ (int): Cuadros por segundo sin foco o minimizada.
+        self.__espera_ms__ (int): Tope de pygame.event.wait en reposo.
+        self.__enfocada__, self.__minimizada__ (bool): Estado de la ventana.
     """
 
     def __init__(
@@ -37,6 +60,9 @@ class ControladorUI:
         estado: Optional[Any] = None,
         fps: int = 60,
         titulo: str = "Backgammon - Tablero",
+        rng: Optional[Any] = None,
+        fps_fondo: int = 5,
+        espera_ms: int = 500,
     ) -> None:
         """
         Inicializa Pygame y dependencias de UI.
@@ -47,6 +73,10 @@ class ControladorUI:
             estado (Any|None): Estado del juego con __blancas__/__negras__ (opcional).
             fps (int): Cuadros por segundo.
             titulo (str): Título de la ventana.
+            rng (Any|None): Fuente de dados (FlujoDados o random.Random). Por defecto
+                un FlujoDados con semilla BACKGAMMON_DICE_SEED si está definida.
+            fps_fondo (int): Cuadros por segundo con la ventana sin foco o minimizada.
+            espera_ms (int): En reposo, máximo que se bloquea esperando eventos.
 
         Retorna:
             None
@@ -57,6 +87,10 @@ class ControladorUI:
         self.__reloj__ = pygame.time.Clock()
         self.__fuente__ = pygame.font.SysFont(None, 20)
         self.__fps__ = fps
+        self.__fps_fondo__ = max(1, fps_fondo)
+        self.__espera_ms__ = max(1, espera_ms)
+        self.__enfocada__ = True
+        self.__minimizada__ = False
 
         self.__tema__ = TemaTablero()
         self.__overlay_margin_top__ = 12
@@ -75,7 +109,10 @@ class ControladorUI:
             offset_superior=self.__overlay_offset__,
         )
         self.__deteccion__ = DeteccionPuntas(self.__geo__.__triangulos__)
-        self.__render__ = RenderizadorTablero(self.__pantalla__, self.__fuente__, self.__tema__)
+        self.__textos__ = CacheTextos()
+        self.__render__ = RenderizadorTablero(
+            self.__pantalla__, self.__fuente__, self.__tema__, self.__textos__
+        )
         self.__estado__ = estado  # se inyecta desde la capa de juego
         self.__indice_hover__: Optional[int] = None
         # NUEVO: rect del botón "Tirar"
@@ -88,6 +125,14 @@ class ControladorUI:
         self.__seleccion_origen__: Optional[int] = None
         # NUEVO: ganador actual (None si no hay)
         self.__ganador__: Optional[str] = None
+        # Dados desde buffer pregenerado (reproducible con BACKGAMMON_DICE_SEED)
+        semilla = os.environ.get("BACKGAMMON_DICE_SEED")
+        self.__dados_rng__ = rng if rng is not None else FlujoDados(
+            int(semilla) if semilla else None, tam_buffer=256
+        )
+        # Rectángulos sucios: sólo se redibuja lo que cambió desde el último frame
+        self.__regiones__ = RegistroRegiones()
+        self.__costo_frames__ = CostoFrames()
 
     def __calc_rect_boton_tirar__(self) -> pygame.Rect:
         """
@@ -150,10 +195,98 @@ class ControladorUI:
             offset_superior=self.__overlay_offset__,
         )
         self.__deteccion__.actualizar_triangulos(self.__geo__.__triangulos__)
+        # La geometría nueva invalida la capa estática del renderizador
+        self.__render__.cambiar_pantalla(self.__pantalla__)
         # NUEVO: actualizar rects de botones al redimensionar
         self.__btn_tirar__ = self.__calc_rect_boton_tirar__()
         self.__btn_pasar__ = self.__calc_rect_boton_pasar__()
         self.__btn_sacar__ = self.__calc_rect_boton_sacar__()
+        self.__regiones__.invalidar_todo()
+
+    def __rect_overlay__(self) -> pygame.Rect:
+        """
+        Rect del panel superior de turno, dados y borneadas.
+        """
+        ancho, _ = self.__pantalla__.get_size()
+        margin = self.__overlay_margin_top__
+        return pygame.Rect(margin, margin, ancho - 2 * margin, self.__overlay_height__)
+
+    def __rect_columna__(self, indice: int) -> pygame.Rect:
+        """
+        Rect de la mitad de tablero que ocupa la punta 'indice' (triángulo y fichas),
+        agrandado por el contorno más grueso de hover/selección, que se sale del triángulo.
+        """
+        tablero = self.__geo__.__rect_tablero__
+        (x1, y1), (x2, _), (_, y3) = self.__geo__.__triangulos__[indice]
+        izquierda = int(x1)
+        ancho = int(x2) + 1 - izquierda
+        if y1 < y3:
+            rect = pygame.Rect(izquierda, tablero.top, ancho, tablero.centery - tablero.top)
+        else:
+            rect = pygame.Rect(izquierda, tablero.centery, ancho, tablero.bottom - tablero.centery)
+        borde = max(ANCHO_HOVER, ANCHO_SELECCION)
+        return rect.inflate(2 * borde, 2 * borde)
+
+    def __regiones_actuales__(self, puede_tirar: bool) -> Dict[Hashable, tuple]:
+        """
+        (rect, firma) de cada región de la pantalla: la firma incluye todo lo que se
+        dibuja en ella, así una región sólo se redibuja si su firma cambia.
+        """
+        e = self.__estado__
+        blancas = getattr(e, "__blancas__", [0] * 25)
+        negras = getattr(e, "__negras__", [0] * 25)
+        # El radio de las fichas depende de la pila más alta: si cambia, cambian todas
+        radio = self.__render__.radio_fichas(self.__geo__, max(max(blancas[1:]), max(negras[1:])))
+        regiones: Dict[Hashable, tuple] = {}
+        for i, etiqueta in enumerate(self.__geo__.__etiquetas__):
+            firma = (
+                blancas[etiqueta],
+                negras[etiqueta],
+                radio,
+                i == self.__indice_hover__,
+                etiqueta == self.__seleccion_origen__,
+            )
+            regiones[("punta", i)] = (self.__rect_columna__(i), firma)
+        dados = (
+            getattr(e, "__turno__", None),
+            tuple(self.__dados_visibles__()),
+            getattr(e, "__fuera_blancas__", 0),
+            getattr(e, "__fuera_negras__", 0),
+        )
+        regiones["dados"] = (self.__rect_overlay__(), dados)
+        regiones["tirar"] = (self.__btn_tirar__, puede_tirar)
+        regiones["pasar"] = (self.__btn_pasar__, self.__puede_pasar_turno__())
+        regiones["sacar"] = (self.__btn_sacar__, self.__puede_sacar__())
+        # El cartel de ganador cubre toda la pantalla
+        regiones["ganador"] = (self.__pantalla__.get_rect(), self.__ganador__)
+        return regiones
+
+    def __dibujar_frame__(self, puede_tirar: bool) -> None:
+        """
+        Dibuja el frame completo (respetando el clip actual de la pantalla).
+        """
+        self.__render__.dibujar(
+            self.__geo__,
+            self.__estado__,
+            self.__indice_hover__,
+            self.__btn_tirar__,
+            self.__seleccion_origen__,
+            puede_tirar,
+            self.__ganador__,  # NUEVO: ganador para overlay
+        )
+        # NUEVO: dibujar botón 'Sacar' por encima de todo
+        try:
+            self.__dibujar_boton_pasar_overlay__()
+            self.__dibujar_boton_sacar_overlay__()
+            # Ya dibuja dados también por encima
+            self.__dibujar_dados_overlay__()
+        except Exception:
+            pass
+
+    @property
+    def costo_frames(self) -> CostoFrames:
+        """Contador de costo de dibujo por frame."""
+        return self.__costo_frames__
 
     def __tirar_dados__(self) -> None:
         """
@@ -172,7 +305,7 @@ class ControladorUI:
             except Exception:
                 pass
         if self.__estado__ is not None and hasattr(self.__estado__, "set_dados"):
-            d1, d2 = random.randint(1, 6), random.randint(1, 6)
+            d1, d2 = tirar_par(self.__dados_rng__)
             try:
                 self.__estado__.set_dados(d1, d2)
                 print(f"Dados: {d1},{d2}  Restantes: {getattr(self.__estado__, '__movimientos_pendientes__', [])}")
@@ -250,15 +383,12 @@ class ControladorUI:
             return
 
         surface = self.__pantalla__
-        ancho, _ = surface.get_size()
         vals = self.__dados_visibles__()
         turno_raw = getattr(self.__estado__, "__turno__", "BLANCAS")
         turno_txt = str(turno_raw).upper()
         es_blancas = turno_txt.startswith("BLA")
 
-        margin = self.__overlay_margin_top__
-        overlay_height = self.__overlay_height__
-        overlay_rect = pygame.Rect(margin, margin, ancho - 2 * margin, overlay_height)
+        overlay_rect = self.__rect_overlay__()
         bg_color = (246, 246, 232) if es_blancas else (60, 70, 110)
         border_color = (172, 162, 128) if es_blancas else (32, 36, 70)
         text_color = (40, 40, 40) if es_blancas else (235, 235, 245)
@@ -266,7 +396,7 @@ class ControladorUI:
         pygame.draw.rect(surface, border_color, overlay_rect, width=2, border_radius=14)
 
         # Texto de turno
-        turno_label = self.__fuente__.render(f"Turno: {turno_txt.capitalize()}", True, text_color)
+        turno_label = self.__textos__.render(self.__fuente__, f"Turno: {turno_txt.capitalize()}", text_color)
         surface.blit(turno_label, (overlay_rect.left + 16, overlay_rect.top + 10))
 
         # Dados en el centro
@@ -280,10 +410,10 @@ class ControladorUI:
                 rect = pygame.Rect(dados_x + i * (dados_size + gap), dados_y, dados_size, dados_size)
                 pygame.draw.rect(surface, (250, 250, 212), rect, border_radius=6)
                 pygame.draw.rect(surface, (30, 30, 30), rect, width=2, border_radius=6)
-                numero = self.__fuente__.render(str(v), True, (30, 30, 30))
+                numero = self.__textos__.render(self.__fuente__, str(v), (30, 30, 30))
                 surface.blit(numero, numero.get_rect(center=rect.center))
         else:
-            aviso = self.__fuente__.render("Tirá los dados para comenzar.", True, text_color)
+            aviso = self.__textos__.render(self.__fuente__, "Tirá los dados para comenzar.", text_color)
             surface.blit(aviso, aviso.get_rect(midtop=(overlay_rect.centerx, dados_y + 4)))
 
         # Paneles de fichas borneadas
@@ -314,8 +444,8 @@ class ControladorUI:
         pygame.draw.rect(self.__pantalla__, base_color, rect, border_radius=10)
         pygame.draw.rect(self.__pantalla__, borde, rect, width=2, border_radius=10)
 
-        titulo = self.__fuente__.render(f"Fuera {etiqueta}", True, texto_color)
-        conteo = self.__fuente__.render(f"{cantidad}/{total}", True, texto_color)
+        titulo = self.__textos__.render(self.__fuente__, f"Fuera {etiqueta}", texto_color)
+        conteo = self.__textos__.render(self.__fuente__, f"{cantidad}/{total}", texto_color)
         self.__pantalla__.blit(titulo, (rect.left + 10, rect.top + 6))
         self.__pantalla__.blit(conteo, (rect.right - conteo.get_width() - 10, rect.top + 6))
 
@@ -338,7 +468,7 @@ class ControladorUI:
         txt = (15, 15, 15)
         pygame.draw.rect(surface, bg, rect, border_radius=8)
         pygame.draw.rect(surface, border, rect, width=2, border_radius=8)
-        label = self.__fuente__.render("Pasar (P)", True, txt)
+        label = self.__textos__.render(self.__fuente__, "Pasar (P)", txt)
         surface.blit(label, label.get_rect(center=rect.center))
 
     # NUEVO: dibuja el botón 'Sacar (S)' como overlay encima de todo
@@ -352,7 +482,7 @@ class ControladorUI:
         txt = (10, 10, 10)
         pygame.draw.rect(surface, bg, rect, border_radius=8)
         pygame.draw.rect(surface, border, rect, width=2, border_radius=8)
-        label = self.__fuente__.render("Sacar (S)", True, txt)
+        label = self.__textos__.render(self.__fuente__, "Sacar (S)", txt)
         surface.blit(label, label.get_rect(center=rect.center))
 
     def __procesar_evento__(self, evento: pygame.event.Event) -> bool:
@@ -369,6 +499,11 @@ class ControladorUI:
             return False
         if evento.type == pygame.KEYDOWN and evento.key == pygame.K_ESCAPE:
             return False
+        if evento.type in (_FOCO_PERDIDO, _FOCO_GANADO):
+            self.__enfocada__ = evento.type == _FOCO_GANADO
+        elif evento.type in (_MINIMIZADA, _RESTAURADA):
+            self.__minimizada__ = evento.type == _MINIMIZADA
+            self.__regiones__.invalidar_todo()
         # Si hay ganador, ignorar clicks/teclas (salvo ESC/QUIT)
         if self.__ganador__ is not None:
             return True
@@ -383,6 +518,9 @@ class ControladorUI:
             self.__tirar_dados__()
         if evento.type == pygame.VIDEORESIZE:
             self.__redimensionar__(evento.w, evento.h)
+        elif evento.type in _EVENTOS_EXPUESTA:
+            # La ventana se descubrió: el contenido anterior no está garantizado
+            self.__regiones__.invalidar_todo()
         elif evento.type == pygame.MOUSEMOTION:
             self.__indice_hover__ = self.__deteccion__.buscar_indice_punta(evento.pos)
         elif evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
@@ -556,9 +694,36 @@ class ControladorUI:
         except Exception as ex:
             print(f"No se pudo pasar el turno: {ex}")
 
+    def despertar(self) -> None:
+        """
+        Despierta el loop si está esperando eventos (para cambios de estado hechos
+        fuera de la UI, p. ej. desde otro hilo).
+        """
+        pygame.event.post(pygame.event.Event(EVENTO_DESPERTAR))
+
+    def __esperar_eventos__(self, ocioso: bool) -> list:
+        """
+        Eventos pendientes. En reposo (nada que dibujar ni animaciones) se bloquea
+        en pygame.event.wait hasta el próximo evento o hasta el tope de espera, que
+        también acota cuánto tarda en verse un cambio de estado sin despertar().
+        """
+        eventos = pygame.event.get()
+        if eventos or not ocioso:
+            return eventos
+        espera = self.__espera_ms__
+        if self.__minimizada__ or not self.__enfocada__:
+            espera = max(espera, 1000 // self.__fps_fondo__)
+        evento = pygame.event.wait(espera)
+        if evento.type == pygame.NOEVENT:
+            return []
+        return [evento] + pygame.event.get()
+
     def ejecutar(self) -> None:
         """
-        Loop principal: procesa eventos y dibuja.
+        Loop principal: procesa eventos y redibuja sólo las regiones que cambiaron
+        (con clip), enviándolas con pygame.display.update(rects). Si un frame no
+        tuvo nada que dibujar, el siguiente espera bloqueado a un evento en lugar de
+        girar a FPS fijos; sin foco o minimizada se limita a __fps_fondo__.
 
         Parámetros:
             Ninguno.
@@ -567,36 +732,40 @@ class ControladorUI:
             None
         """
         corriendo = True
+        ocioso = False
         while corriendo:
-            for evento in pygame.event.get():
+            for evento in self.__esperar_eventos__(ocioso):
                 if not self.__procesar_evento__(evento):
                     corriendo = False
                     break
 
+            if self.__minimizada__:
+                # Nada visible: no se dibuja; al restaurar se redibuja todo
+                ocioso = True
+                continue
+
             # NUEVO: pasar selección y estado de "puede tirar"; si hay ganador, no puede tirar
             puede_tirar = True
             try:
                 puede_tirar = (self.__ganador__ is None) and (not self.__hay_movimientos__())
             except Exception:
                 puede_tirar = (self.__ganador__ is None)
-            self.__render__.dibujar(
-                self.__geo__,
-                self.__estado__,
-                self.__indice_hover__,
-                self.__btn_tirar__,
-                self.__seleccion_origen__,
-                puede_tirar,
-                self.__ganador__,  # NUEVO: ganador para overlay
+            t0 = time.perf_counter()
+            rects = self.__regiones__.sucias(
+                self.__regiones_actuales__(puede_tirar), self.__pantalla__.get_rect()
             )
-            # NUEVO: dibujar botón 'Sacar' por encima de todo
-            try:
-                self.__dibujar_boton_pasar_overlay__()
-                self.__dibujar_boton_sacar_overlay__()
-                # Ya dibuja dados también por encima
-                self.__dibujar_dados_overlay__()
-            except Exception:
-                pass
-            pygame.display.flip()
-            self.__reloj__.tick(self.__fps__)
-
+            if rects:
+                # Un solo dibujo recortado a la unión; sólo se envían las regiones sucias
+                self.__pantalla__.set_clip(pygame.Rect(rects[0]).unionall(rects[1:]))
+                self.__dibujar_frame__(puede_tirar)
+                self.__pantalla__.set_clip(None)
+                pygame.display.update(rects)
+            self.__costo_frames__.registrar(rects, time.perf_counter() - t0)
+            # No hay animaciones: un frame sin cambios deja el loop en reposo
+            ocioso = not rects
+            if not ocioso:
+                self.__reloj__.tick(self.__fps__ if self.__enfocada__ else self.__fps_fondo__)
+
+        if os.environ.get("BACKGAMMON_UI_STATS") == "1":
+            print(f"Costo de frames: {self.__costo_frames__.estadisticas()}")
         pygame.quit()
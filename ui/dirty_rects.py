@@ -0,0 +1,104 @@
+"""
+Regiones sucias y costo por frame para el loop de ControladorUI.
+
+Cada frame el controlador describe la pantalla como regiones con nombre (una por
+punta, el panel de dados, cada botón) con su rectángulo y una "firma": una tupla con
+todo lo que se ve en esa región (fichas, hover, selección, habilitado...). Sólo se
+redibujan y se envían con pygame.display.update(rects) las regiones cuya firma o
+rectángulo cambió; un frame sin cambios no dibuja nada.
+No importa pygame: los rectángulos sólo necesitan indexarse como (x, y, ancho, alto).
+"""
+
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
+
+Region = Tuple[Any, Hashable]  # (rect, firma)
+
+
+class RegistroRegiones:
+    """
+    Recuerda la firma de cada región del último frame dibujado.
+
+    Atributos (todos dunder):
+      __firmas__ (Dict[Hashable, Region]): región -> (rect, firma) del último frame.
+      __completo__ (bool): el próximo frame redibuja la pantalla entera.
+    """
+
+    def __init__(self) -> None:
+        self.__firmas__: Dict[Hashable, Region] = {}
+        self.__completo__ = True
+
+    def invalidar_todo(self) -> None:
+        """Fuerza a redibujar la pantalla completa (primer frame, resize, ganador)."""
+        self.__completo__ = True
+
+    def sucias(self, regiones: Dict[Hashable, Region], pantalla: Any) -> List[Any]:
+        """
+        Rectángulos a redibujar respecto del frame anterior.
+        Parámetros:
+          regiones (Dict[Hashable, Region]): (rect, firma) por nombre de región.
+          pantalla: rect de la pantalla completa (se devuelve solo si hay que redibujar todo).
+        Retorna: List[rect]
+        """
+        anteriores, self.__firmas__ = self.__firmas__, dict(regiones)
+        if self.__completo__:
+            self.__completo__ = False
+            return [pantalla]
+        rects: List[Any] = []
+        for nombre, (rect, firma) in regiones.items():
+            previa = anteriores.pop(nombre, None)
+            if previa is None or previa[1] != firma or tuple(previa[0]) != tuple(rect):
+                rects.append(rect)
+                if previa is not None and tuple(previa[0]) != tuple(rect):
+                    rects.append(previa[0])
+        # Regiones que dejaron de existir: limpiar lo que quedó dibujado
+        rects.extend(rect for rect, _ in anteriores.values())
+        return rects
+
+
+class CostoFrames:
+    """
+    Contador del costo de dibujo por frame.
+
+    Atributos (todos dunder):
+      __frames__ (int): frames del loop.  __redibujados__ (int): frames con algo para dibujar.
+      __rects__ (int): rectángulos enviados.  __pixeles__ (int): área total enviada.
+      __segundos__ (float): tiempo total dibujando y enviando a pantalla.
+    """
+
+    def __init__(self) -> None:
+        self.__frames__ = 0
+        self.__redibujados__ = 0
+        self.__rects__ = 0
+        self.__pixeles__ = 0
+        self.__segundos__ = 0.0
+
+    def registrar(self, rects: Sequence[Any], segundos: float = 0.0) -> None:
+        """
+        Suma un frame con los rectángulos enviados y el tiempo que llevó dibujarlos.
+        Parámetros: rects (Sequence[rect]), segundos (float)
+        Retorna: None
+        """
+        self.__frames__ += 1
+        if rects:
+            self.__redibujados__ += 1
+            self.__rects__ += len(rects)
+            self.__pixeles__ += sum(r[2] * r[3] for r in rects)
+        self.__segundos__ += segundos
+
+    def estadisticas(self) -> Dict[str, float]:
+        """
+        Totales y promedios (ms por frame, píxeles por frame, fracción de frames ociosos).
+        Retorna: Dict[str, float]
+        """
+        frames = max(self.__frames__, 1)
+        return {
+            "frames": self.__frames__,
+            "redibujados": self.__redibujados__,
+            "ociosos": (self.__frames__ - self.__redibujados__) / frames,
+            "rects": self.__rects__,
+            "pixeles_por_frame": self.__pixeles__ / frames,
+            "ms_por_frame": 1000.0 * self.__segundos__ / frames,
+        }
+
+
+__all__ = ["CostoFrames", "RegistroRegiones"]
@@ -2,22 +2,48 @@
 Renderizador del tablero con Pygame.
 """
 
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 import pygame
 from ui.theme import TemaTablero
+from ui.text_cache import CacheTextos
+
+# Grosor de los contornos de hover y de la punta seleccionada (se salen de la punta)
+ANCHO_HOVER = 3
+ANCHO_SELECCION = 4
 
 
 class RenderizadorTablero:
     """
     Dibuja tablero, puntas, fichas y resaltados.
 
+    La capa estática (fondo, marco, madera, barra, puntas, línea central y números)
+    se dibuja una vez en una Surface con el formato de la pantalla y cada frame
+    empieza con un solo blit. Se reconstruye si cambia la geometría (nuevo objeto de
+    MotorDisposicion.construir), el tema o el tamaño de la pantalla.
+    Las fichas salen de un atlas con un sprite por color y resalte para el radio
+    actual (se rehace si el radio cambia) y se dibujan en lote con Surface.blits.
+
     Atributos:
         self.__pantalla__ (pygame.Surface): Superficie destino.
         self.__fuente__ (pygame.font.Font): Fuente para etiquetas.
         self.__tema__ (TemaTablero): Paleta de colores.
+        self.__textos__ (CacheTextos): Caché de textos rasterizados.
+        self.__capa_fondo__ (Optional[pygame.Surface]): Capa estática cacheada.
+        self.__geo_fondo__ (Any): Geometría con la que se dibujó la capa.
+        self.__clave_fondo__ (Optional[tuple]): (tema, tamaño de pantalla) de la capa.
+        self.__atlas_fichas__ (Optional[pygame.Surface]): Sprites de fichas.
+        self.__sprites_fichas__ (Dict[Tuple[bool, bool], pygame.Rect]): Área en el atlas
+            por (ficha clara, resaltada).
+        self.__clave_atlas__ (Optional[tuple]): (radio, tema) del atlas.
     """
 
-    def __init__(self, pantalla: pygame.Surface, fuente: pygame.font.Font, tema: TemaTablero) -> None:
+    def __init__(
+        self,
+        pantalla: pygame.Surface,
+        fuente: pygame.font.Font,
+        tema: TemaTablero,
+        textos: Optional[CacheTextos] = None,
+    ) -> None:
         """
         Inicializa el renderizador.
 
@@ -25,6 +51,7 @@ class RenderizadorTablero:
             pantalla (pygame.Surface): Superficie de dibujo.
             fuente (pygame.font.Font): Fuente para textos.
             tema (TemaTablero): Tema de colores.
+            textos (CacheTextos|None): Caché de textos (compartida con el controlador).
 
         Retorna:
             None
@@ -32,6 +59,154 @@ class RenderizadorTablero:
         self.__pantalla__ = pantalla
         self.__fuente__ = fuente
         self.__tema__ = tema
+        self.__textos__ = textos if textos is not None else CacheTextos()
+        self.__capa_fondo__: Optional[pygame.Surface] = None
+        self.__geo_fondo__: Any = None
+        self.__clave_fondo__: Optional[tuple] = None
+        self.__atlas_fichas__: Optional[pygame.Surface] = None
+        self.__sprites_fichas__: Dict[Tuple[bool, bool], pygame.Rect] = {}
+        self.__clave_atlas__: Optional[tuple] = None
+
+    def cambiar_pantalla(self, pantalla: pygame.Surface) -> None:
+        """
+        Cambia la superficie destino (p. ej. tras set_mode al redimensionar).
+
+        Parámetros:
+            pantalla (pygame.Surface): Nueva superficie de dibujo.
+
+        Retorna:
+            None
+        """
+        self.__pantalla__ = pantalla
+        self.invalidar_fondo()
+
+    def cambiar_tema(self, tema: TemaTablero) -> None:
+        """
+        Cambia la paleta; la capa estática se reconstruye en el próximo frame.
+
+        Parámetros:
+            tema (TemaTablero): Tema de colores.
+
+        Retorna:
+            None
+        """
+        self.__tema__ = tema
+        self.invalidar_fondo()
+        self.__atlas_fichas__ = None
+        self.__clave_atlas__ = None
+
+    def invalidar_fondo(self) -> None:
+        """
+        Descarta la capa estática cacheada.
+
+        Retorna:
+            None
+        """
+        self.__capa_fondo__ = None
+        self.__geo_fondo__ = None
+        self.__clave_fondo__ = None
+
+    def __capa_estatica__(self, geo) -> pygame.Surface:
+        """
+        Devuelve la capa estática para 'geo', dibujándola sólo si cambió algo.
+
+        Parámetros:
+            geo: Geometría del tablero (ver dibujar).
+
+        Retorna:
+            pygame.Surface
+        """
+        clave = (self.__tema__, self.__pantalla__.get_size())
+        if self.__capa_fondo__ is not None and geo is self.__geo_fondo__ and clave == self.__clave_fondo__:
+            return self.__capa_fondo__
+
+        t = self.__tema__
+        fondo = pygame.Surface(self.__pantalla__.get_size()).convert(self.__pantalla__)
+        # Fondo y marco
+        fondo.fill(t.__fondo__)
+        pygame.draw.rect(fondo, t.__marco__, geo.__rect_tablero__.inflate(16, 16), border_radius=10)
+        pygame.draw.rect(fondo, t.__madera__, geo.__rect_tablero__, border_radius=6)
+        pygame.draw.rect(fondo, t.__barra__, geo.__rect_barra__)
+
+        # Puntas
+        for i, tri in enumerate(geo.__triangulos__):
+            pygame.draw.polygon(fondo, geo.__colores_puntas__[i], tri)
+
+        # Línea separadora central
+        pygame.draw.line(
+            fondo,
+            t.__madera_oscura__,
+            (geo.__rect_tablero__.left, geo.__rect_tablero__.centery),
+            (geo.__rect_tablero__.right, geo.__rect_tablero__.centery),
+            2,
+        )
+
+        # Etiquetas numéricas de puntos
+        for i, tri in enumerate(geo.__triangulos__):
+            texto = self.__textos__.render(self.__fuente__, str(geo.__etiquetas__[i]), t.__texto__)
+            (x1, y1), (x2, y2), (x3, y3) = tri
+            base_y = (y1 + y2) / 2.0
+            es_superior = y1 < y3
+            pos = (
+                x1 + (x2 - x1) / 2.0 - texto.get_width() / 2.0,
+                base_y + 6 if es_superior else base_y - texto.get_height() - 6,
+            )
+            fondo.blit(texto, pos)
+
+        self.__capa_fondo__, self.__geo_fondo__, self.__clave_fondo__ = fondo, geo, clave
+        return fondo
+
+    def __atlas__(self, radio: int) -> pygame.Surface:
+        """
+        Atlas de fichas (clara/oscura, normal/resaltada) para 'radio', dibujado sólo
+        si cambió el radio o el tema.
+
+        Parámetros:
+            radio (int): Radio de las fichas en píxeles.
+
+        Retorna:
+            pygame.Surface
+        """
+        clave = (radio, self.__tema__)
+        if self.__atlas_fichas__ is not None and clave == self.__clave_atlas__:
+            return self.__atlas_fichas__
+
+        t = self.__tema__
+        lado = 2 * radio + 1
+        atlas = pygame.Surface((4 * lado, lado), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        atlas.fill((0, 0, 0, 0))
+        sprites: Dict[Tuple[bool, bool], pygame.Rect] = {}
+        variantes = ((True, False), (True, True), (False, False), (False, True))
+        for k, (clara, resaltada) in enumerate(variantes):
+            area = pygame.Rect(k * lado, 0, lado, lado)
+            centro = area.center
+            color = t.__ficha_clara__ if clara else t.__ficha_oscura__
+            pygame.draw.circle(atlas, color, centro, radio)
+            if resaltada:
+                pygame.draw.circle(atlas, (0, 180, 255), centro, radio, width=3)
+            else:
+                pygame.draw.circle(atlas, t.__borde_ficha__, centro, radio, width=2)
+            sprites[(clara, resaltada)] = area
+        self.__atlas_fichas__, self.__sprites_fichas__, self.__clave_atlas__ = atlas, sprites, clave
+        return atlas
+
+    def radio_fichas(self, geo, pila_max: int) -> float:
+        """
+        Radio de las fichas para que la pila más alta entre en la punta.
+
+        Parámetros:
+            geo: Geometría (usa __altura_triangulo__ y __ancho_punta__).
+            pila_max (int): Fichas en la punta más cargada.
+
+        Retorna:
+            float
+        """
+        margen_etiqueta = self.__fuente__.get_height() + 6
+        alto_util = max(10.0, geo.__altura_triangulo__ - margen_etiqueta - 6)
+        radio = min(geo.__ancho_punta__ * 0.45, alto_util / max(1, pila_max) * 0.45)
+        return max(8.0, radio)
 
     def dibujar(
         self,
@@ -58,50 +233,43 @@ class RenderizadorTablero:
             None
         """
         t = self.__tema__
-        # Fondo y marco
-        self.__pantalla__.fill(t.__fondo__)
-        pygame.draw.rect(self.__pantalla__, t.__marco__, geo.__rect_tablero__.inflate(16, 16), border_radius=10)
-        pygame.draw.rect(self.__pantalla__, t.__madera__, geo.__rect_tablero__, border_radius=6)
-        pygame.draw.rect(self.__pantalla__, t.__barra__, geo.__rect_barra__)
-
-        # Puntas
-        for i, tri in enumerate(geo.__triangulos__):
-            pygame.draw.polygon(self.__pantalla__, geo.__colores_puntas__[i], tri)
+        # Capa estática: fondo, marco, puntas, línea central y números
+        self.__pantalla__.blit(self.__capa_estatica__(geo), (0, 0))
 
         # Resalte de hover
         if indice_hover is not None and 0 <= indice_hover < len(geo.__triangulos__):
-            pygame.draw.polygon(self.__pantalla__, t.__resalte__, geo.__triangulos__[indice_hover], width=3)
+            pygame.draw.polygon(
+                self.__pantalla__, t.__resalte__, geo.__triangulos__[indice_hover], width=ANCHO_HOVER
+            )
 
         # NUEVO: resaltar punta seleccionada (por etiqueta 1..24)
         if seleccionado is not None:
             try:
                 idx_sel = next(i for i, lab in enumerate(geo.__etiquetas__) if lab == seleccionado)
-                pygame.draw.polygon(self.__pantalla__, (0, 180, 255), geo.__triangulos__[idx_sel], width=4)
+                pygame.draw.polygon(
+                    self.__pantalla__,
+                    (0, 180, 255),
+                    geo.__triangulos__[idx_sel],
+                    width=ANCHO_SELECCION,
+                )
             except StopIteration:
                 pass
 
-        # Línea separadora central
-        pygame.draw.line(
-            self.__pantalla__,
-            t.__madera_oscura__,
-            (geo.__rect_tablero__.left, geo.__rect_tablero__.centery),
-            (geo.__rect_tablero__.right, geo.__rect_tablero__.centery),
-            2,
-        )
-
         # Cálculo de apilado de fichas
         max_blancas = max(estado.__blancas__[1:]) if any(estado.__blancas__[1:]) else 0
         max_negras = max(estado.__negras__[1:]) if any(estado.__negras__[1:]) else 0
         pila_max = max(max_blancas, max_negras)
 
         margen_etiqueta = self.__fuente__.get_height() + 6
-        alto_util = max(10.0, geo.__altura_triangulo__ - margen_etiqueta - 6)
-        radio = min(geo.__ancho_punta__ * 0.45, alto_util / max(1, pila_max) * 0.45)
-        radio = max(8.0, radio)
+        radio = self.radio_fichas(geo, pila_max)
         espacio = max(2.0, radio * 0.12)
         paso = 2 * radio + espacio
 
-        # Fichas (se muestra color dominante por punto)
+        # Fichas (se muestra color dominante por punto), en un solo blits() desde el atlas
+        r = int(radio)
+        atlas = self.__atlas__(r)
+        sprites = self.__sprites_fichas__
+        lote: List[Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]] = []
         for i, tri in enumerate(geo.__triangulos__):
             (x1, y1), (x2, y2), (x3, y3) = tri
             base_y = (y1 + y2) / 2.0
@@ -115,26 +283,17 @@ class RenderizadorTablero:
                 continue
 
             cantidad = b if b >= n else n
-            color = t.__ficha_clara__ if b >= n else t.__ficha_oscura__
+            clara = b >= n
             inicio_y = base_y + (margen_etiqueta + radio) if es_superior else base_y - (margen_etiqueta + radio)
             direccion = 1 if es_superior else -1
 
+            normal, resaltada = sprites[(clara, False)], sprites[(clara, True)]
             for k in range(cantidad):
                 cy = inicio_y + direccion * (k * paso)
-                pygame.draw.circle(self.__pantalla__, color, (int(centro_x), int(cy)), int(radio))
-                pygame.draw.circle(self.__pantalla__, t.__borde_ficha__, (int(centro_x), int(cy)), int(radio), width=2)
-
-        # Etiquetas numéricas de puntos
-        for i, tri in enumerate(geo.__triangulos__):
-            texto = self.__fuente__.render(str(geo.__etiquetas__[i]), True, t.__texto__)
-            (x1, y1), (x2, y2), (x3, y3) = tri
-            base_y = (y1 + y2) / 2.0
-            es_superior = y1 < y3
-            pos = (
-                x1 + (x2 - x1) / 2.0 - texto.get_width() / 2.0,
-                base_y + 6 if es_superior else base_y - texto.get_height() - 6,
-            )
-            self.__pantalla__.blit(texto, pos)
+                # La ficha de arriba de la punta seleccionada es la que se va a mover
+                area = resaltada if etiqueta == seleccionado and k == cantidad - 1 else normal
+                lote.append((atlas, (int(centro_x) - r, int(cy) - r), area))
+        self.__pantalla__.blits(lote, doreturn=False)
 
         # Botón "Tirar (R)" (se dibuja gris si puede_tirar==False)
         if btn_tirar_rect is not None:
@@ -142,7 +301,7 @@ class RenderizadorTablero:
             pygame.draw.rect(self.__pantalla__, fill, btn_tirar_rect, border_radius=8)
             pygame.draw.rect(self.__pantalla__, self.__tema__.__marco__, btn_tirar_rect, width=2, border_radius=8)
             label_color = (20, 20, 20) if puede_tirar else (60, 60, 60)
-            label = self.__fuente__.render("Tirar (R)", True, label_color)
+            label = self.__textos__.render(self.__fuente__, "Tirar (R)", label_color)
             self.__pantalla__.blit(
                 label,
                 (btn_tirar_rect.centerx - label.get_width() // 2, btn_tirar_rect.centery - label.get_height() // 2),
@@ -156,7 +315,7 @@ class RenderizadorTablero:
             self.__pantalla__.blit(overlay, (0, 0))
             # Cartel central
             msg = f"¡Ganó {ganador}!"
-            texto = self.__fuente__.render(msg, True, (255, 255, 255))
+            texto = self.__textos__.render(self.__fuente__, msg, (255, 255, 255))
             cx = geo.__rect_tablero__.centerx
             cy = geo.__rect_tablero__.centery
             # Marco
@@ -0,0 +1,80 @@
+"""
+Caché LRU de textos rasterizados (Surface de font.render) compartida por la UI.
+
+Clave: (fuente, texto, color, antialias). Los textos que se repiten en cada frame
+(números de puntas, botones, turno, dados, paneles de borneadas) se rasterizan una
+sola vez y sólo se vuelve a llamar a font.render cuando el texto cambia.
+No importa pygame: sirve con cualquier objeto que tenga render(texto, aa, color).
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+Color = Tuple[int, int, int]
+ClaveTexto = Tuple[Any, str, Color, bool]
+
+
+class CacheTextos:
+    """
+    LRU de superficies de texto.
+
+    Atributos (todos dunder):
+      __entradas__ (OrderedDict[ClaveTexto, Surface]): de menos a más reciente.
+      __max_entradas__ (int): cota de entradas.
+      __aciertos__, __fallos__ (int): contadores de consultas.
+    """
+
+    def __init__(self, max_entradas: int = 256) -> None:
+        """
+        Parámetros: max_entradas (int) cantidad máxima de textos guardados.
+        """
+        if max_entradas < 1:
+            raise ValueError("max_entradas debe ser positivo.")
+        self.__entradas__: "OrderedDict[ClaveTexto, Any]" = OrderedDict()
+        self.__max_entradas__ = max_entradas
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
+
+    def __len__(self) -> int:
+        return len(self.__entradas__)
+
+    def render(self, fuente: Any, texto: str, color: Color, antialias: bool = True) -> Any:
+        """
+        Igual que fuente.render(texto, antialias, color), pasando por la caché.
+        La Surface devuelta se comparte: no dibujar sobre ella.
+        Parámetros: fuente (pygame.font.Font), texto (str), color (Color), antialias (bool)
+        Retorna: pygame.Surface
+        """
+        clave = (fuente, texto, tuple(color), antialias)
+        superficie = self.__entradas__.get(clave)
+        if superficie is not None:
+            self.__aciertos__ += 1
+            self.__entradas__.move_to_end(clave)
+            return superficie
+        self.__fallos__ += 1
+        superficie = fuente.render(texto, antialias, color)
+        self.__entradas__[clave] = superficie
+        if len(self.__entradas__) > self.__max_entradas__:
+            self.__entradas__.popitem(last=False)
+        return superficie
+
+    def estadisticas(self) -> Dict[str, float]:
+        """
+        Aciertos, fallos, tasa de aciertos y entradas.
+        Retorna: Dict[str, float]
+        """
+        total = self.__aciertos__ + self.__fallos__
+        return {
+            "aciertos": self.__aciertos__,
+            "fallos": self.__fallos__,
+            "tasa_aciertos": self.__aciertos__ / total if total else 0.0,
+            "entradas": len(self.__entradas__),
+        }
+
+    def limpiar(self) -> None:
+        """Vacía las entradas y los contadores (p. ej. al cambiar de fuente)."""
+        self.__entradas__.clear()
+        self.__aciertos__ = self.__fallos__ = 0
+
+
+__all__ = ["CacheTextos"]